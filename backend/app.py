@@ -1,40 +1,195 @@
-from flask import Flask, request, jsonify, send_file, send_from_directory
+from flask import Flask, request, jsonify, send_file, Response, stream_with_context
 from flask_cors import CORS
-import pandas as pd
 import json
 import os
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
-import base64
+from datetime import datetime
 from services.inventory_health import InventoryHealthAnalyzer
 from services.pdf_generator import InventoryPDFGenerator
 from services.sales_pdf_generator import SalesPDFGenerator
-from services.chatbot import ChatbotService
+from services.chatbot import ChatbotService, extract_report_job_id
 from services.forecasting_service import ForecastingService
+from services.report_jobs import ReportJobQueue, ReportQueueFull, ReportStillRendering, report_dedup_key
+from services.data_version import get_data_version, invalidate_data_version
+from services.report_cache import get_report_cache
+from services.report_retention import get_retention_manager
+from services.chart_service import CHARTS, CHART_FORMATS, get_chart_service
+from services.data_export import EXPORT_FORMATS, product_rows, sales_rows, restock_rows, stream_export
+from services.fast_json import FastJSONProvider
+from services.compression import compress_response
 from config import Config
 from flask import url_for
-import re
+import threading
+import uuid
+import multiprocessing
+import functools
+import hashlib
 from werkzeug.exceptions import HTTPException
 
 app = Flask(__name__)
-CORS(app, origins=["https://smart-stock-ai-ivory.vercel.app"], supports_credentials=True, methods=["GET", "POST", "OPTIONS"], allow_headers=["Content-Type"])
+CORS(app, origins=["https://smart-stock-ai-ivory.vercel.app"], supports_credentials=True, methods=["GET", "POST", "OPTIONS"], allow_headers=["Content-Type", "X-Session-ID"])
 
 # Configure app
 app.config['MAX_CONTENT_LENGTH'] = Config.MAX_CONTENT_LENGTH
+# jsonify through orjson, with NumPy values handled instead of failing
+app.json = FastJSONProvider(app)
 
 # Initialize services
 inventory_analyzer = InventoryHealthAnalyzer()
 pdf_generator = InventoryPDFGenerator()
 sales_pdf_generator = SalesPDFGenerator()
-chatbot_service = ChatbotService()
+report_jobs = ReportJobQueue()
+report_cache = get_report_cache()
+report_retention = get_retention_manager()
+chart_service = get_chart_service()
+chatbot_service = ChatbotService(report_jobs=report_jobs)
 forecasting_service = ForecastingService()
 
+def warm_chatbot():
+    """Translate response templates, then precompute read-only replies, so first replies are not delayed"""
+    chatbot_service.templates.warm(Config.TEMPLATE_PRELOAD_LANGS)
+    chatbot_service.warm_responses(Config.RESPONSE_CACHE_PRELOAD_LANGS)
+
+background_lock = threading.Lock()
+background_started = False
+
+def start_background_tasks():
+    """
+    Warm the chatbot and the chart workers and apply report retention, once per
+    server process. Started from the first request rather than at import time,
+    because chart worker processes re-import the main module and must not start
+    threads and pools of their own.
+    """
+    global background_started
+    with background_lock:
+        if background_started or multiprocessing.current_process().name != 'MainProcess':
+            return
+        background_started = True
+    threading.Thread(target=warm_chatbot, daemon=True).start()
+    threading.Thread(target=chart_service.warm, daemon=True).start()
+    # Apply the reports directory limits to whatever accumulated while the server was down
+    if Config.REPORT_RETENTION_ENABLED:
+        threading.Thread(target=report_retention.enforce, daemon=True).start()
+
+@app.before_request
+def start_background_tasks_once():
+    if not background_started:
+        start_background_tasks()
+
+forecasting_lock = threading.Lock()
+forecasting_data_version = None
+
+def ensure_forecasting_data():
+    """Load the forecasting data files once per data version rather than on every request"""
+    global forecasting_data_version
+    with forecasting_lock:
+        version = get_data_version()
+        if forecasting_data_version != version:
+            if not forecasting_service.load_data():
+                raise Exception("Failed to load forecasting data files")
+            forecasting_data_version = version
+
+def load_restock_plan():
+    """Compute the restock plan from the current forecasting data files"""
+    ensure_forecasting_data()
+    restock_plan = forecasting_service.generate_restock_plan()
+    if not isinstance(restock_plan, dict) or 'error' in restock_plan:
+        raise Exception(restock_plan.get('error') if isinstance(restock_plan, dict) else restock_plan)
+    return restock_plan
+
+def render_restock_plan_report(seller_id, restock_plan=None):
+    """Compute the restock plan if needed and render its PDF"""
+    if restock_plan is None:
+        restock_plan = load_restock_plan()
+    return forecasting_service.generate_restock_plan_pdf(seller_id, restock_plan)
+
+# Report kinds that can be queued through /api/reports/jobs
+REPORT_RENDERERS = {
+    'inventory_health': pdf_generator.generate_inventory_health_pdf,
+    'sales_report': sales_pdf_generator.generate_sales_report_pdf,
+    'weekly_monthly_sales': sales_pdf_generator.generate_weekly_monthly_sales_pdf,
+    'restock_plan': render_restock_plan_report,
+}
+
+def submit_report_job(kind, seller_id, *args):
+    """Queue a report; identical reports (same kind and arguments) still rendering share one job"""
+    return report_jobs.submit(kind, REPORT_RENDERERS[kind], seller_id, *args,
+                              dedup_key=report_dedup_key(kind, seller_id, *args))
+
+def export_restock_rows():
+    return restock_rows(load_restock_plan())
+
+def export_period_sales_rows(period):
+    sales_pdf_generator._reload_if_changed()
+    return [period, 'product_name', 'quantity_sold'], sales_pdf_generator.iter_period_sales(period)
+
+# Datasets that can be exported through /api/exports/<dataset>
+EXPORT_DATASETS = {
+    'products': product_rows,
+    'sales': sales_rows,
+    'weekly_sales': lambda: export_period_sales_rows('week'),
+    'monthly_sales': lambda: export_period_sales_rows('month'),
+    'restock_plan': export_restock_rows,
+}
+
+def send_report(pdf_path, download_name=None):
+    """Send a rendered report straight from memory, or from disk when it was written there"""
+    filename = os.path.basename(str(pdf_path))
+    report = report_cache.open(filename)
+    if report is None:
+        return jsonify({"error": "Report not found"}), 404
+    if Config.REPORT_RETENTION_ENABLED:
+        report_retention.touch(filename)
+    return send_file(report, mimetype='application/pdf', as_attachment=True, download_name=download_name or filename)
+
+def render_report_sync(kind, seller_id, *args):
+    """Render a report on the worker pool and wait for it, for the endpoints that return the PDF directly"""
+    job_id = submit_report_job(kind, seller_id, *args)
+    job = report_jobs.wait(job_id, timeout=Config.REPORT_JOB_WAIT_TIMEOUT)
+    if job['status'] == 'failed':
+        raise Exception(job['error'])
+    if job['status'] != 'done':
+        raise ReportStillRendering(job_id)
+    return report_jobs.pdf_path(job_id)
+
+def calendar_day():
+    # Forecasts and festival recommendations follow the calendar, so a new day changes them even when the data does not
+    return datetime.now().strftime('%Y-%m-%d')
+
+def conditional_get(*extra):
+    """
+    Tag successful responses of a GET endpoint with an ETag derived from the data
+    version, the path and the query string (plus the values of any extra
+    callables), and answer a matching If-None-Match with 304 before the view runs.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            parts = [request.path, sorted(request.args.items(multi=True)), get_data_version()]
+            parts.extend(part() for part in extra)
+            # Weak, so the tag still matches when the body is sent compressed
+            etag = hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()[:20]
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+            else:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+            response.set_etag(etag, weak=True)
+            # Clients may keep the payload but must revalidate before reusing it
+            response.headers['Cache-Control'] = 'no-cache'
+            return response
+        return wrapper
+    return decorator
+
 @app.route("/", methods=["GET"])
 def index():
     return jsonify({"message": "Welcome to SmartStockAI backend! See /api/health for status."})
 
+@app.after_request
+def compress_large_responses(response):
+    """gzip (or brotli, when installed) JSON and text responses over the size threshold"""
+    return compress_response(response, request.accept_encodings)
+
 @app.errorhandler(Exception)
 def handle_exception(e):
     import traceback
@@ -64,6 +219,7 @@ def upload_inventory_data():
         # Save uploaded file
         file_path = Config.UPLOADED_CSV_PATH
         file.save(file_path)
+        invalidate_data_version()
         
         return jsonify({
             "message": "File uploaded successfully", 
@@ -75,6 +231,7 @@ def upload_inventory_data():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/inventory/health-analysis', methods=['GET'])
+@conditional_get(calendar_day)
 def get_inventory_health():
     try:
         analysis = inventory_analyzer.analyze_inventory()
@@ -89,11 +246,15 @@ def generate_inventory_pdf():
         data = request.get_json()
         seller_id = data.get('seller_id', 'default_seller')
         
-        # Generate PDF
-        pdf_path = pdf_generator.generate_inventory_health_pdf(seller_id)
+        # Render on the report worker pool so bursts cannot tie up every request thread
+        pdf_path = render_report_sync('inventory_health', seller_id)
         
-        return send_file(pdf_path, as_attachment=True, download_name=f"inventory_health_report_{seller_id}.pdf")
+        return send_report(pdf_path, f"inventory_health_report_{seller_id}.pdf")
     
+    except ReportStillRendering as e:
+        return report_pending_response(e.job_id)
+    except ReportQueueFull as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -104,13 +265,24 @@ def generate_sales_report():
         seller_id = data.get('seller_id', 'default_seller')
         
         # Generate Sales Report PDF
-        pdf_path = sales_pdf_generator.generate_sales_report_pdf(seller_id)
+        pdf_path = render_report_sync('sales_report', seller_id)
         
-        return send_file(pdf_path, as_attachment=True, download_name=f"sales_report_{seller_id}.pdf")
+        return send_report(pdf_path, f"sales_report_{seller_id}.pdf")
     
+    except ReportStillRendering as e:
+        return report_pending_response(e.job_id)
+    except ReportQueueFull as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+def get_chatbot_session_id(data):
+    """
+    Conversation key from the request body or the X-Session-ID header. Clients
+    that send neither get a new one, returned in the response for later messages.
+    """
+    return data.get('session_id') or request.headers.get('X-Session-ID') or uuid.uuid4().hex
+
 @app.route('/api/chatbot/query', methods=['POST', 'OPTIONS'])
 def chatbot_query():
     if request.method == 'OPTIONS':
@@ -118,20 +290,177 @@ def chatbot_query():
     data = request.get_json()
     user_message = data.get('message', '')
     lang = data.get('lang', 'en')
-    print(f"DEBUG: Received chatbot query: message='{user_message}', lang='{lang}'")
-    response = chatbot_service.process_message(user_message, lang=lang)
-    # Extract PDF filename if present
-    pdf_url = None
-    if response:
-        import re
-        match = re.search(r'Download: `([^`]+)`', response)
-        if match:
-            pdf_url = f"/backend/reports/{match.group(1)}"
-    print(f"DEBUG: chatbot_query response: {response}")
-    print(f"DEBUG: chatbot_query pdf_url: {pdf_url}")
-    return jsonify({'response': response, 'pdf_url': pdf_url})
+    session_id = get_chatbot_session_id(data)
+    response = chatbot_service.process_message(user_message, lang=lang, session_id=session_id)
+    # Reports are rendered in the background; hand the client the job to poll
+    job_id = extract_report_job_id(response)
+    return jsonify({
+        'response': response,
+        'pdf_url': None,
+        'session_id': session_id,
+        'job_id': job_id,
+        'job_status_url': f"/api/chatbot/jobs/{job_id}" if job_id else None
+    })
+
+@app.route('/api/chatbot/batch', methods=['POST', 'OPTIONS'])
+def chatbot_batch():
+    """Answer a burst of messages from one shared analysis snapshot, translated per language in one pass"""
+    if request.method == 'OPTIONS':
+        return '', 204
+    try:
+        data = request.get_json(silent=True) or {}
+        messages = data.get('messages')
+        if not isinstance(messages, list) or not messages:
+            return jsonify({"error": "Provide a non-empty 'messages' list"}), 400
+        if len(messages) > Config.CHATBOT_BATCH_MAX_MESSAGES:
+            return jsonify({"error": f"At most {Config.CHATBOT_BATCH_MAX_MESSAGES} messages per batch"}), 400
+        # Plain strings use the batch-level language and session
+        session_id = get_chatbot_session_id(data)
+        items = []
+        for item in messages:
+            if isinstance(item, str):
+                item = {'message': item}
+            if not isinstance(item, dict):
+                return jsonify({"error": "Each message must be a string or an object"}), 400
+            items.append({
+                'message': item.get('message', ''),
+                'lang': item.get('lang') or data.get('lang', 'en'),
+                'session_id': item.get('session_id') or session_id
+            })
+
+        responses = chatbot_service.process_batch(items)
+        results = []
+        for item, response in zip(items, responses):
+            job_id = extract_report_job_id(response)
+            results.append({
+                'response': response,
+                'lang': item['lang'],
+                'session_id': item['session_id'],
+                'job_id': job_id,
+                'job_status_url': f"/api/chatbot/jobs/{job_id}" if job_id else None
+            })
+        return jsonify({'responses': results, 'count': len(results)})
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+def report_job_payload(job):
+    """Public view of a report job, with the download URL once it is done"""
+    payload = dict(job)
+    payload['pdf_url'] = f"/backend/reports/{job['pdf_filename']}" if job['status'] == 'done' else None
+    payload['status_url'] = f"/api/reports/jobs/{job['job_id']}"
+    payload['download_url'] = f"/api/reports/jobs/{job['job_id']}/download" if job['status'] == 'done' else None
+    return payload
+
+def report_pending_response(job_id):
+    """202 with the job to poll, for a report that outlasted REPORT_JOB_WAIT_TIMEOUT"""
+    payload = report_job_payload(report_jobs.get(job_id))
+    payload['job_status_url'] = payload['status_url']
+    return jsonify(payload), 202
+
+def sse_event(event, data):
+    """Format one Server-Sent Events message"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@app.route('/api/chatbot/stream', methods=['GET', 'POST', 'OPTIONS'])
+def chatbot_stream():
+    """
+    Stream a chatbot reply as Server-Sent Events: summary, translation, then the
+    queued report with its status URL. The stream never waits for the PDF itself,
+    so a request thread is held only while the reply is composed.
+    """
+    if request.method == 'OPTIONS':
+        return '', 204
+    # EventSource clients can only send GET, so accept query parameters too
+    data = request.get_json(silent=True) or request.args
+    user_message = data.get('message', '')
+    lang = data.get('lang', 'en')
+    session_id = get_chatbot_session_id(data)
+
+    def generate():
+        # Flush the headers and first bytes before any analysis runs
+        yield sse_event('status', {'status': 'processing', 'session_id': session_id})
+        try:
+            for event, payload in chatbot_service.stream_message(user_message, lang=lang, session_id=session_id):
+                if event == 'summary' and payload['job_id']:
+                    payload['job_status_url'] = f"/api/chatbot/jobs/{payload['job_id']}"
+                if event == 'report' and 'pdf_filename' in payload:
+                    payload = report_job_payload(payload)
+                yield sse_event(event, payload)
+        except Exception as e:
+            yield sse_event('error', {'error': str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no', 'X-Session-ID': session_id}
+    )
+
+@app.route('/api/reports', methods=['GET'])
+def list_reports():
+    """Reports on disk from the retention index, optionally for one seller"""
+    seller = request.args.get('seller')
+    reports = report_retention.list_reports(seller=seller)
+    for report in reports:
+        report['url'] = f"/backend/reports/{report['filename']}"
+    return jsonify({'reports': reports, 'stats': report_retention.stats()})
+
+@app.route('/api/reports/jobs', methods=['POST'])
+def create_report_job():
+    """Queue a PDF report and return its job ID right away"""
+    data = request.get_json(silent=True) or {}
+    kind = data.get('report_type', 'inventory_health')
+    seller_id = data.get('seller_id', 'default_seller')
+    if kind not in REPORT_RENDERERS:
+        return jsonify({"error": f"Unknown report type: {kind}", "report_types": list(REPORT_RENDERERS)}), 400
+    try:
+        job_id = submit_report_job(kind, seller_id)
+    except ReportQueueFull as e:
+        return jsonify({"error": str(e)}), 503
+    return jsonify(report_job_payload(report_jobs.get(job_id))), 202
+
+@app.route('/api/reports/jobs', methods=['GET'])
+def get_report_job_stats():
+    """Job counts by status and the worker pool limits"""
+    return jsonify(report_jobs.stats())
+
+@app.route('/api/reports/jobs/<job_id>', methods=['GET'])
+def get_report_job(job_id):
+    """Status of a queued report"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(report_job_payload(job))
+
+@app.route('/api/reports/jobs/<job_id>/download', methods=['GET'])
+def download_report_job(job_id):
+    """Download the PDF of a finished report job"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    if job['status'] != 'done':
+        return jsonify(report_job_payload(job)), 409
+    return send_report(report_jobs.pdf_path(job_id))
+
+@app.route('/api/chatbot/jobs/<job_id>', methods=['GET'])
+def get_chatbot_job(job_id):
+    """Status of a report queued by the chatbot"""
+    job = report_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(report_job_payload(job))
+
+@app.route('/api/chatbot/translation-cache', methods=['GET'])
+def get_translation_cache_stats():
+    """Hit/miss counters, backend latency and circuit state of the chatbot translator"""
+    return jsonify(chatbot_service.translator.stats())
+
+@app.route('/api/chatbot/response-cache', methods=['GET'])
+def get_response_cache_stats():
+    """Hit/miss counters and data version of the cached chatbot replies"""
+    return jsonify(chatbot_service.response_cache.stats())
 
 @app.route('/api/inventory/analytics', methods=['GET'])
+@conditional_get()
 def get_inventory_analytics():
     try:
         # Generate analytics charts
@@ -141,7 +470,51 @@ def get_inventory_analytics():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/inventory/charts', methods=['GET'])
+def list_inventory_charts():
+    """Available charts with the URL of their image resource"""
+    charts = [{
+        'name': name,
+        'url': url_for('get_inventory_chart', chart=name),
+        'default_size': {'width': size[0], 'height': size[1]},
+    } for name, (_, size) in CHARTS.items()]
+    return jsonify({
+        'charts': charts,
+        'formats': list(CHART_FORMATS),
+        'dpi': {'default': Config.CHART_DPI, 'min': Config.CHART_MIN_DPI, 'max': Config.CHART_MAX_DPI},
+        'cache': chart_service.stats()
+    })
+
+@app.route('/api/inventory/charts/<chart>', methods=['GET'])
+def get_inventory_chart(chart):
+    """
+    One chart as image bytes. Query parameters: format (png, svg or webp), width
+    and height in inches, and dpi. Responses carry an ETag derived from the
+    parameters and the data version, so revalidation costs no rendering.
+    """
+    fmt = request.args.get('format', 'png').lower()
+    try:
+        width, height, dpi = (float(request.args[name]) if request.args.get(name) else None
+                              for name in ('width', 'height', 'dpi'))
+        key = chart_service.resolve(chart, fmt, width, height, dpi)
+    except ValueError as e:
+        status = 404 if chart not in CHARTS else 400
+        return jsonify({"error": str(e)}), status
+    etag = chart_service.etag(key)
+    cache_control = f'public, max-age={Config.CHART_HTTP_MAX_AGE}'
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+    else:
+        try:
+            response = Response(chart_service.render(chart, key=key), mimetype=CHART_FORMATS[fmt])
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
+
 @app.route('/api/inventory/festival-recommendations', methods=['GET'])
+@conditional_get(calendar_day)
 def get_festival_recommendations():
     try:
         analysis = inventory_analyzer.analyze_inventory()
@@ -171,9 +544,6 @@ def get_sales_summary():
 def generate_forecast_report():
     """Generate comprehensive forecast report with restock planning"""
     try:
-        data = request.get_json() or {}
-        seller_name = data.get('seller_name', 'Default Seller')
-        
         # Generate forecast report
         forecast_data = forecasting_service.generate_forecast_report()
         
@@ -192,22 +562,29 @@ def generate_forecast_pdf():
         data = request.get_json() or {}
         seller_name = data.get('seller_name', 'Default Seller')
         # Generate forecast data
+        ensure_forecasting_data()
         restock_plan = forecasting_service.generate_restock_plan()
         if 'error' in restock_plan:
             return jsonify(restock_plan), 500
         # Generate PDF using previous FPDF/canvas-based implementation
-        pdf_path = forecasting_service.generate_restock_plan_pdf(seller_name, restock_plan)
+        pdf_path = render_report_sync('restock_plan', seller_name, restock_plan)
         if pdf_path:
-            return send_file(pdf_path, as_attachment=True, download_name=f"restock_plan_report_{seller_name.replace(' ', '_')}.pdf")
+            return send_report(pdf_path, f"restock_plan_report_{seller_name.replace(' ', '_')}.pdf")
         else:
             return jsonify({"error": "Failed to generate PDF"}), 500
+    except ReportStillRendering as e:
+        return report_pending_response(e.job_id)
+    except ReportQueueFull as e:
+        return jsonify({"error": str(e)}), 503
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/forecast/restock-plan', methods=['GET'])
+@conditional_get(calendar_day)
 def get_restock_plan():
     """Get restock plan based on forecasting analysis"""
     try:
+        ensure_forecasting_data()
         restock_plan = forecasting_service.generate_restock_plan()
         
         if not restock_plan:
@@ -219,9 +596,11 @@ def get_restock_plan():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/forecast/new-products', methods=['GET'])
+@conditional_get(calendar_day)
 def get_new_product_recommendations():
     """Get new product recommendations based on festival/seasonal trends"""
     try:
+        ensure_forecasting_data()
         recommendations = forecasting_service.get_new_product_recommendations()
         return jsonify({"recommendations": recommendations})
     
@@ -229,9 +608,11 @@ def get_new_product_recommendations():
         return jsonify({"error": str(e)}), 500
 
 @app.route('/api/forecast/demand-analysis', methods=['GET'])
+@conditional_get(calendar_day)
 def get_demand_analysis():
     """Get historical demand analysis"""
     try:
+        ensure_forecasting_data()
         historical_demand = forecasting_service.analyze_historical_demand()
         festival_patterns = forecasting_service.analyze_festival_seasonal_patterns()
         demand_forecast = forecasting_service.forecast_upcoming_demand()
@@ -247,10 +628,40 @@ def get_demand_analysis():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route('/api/exports', methods=['GET'])
+def list_exports():
+    """Exportable datasets and formats"""
+    return jsonify({
+        'datasets': [{'name': name, 'url': url_for('export_dataset', dataset=name)} for name in EXPORT_DATASETS],
+        'formats': list(EXPORT_FORMATS)
+    })
+
+@app.route('/api/exports/<dataset>', methods=['GET'])
+def export_dataset(dataset):
+    """
+    Stream a dataset as csv (default), ndjson or xlsx. Rows are written as they
+    are read, so large exports never sit in memory.
+    """
+    fmt = request.args.get('format', 'csv').lower()
+    if dataset not in EXPORT_DATASETS:
+        return jsonify({"error": f"Unknown dataset: {dataset}", "datasets": list(EXPORT_DATASETS)}), 404
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported export format: {fmt}", "formats": list(EXPORT_FORMATS)}), 400
+    try:
+        columns, rows = EXPORT_DATASETS[dataset]()
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+    mimetype, extension = EXPORT_FORMATS[fmt]
+    filename = f"{dataset}_{get_data_version()}.{extension}"
+    return Response(
+        stream_with_context(stream_export(fmt, columns, rows, sheet_name=dataset)),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename="{filename}"', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/backend/reports/<path:filename>')
 def download_report(filename):
-    reports_dir = os.path.join(os.path.dirname(__file__), 'reports')
-    return send_from_directory(reports_dir, filename, as_attachment=True)
+    return send_report(filename)
 
 if __name__ == '__main__':
     # Create necessary directories
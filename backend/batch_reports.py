@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Batch report generation for SmartStock AI
+Renders inventory health, sales and restock reports for many sellers in parallel
+
+    python batch_reports.py --sellers seller_1,seller_2
+    python batch_reports.py --sellers-file sellers.txt --workers 8 --reports inventory_health,restock_plan
+"""
+
+import argparse
+import sys
+from config import Config
+from services.report_batch import BATCH_REPORT_KINDS, generate_batch_reports
+
+def read_sellers(args):
+    """Seller IDs from --sellers and --sellers-file (one per line, # for comments)"""
+    sellers = [seller.strip() for seller in (args.sellers or '').split(',') if seller.strip()]
+    if args.sellers_file:
+        with open(args.sellers_file) as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    sellers.append(line)
+    return sellers
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate PDF reports for a list of sellers")
+    parser.add_argument('--sellers', help="comma-separated seller IDs")
+    parser.add_argument('--sellers-file', help="file with one seller ID per line")
+    parser.add_argument('--reports', default=','.join(Config.BATCH_REPORT_TYPES),
+                        help=f"comma-separated report types ({', '.join(BATCH_REPORT_KINDS)})")
+    parser.add_argument('--workers', type=int, default=Config.BATCH_REPORT_WORKERS, help="worker processes")
+    parser.add_argument('--manifest', help="where to write the JSON manifest (default: reports directory)")
+    args = parser.parse_args(argv)
+
+    sellers = read_sellers(args)
+    if not sellers:
+        parser.error("no sellers given; use --sellers or --sellers-file")
+    kinds = [kind.strip() for kind in args.reports.split(',') if kind.strip()]
+
+    print(f"🔧 Generating {len(kinds)} report(s) for {len(sellers)} seller(s) on {args.workers} worker(s)")
+    try:
+        manifest = generate_batch_reports(sellers, kinds, args.workers, args.manifest)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"✅ {manifest['done']} report(s) generated in {manifest['elapsed_seconds']}s "
+          f"({manifest['reports_per_second']} per second)")
+    if manifest['failed']:
+        print(f"❌ {manifest['failed']} report(s) failed, see {manifest['manifest_path']}")
+    print(f"📋 Manifest: {manifest['manifest_path']}")
+    return manifest['failed'] == 0
+
+if __name__ == "__main__":
+    if not main():
+        sys.exit(1)
@@ -11,20 +11,107 @@ class Config:
     DATA_DIR = BASE_DIR / "data"
     REPORTS_DIR = BASE_DIR / "reports"
     UPLOADS_DIR = BASE_DIR / "uploads"
+    CACHE_DIR = BASE_DIR / "cache"
     
     # CSV file settings
     DEFAULT_CSV_PATH = DATA_DIR / "sample_inventory.csv"
     UPLOADED_CSV_PATH = UPLOADS_DIR / "uploaded_inventory.csv"
     
+    # Source files of the inventory analysis and forecasts
+    INVENTORY_CSV_PATH = DATA_DIR / "Inventoryproducts.csv"
+    SALES_CSV_PATH = DATA_DIR / "Seasonal_Sales_400_OrderedByMonth(1).csv"
+    TRENDS_CSV_PATH = DATA_DIR / "Product_Trends_By_Month.csv"
+    FESTIVAL_CSV_PATH = DATA_DIR / "Festival_Season_ClothingTags_Refined.csv"
+    DATA_VERSION_CHECK_INTERVAL = 1.0  # seconds between checks of the files above
+    
     # JSON file settings
     DEFAULT_JSON_PATH = DATA_DIR / "inventory_data.json"
     
     # PDF settings
     PDF_TEMPLATE_DIR = BASE_DIR / "templates"
     
+    # Translation cache settings
+    TRANSLATION_CACHE_PATH = CACHE_DIR / "translations.sqlite3"
+    TRANSLATION_CACHE_SIZE = 2048  # entries kept in memory
+    TRANSLATION_MAX_WORKERS = 4  # concurrent requests when a batch has to be split up
+    TRANSLATOR_BACKEND = os.environ.get('TRANSLATOR_BACKEND', 'google')  # google, local or noop
+    TRANSLATION_PHRASE_TABLE = DATA_DIR / "translation_phrases.json"  # used by the local backend
+    TRANSLATION_TIMEOUT = 3.0  # seconds per remote translation call
+    TRANSLATION_BREAKER_THRESHOLD = 5  # consecutive failures before the circuit opens
+    TRANSLATION_BREAKER_RESET = 30  # seconds before a trial call is let through
+    TEMPLATE_PRELOAD_LANGS = ['hi', 'bn']  # response templates translated at startup
+    
+    # PDF report cache settings
+    REPORT_CACHE_ENABLED = os.environ.get('REPORT_CACHE_ENABLED', '1') != '0'  # reuse reports rendered for unchanged data
+    REPORT_STORAGE = os.environ.get('REPORT_STORAGE', 'disk')  # 'disk' or 'memory' (rendered into BytesIO)
+    REPORT_PERSIST_TO_DISK = os.environ.get('REPORT_PERSIST_TO_DISK', '0') == '1'  # also write in-memory reports to disk
+    REPORT_MEMORY_MAX_BYTES = 64 * 1024 * 1024  # in-memory reports kept per worker process
+    
+    # PDF table settings
+    REPORT_TABLE_MAX_ROWS = 2000  # detail rows per table before the rest is summarized per period
+    
+    # Chart rendering settings
+    CHART_CACHE_DIR = CACHE_DIR / "charts"  # PNG files embedded into PDF reports
+    CHART_CACHE_MAX_BYTES = 32 * 1024 * 1024  # rendered chart images kept in memory
+    CHART_DPI = 300  # resolution of the charts returned by /api/inventory/analytics
+    CHART_REPORT_DPI = 150  # resolution of the charts embedded into PDF reports
+    CHART_MIN_DPI = 50  # dpi range accepted by the chart image endpoints
+    CHART_MAX_DPI = 300
+    CHART_MAX_INCHES = 20  # largest width or height a client may ask for
+    CHART_SCATTER_MAX_POINTS = 2000  # products plotted on the stock vs sales scatter
+    CHART_HTTP_MAX_AGE = 300  # seconds clients may reuse a chart image without revalidating
+    CHART_RENDER_WORKERS = int(os.environ.get('CHART_RENDER_WORKERS', '2'))  # render processes, 0 renders in-process
+    CHART_RENDER_TIMEOUT = 60  # seconds to wait for a worker to draw a chart
+    CHART_IMAGE_MIN_AGE = 3600  # seconds an older chart PNG is kept for reports still rendering from it; keep >= REPORT_JOB_TTL
+    
+    # API response settings
+    RESPONSE_COMPRESS_MIN_BYTES = 1024  # smaller JSON/text responses are sent uncompressed
+    RESPONSE_GZIP_LEVEL = 6  # 1 (fastest) to 9 (smallest)
+    RESPONSE_BROTLI_QUALITY = 5  # 0 to 11, used when the brotli package is installed
+    
+    # Data export settings
+    EXPORT_CHUNK_ROWS = 1000  # rows read and written per chunk of a streaming export
+    
+    # Report directory retention settings
+    REPORT_RETENTION_ENABLED = os.environ.get('REPORT_RETENTION_ENABLED', '1') != '0'
+    REPORT_RETENTION_MAX_BYTES = 512 * 1024 * 1024  # total size of the reports directory
+    REPORT_RETENTION_MAX_AGE = 7 * 24 * 3600  # seconds before a report is deleted
+    REPORT_RETENTION_SELLER_MAX_BYTES = 64 * 1024 * 1024  # reports kept per seller
+    REPORT_RETENTION_MIN_AGE = 3600  # seconds a written or served report is protected; keep >= REPORT_JOB_TTL
+    
+    # Background report job settings
+    REPORT_JOB_WORKERS = 2  # PDFs rendered concurrently
+    REPORT_JOB_TTL = 3600  # seconds a finished job stays queryable
+    REPORT_JOB_MAX_PENDING = 20  # queued jobs before new ones are refused
+    REPORT_JOB_WAIT_TIMEOUT = 60  # seconds the synchronous PDF endpoints wait for their job
+    
+    # Batch report settings
+    BATCH_REPORT_WORKERS = os.cpu_count() or 1  # worker processes for batch_reports.py
+    BATCH_REPORT_TYPES = ['inventory_health', 'sales_report', 'restock_plan']  # reports generated per seller by default
+    
+    # Chatbot session state settings
+    SESSION_STORE = os.environ.get('SESSION_STORE', 'memory')  # memory, or sqlite to share across workers
+    SESSION_DB_PATH = CACHE_DIR / "sessions.sqlite3"
+    SESSION_TTL = 1800  # seconds of inactivity before a conversation is forgotten
+    SESSION_MAX_ENTRIES = 10000  # conversations kept by the in-process store
+    
+    # Chatbot response cache settings
+    RESPONSE_CACHE_SIZE = 512  # cached (intent, language, data version) replies
+    RESPONSE_CACHE_PRELOAD_LANGS = ['en', 'hi', 'bn']  # precomputed whenever the data changes
+    
+    # Batch chatbot endpoint
+    CHATBOT_BATCH_MAX_MESSAGES = 200  # messages accepted per /api/chatbot/batch request
+    
+    # Typo-tolerant intent matching
+    INTENT_FUZZY_THRESHOLD = 0.82  # minimum confidence (1 - normalized edit distance)
+    
+    # Ad-hoc chatbot product queries
+    CHATBOT_QUERY_DEFAULT_LIMIT = 5  # results when the question gives no count
+    CHATBOT_QUERY_MAX_RESULTS = 50  # upper bound on "top N" answers
+    
     # API settings
     API_HOST = "0.0.0.0"
-    API_PORT = 5000
+    API_PORT = int(os.environ.get('API_PORT', '5000'))
     DEBUG = True
     
     # File upload settings
@@ -38,6 +125,7 @@ class Config:
             cls.DATA_DIR,
             cls.REPORTS_DIR,
             cls.UPLOADS_DIR,
+            cls.CACHE_DIR,
             cls.PDF_TEMPLATE_DIR
         ]
         
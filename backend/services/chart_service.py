@@ -0,0 +1,275 @@
+import hashlib
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+import numpy as np
+from matplotlib.figure import Figure
+from config import Config
+from services.product_store import get_product_store
+
+def _scatter_sample(size, max_points):
+    """Row numbers to plot: all of them, or an evenly spread subset for large catalogs"""
+    if size <= max_points:
+        return np.arange(size)
+    return np.linspace(0, size - 1, max_points).astype(np.intp)
+
+def _draw_stock_vs_sales(fig, store):
+    sold = store.columns['total_sold']
+    stock = store.columns['stock_quantity']
+    ax = fig.subplots()
+    # The trend line uses every product; only the plotted points are thinned out
+    rows = _scatter_sample(store.size, Config.CHART_SCATTER_MAX_POINTS)
+    sampled = len(rows) < store.size
+    ax.scatter(sold[rows], stock[rows], alpha=0.4 if sampled else 0.7, s=8 if sampled else None)
+    ax.set_xlabel('Total Sold')
+    ax.set_ylabel('Current Stock')
+    ax.set_title('Stock vs Sales Analysis')
+    ax.grid(True, alpha=0.3)
+    # Trend line, when the points do not all share one x value
+    if len(sold) > 1 and np.ptp(sold) > 0:
+        trend = np.poly1d(np.polyfit(sold, stock, 1))
+        xs = np.array([sold.min(), sold.max()])
+        ax.plot(xs, trend(xs), "r--", alpha=0.8)
+
+def _draw_category_analysis(fig, store):
+    categories = sorted(store.category_rows)
+    labels = [store.categories[key] for key in categories]
+    stock = [store.columns['stock_quantity'][store.category_rows[key]].sum() for key in categories]
+    sold = [store.columns['total_sold'][store.category_rows[key]].sum() for key in categories]
+    ax1, ax2 = fig.subplots(1, 2)
+
+    # Stock by category
+    ax1.bar(labels, stock)
+    ax1.set_title('Stock by Category')
+    ax1.set_ylabel('Stock')
+    ax1.tick_params(axis='x', rotation=45)
+
+    # Sales by category
+    ax2.bar(labels, sold)
+    ax2.set_title('Sales by Category')
+    ax2.set_ylabel('Total Sold')
+    ax2.tick_params(axis='x', rotation=45)
+    fig.tight_layout()
+
+# Chart name -> (draw function, default figure size in inches)
+CHARTS = {
+    'stock_vs_sales': (_draw_stock_vs_sales, (10, 6)),
+    'category_analysis': (_draw_category_analysis, (15, 6)),
+}
+
+CHART_FORMATS = {
+    'png': 'image/png',
+    'svg': 'image/svg+xml',
+    'webp': 'image/webp',
+}
+
+def render_chart(chart, fmt, width, height, dpi):
+    """Draw one chart from the current product store and return the image bytes"""
+    fig = Figure(figsize=(width, height))
+    CHARTS[chart][0](fig, get_product_store())
+    buffer = BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches='tight')
+    return buffer.getvalue()
+
+def _init_render_worker():
+    """Load matplotlib with the Agg backend, its fonts and the data once per worker process"""
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib import font_manager
+    font_manager.findfont(matplotlib.rcParams['font.sans-serif'][0])
+    get_product_store()
+    render_chart('stock_vs_sales', 'png', 1, 1, Config.CHART_MIN_DPI)
+
+def _ping():
+    return os.getpid()
+
+def _in_worker_process():
+    # Worker processes re-import the main module; they draw in-process and never start pools
+    return multiprocessing.current_process().name != 'MainProcess'
+
+def _worker_context():
+    """
+    Fresh worker processes rather than forks of a process that is running
+    threads. The fork server imports this module once and forks each worker from
+    it; spawn is the fallback where fork servers are not available.
+    """
+    try:
+        context = multiprocessing.get_context('forkserver')
+    except ValueError:
+        return multiprocessing.get_context('spawn')
+    context.set_forkserver_preload(['services.chart_service'])
+    return context
+
+class ChartService:
+    """
+    Renders the analytics charts from the product store snapshot and keeps the
+    image bytes in a byte-bounded LRU keyed by (chart, format, size, dpi, data
+    version), so each chart is drawn once per data change. Figures are built with
+    the object-oriented Figure API, which keeps no global pyplot state.
+
+    Drawing happens in a pool of worker processes (workers=0 draws in-process),
+    so concurrent requests render in parallel without holding this process's GIL.
+    """
+
+    def __init__(self, max_bytes=None, cache_dir=None, workers=None):
+        self.max_bytes = max_bytes or Config.CHART_CACHE_MAX_BYTES
+        self.cache_dir = cache_dir if cache_dir is not None else Config.CHART_CACHE_DIR
+        self.workers = Config.CHART_RENDER_WORKERS if workers is None else workers
+        self._pool = None
+        self._images = OrderedDict()
+        self._bytes = 0
+        self._locks = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lock_for(self, key):
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def resolve(self, chart, fmt='png', width=None, height=None, dpi=None):
+        """
+        Validate a chart request and fill in defaults. Returns the cache key
+        (chart, format, width, height, dpi, data version). Raises ValueError.
+        """
+        if chart not in CHARTS:
+            raise ValueError(f"Unknown chart: {chart}")
+        if fmt not in CHART_FORMATS:
+            raise ValueError(f"Unsupported chart format: {fmt}")
+        _, (default_width, default_height) = CHARTS[chart]
+        width, height = float(width or default_width), float(height or default_height)
+        dpi = int(dpi or Config.CHART_DPI)
+        if not (0 < width <= Config.CHART_MAX_INCHES and 0 < height <= Config.CHART_MAX_INCHES):
+            raise ValueError(f"Chart width and height must be between 0 and {Config.CHART_MAX_INCHES} inches")
+        if not Config.CHART_MIN_DPI <= dpi <= Config.CHART_MAX_DPI:
+            raise ValueError(f"Chart dpi must be between {Config.CHART_MIN_DPI} and {Config.CHART_MAX_DPI}")
+        return (chart, fmt, width, height, dpi, get_product_store().version)
+
+    def etag(self, key):
+        """Strong validator for a resolved chart key, known before anything is drawn"""
+        return hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:20]
+
+    def render(self, chart, fmt='png', width=None, height=None, dpi=None, key=None):
+        """Return the chart image as bytes, drawing it only if it is not cached"""
+        key = key or self.resolve(chart, fmt, width, height, dpi)
+
+        with self._lock:
+            data = self._images.get(key)
+            if data is not None:
+                self._images.move_to_end(key)
+                self.hits += 1
+                return data
+        # Concurrent requests for the same image wait for one render
+        with self._lock_for(key):
+            with self._lock:
+                data = self._images.get(key)
+                if data is not None:
+                    self.hits += 1
+                    return data
+            data = self._draw(key)
+            self._remember(key, data)
+        with self._lock:
+            self._locks.pop(key, None)
+            self.misses += 1
+        return data
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=_worker_context(),
+                    initializer=_init_render_worker
+                )
+            return self._pool
+
+    def _draw(self, key):
+        if self.workers and not _in_worker_process():
+            try:
+                future = self._get_pool().submit(render_chart, *key[:5])
+                return future.result(timeout=Config.CHART_RENDER_TIMEOUT)
+            except BrokenProcessPool:
+                print("❌ Chart worker pool stopped, rendering in-process")
+                with self._lock:
+                    self._pool = None
+        return render_chart(*key[:5])
+
+    def warm(self):
+        """Start every worker process now so the first requests do not pay for it"""
+        if not self.workers or _in_worker_process():
+            return
+        try:
+            pool = self._get_pool()
+            for future in [pool.submit(_ping) for _ in range(self.workers)]:
+                future.result(timeout=Config.CHART_RENDER_TIMEOUT)
+            print(f"✅ Chart workers ready: {self.workers}")
+        except Exception as e:
+            print(f"❌ Chart workers failed to start: {e}")
+            with self._lock:
+                self._pool = None
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._images[key] = data
+            self._bytes += len(data)
+            while self._bytes > self.max_bytes and len(self._images) > 1:
+                _, evicted = self._images.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def image_path(self, chart, width=None, height=None, dpi=None):
+        """
+        Path of the chart as a PNG file, for PDF libraries that only read images
+        from disk. The file name carries the data version, so it is written once
+        per data change. Older versions of the same chart are removed once they are
+        CHART_IMAGE_MIN_AGE old, so reports still rendering from them can finish.
+        """
+        key = self.resolve(chart, 'png', width, height, dpi or Config.CHART_REPORT_DPI)
+        data = self.render(chart, key=key)
+        chart, _, width, height, dpi, version = key
+        prefix = f"{chart}_{width:g}x{height:g}_{dpi}_"
+        path = self.cache_dir / f"{prefix}{version}.png"
+        if not path.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+            cutoff = time.time() - Config.CHART_IMAGE_MIN_AGE
+            for old_path in self.cache_dir.glob(f"{prefix}*.png"):
+                try:
+                    if old_path != path and old_path.stat().st_mtime < cutoff:
+                        old_path.unlink()
+                except FileNotFoundError:
+                    pass
+        return path
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'images': len(self._images),
+            'bytes': self._bytes,
+            'workers': self.workers
+        }
+
+_chart_service = None
+
+def get_chart_service():
+    """Process-wide chart service shared by the analytics endpoint and the PDF reports"""
+    global _chart_service
+    if _chart_service is None:
+        _chart_service = ChartService()
+    return _chart_service
@@ -1,26 +1,64 @@
-import json
-import os
-from datetime import datetime
+import logging
+import threading
+import time
 from services.inventory_health import InventoryHealthAnalyzer
 from services.pdf_generator import InventoryPDFGenerator
 from services.sales_pdf_generator import SalesPDFGenerator
 from config import Config
 from services.forecasting_service import ForecastingService
+from services.intent_matcher import IntentMatcher, FuzzyIntentMatcher
 import re
-from deep_translator import GoogleTranslator
+from services.translation import Translator
+from services.report_jobs import ReportJobQueue, ReportQueueFull, report_dedup_key
+from services.session_store import get_session_store
+from services.response_cache import ResponseCache
+from services.product_store import get_product_store
+from services.product_query import parse_product_query
+from services.response_templates import ResponseTemplateCatalog, localize_digits
+
+logger = logging.getLogger(__name__)
+
+# Keywords that always trigger the weekly/monthly sales PDF
+WEEKLY_MONTHLY_KEYWORDS = [
+    'weekly or monthly report',
+    'weekly report',
+    'monthly report',
+    'generate weekly report',
+    'generate monthly report',
+    'weekly sales report',
+    'monthly sales report',
+    'weekly sales',
+    'monthly sales',
+    'generate a weekly or monthly report',
+]
+
+# Step keywords of the product listing flow
+PRODUCT_LISTING_TRIGGERS = ['uploaded', 'name:', 'category:', 'price:', 'step2', 'step3', 'step4']
+
+IMAGE_FILE_PATTERN = re.compile(r"\.(jpg|jpeg|png|gif|bmp|webp|tiff|svg)$", re.IGNORECASE)
+
+# Line carrying the ID of a queued report, see ResponseTemplateCatalog 'report_job'
+REPORT_JOB_PATTERN = re.compile(r'Report job: `([^`]+)`')
+
+# Read-only intents whose replies depend only on the data files and the language
+CACHEABLE_INTENTS = [
+    'most_sold',
+    'least_sold',
+    'dead_stock',
+    'overstocked',
+    'understocked',
+    'category_analysis',
+    'recommendations',
+]
+
+def extract_report_job_id(response):
+    """Return the report job ID mentioned in a chatbot response, if any"""
+    match = REPORT_JOB_PATTERN.search(response or '')
+    return match.group(1) if match else None
 
 def localize_number(number, lang):
     # Only localize for Hindi and Bengali, else return as string
-    if lang == 'hi':
-        # Hindi numerals
-        hindi_digits = '०१२३४५६७८९'
-        return ''.join(hindi_digits[int(d)] if d.isdigit() else d for d in str(number))
-    elif lang == 'bn':
-        # Bengali numerals
-        bengali_digits = '০১২৩৪৫৬৭৮৯'
-        return ''.join(bengali_digits[int(d)] if d.isdigit() else d for d in str(number))
-    else:
-        return str(number)
+    return localize_digits(str(number), lang)
 
 def is_garbled_hindi(translated):
     # Heuristic: if too many Latin chars or too short, it's likely garbled
@@ -54,11 +92,30 @@ def should_translate_line(line):
     return True
 
 class ChatbotService:
-    def __init__(self):
+    def __init__(self, report_jobs=None, session_store=None):
         self.inventory_pdf_generator = InventoryPDFGenerator()
         self.sales_pdf_generator = SalesPDFGenerator()
         self.analyzer = InventoryHealthAnalyzer()
         self.forecasting_service = ForecastingService()
+        self.translator = Translator()
+        self.templates = ResponseTemplateCatalog(self.translator)
+        # PDF reports are rendered in the background so replies don't wait on them
+        self.report_jobs = report_jobs if report_jobs is not None else ReportJobQueue()
+        # Per-session conversation state (product listing flow)
+        self.session_store = session_store if session_store is not None else get_session_store()
+        # Finished replies of read-only intents, rebuilt in the background when the data changes
+        self.response_cache = ResponseCache(on_new_version=self._on_data_version_change)
+        self._warm_lock = threading.Lock()
+        self._reply_state = threading.local()
+        self.cacheable_handlers = {
+            'most_sold': self._get_most_sold_items,
+            'least_sold': self._get_least_sold_items,
+            'dead_stock': self._get_dead_stock,
+            'overstocked': self._get_overstocked_items,
+            'understocked': self._get_understocked_items,
+            'category_analysis': self._get_category_analysis,
+            'recommendations': self._get_recommendations,
+        }
         
         # Predefined prompts and responses
         self.prompts = {
@@ -157,317 +214,346 @@ class ChatbotService:
                 'profit tips'
             ],
         }
+
+        # Compiled once; priority follows the order of the groups below
+        self.intent_matcher = IntentMatcher(
+            [('weekly_monthly_report', WEEKLY_MONTHLY_KEYWORDS),
+             ('product_listing_step', PRODUCT_LISTING_TRIGGERS)]
+            + list(self.prompts.items())
+        )
+        # Fallback for misspelled prompts such as "dead stok" or "restok plan"
+        self.fuzzy_matcher = FuzzyIntentMatcher(self.prompts.items(), threshold=Config.INTENT_FUZZY_THRESHOLD)
     
-    def process_message(self, user_message, lang='en'):
-        """Process user message and return appropriate response"""
+    def process_message(self, user_message, lang='en', session_id=None):
+        """Process user message and return appropriate response. session_id keys multi-step conversation state."""
         user_message_clean = user_message.lower().strip()
 
+        intent = self.intent_matcher.match(user_message_clean)
+
         # Robust check for weekly/monthly report requests
-        if any(kw in user_message_clean for kw in [
-            'weekly or monthly report',
-            'weekly report',
-            'monthly report',
-            'generate weekly report',
-            'generate monthly report',
-            'weekly sales report',
-            'monthly sales report',
-            'weekly sales',
-            'monthly sales',
-            'generate a weekly or monthly report',
-        ]):
+        if intent == 'weekly_monthly_report':
             # Always trigger the weekly/monthly PDF logic
-            seller_id = 'default_seller'
-            pdf_path = self.sales_pdf_generator.generate_weekly_monthly_sales_pdf(seller_id)
-            pdf_filename = os.path.basename(pdf_path)
-            response = f"Weekly & Monthly Sales Report PDF Generated!\nDownload: `{pdf_filename}`\n\nThe report includes:\n• Weekly sales (past year, product-wise)\n• Monthly sales (past year, product-wise)\n\nYou can download the PDF from the reports folder."
-            # Localize numbers in the response
-            response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-            # Translate response if needed
-            if lang != 'en':
-                try:
-                    response = GoogleTranslator(source='en', target=lang).translate(response)
-                except Exception:
-                    pass
-            return response
+            return self._generate_weekly_monthly_report(lang)
 
         # Robust check for product listing assistance flow (step keywords or image file)
-        image_file_pattern = re.compile(r"\.(jpg|jpeg|png|gif|bmp|webp|tiff|svg)$", re.IGNORECASE)
-        if (
-            'uploaded' in user_message_clean
-            or 'name:' in user_message_clean
-            or 'category:' in user_message_clean
-            or 'price:' in user_message_clean
-            or 'step2' in user_message_clean
-            or 'step3' in user_message_clean
-            or 'step4' in user_message_clean
-            or image_file_pattern.search(user_message.strip())
-        ):
-            return self._handle_product_listing_assistance(user_message)
-
-        # Check for exact matches with predefined prompts
-        for intent, keywords in self.prompts.items():
-            if any(keyword in user_message_clean for keyword in keywords):
-                if intent == 'forecast_demand':
-                    return self._get_forecast_demand_response()
-                if intent == 'product_listing_assistance':
-                    return self._handle_product_listing_assistance(user_message)
-                if intent == 'boost_profit':
-                    # Use a session or message-based offset for rotation; fallback to random for now
-                    return self._get_boost_profit_suggestions(user_message)
-                response = self._handle_intent(intent, user_message, lang=lang)
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
+        if intent == 'product_listing_step' or IMAGE_FILE_PATTERN.search(user_message.strip()):
+            return self._handle_product_listing_assistance(user_message, session_id)
+
+        # Parameterized questions ("top 20 kurtis by sales last month") run against the product store
+        if intent is None or intent in CACHEABLE_INTENTS:
+            query = self._parse_product_query(user_message_clean)
+            if query is not None:
+                return self._answer_product_query(query, lang)
+
+        # Typo-tolerant fallback before giving up on the message
+        if intent is None:
+            fuzzy = self.fuzzy_matcher.match(user_message_clean)
+            if fuzzy is not None:
+                intent, confidence = fuzzy
+                logger.debug("Fuzzy matched intent '%s' with confidence %s", intent, confidence)
+
+        # Predefined prompts
+        if intent is not None:
+            if intent == 'forecast_demand':
+                return self._get_forecast_demand_response()
+            if intent == 'product_listing_assistance':
+                return self._handle_product_listing_assistance(user_message, session_id)
+            return self._handle_intent(intent, user_message, lang=lang)
         # Default response
-        response = self._get_default_response()
-        # Localize numbers in the response
+        return self._get_default_response(lang)
+
+    def stream_message(self, user_message, lang='en', session_id=None):
+        """
+        Process a message in stages for streaming clients. Yields (event, data) pairs:
+        'summary' with the English reply, 'translation' with the reply rendered from
+        the translated templates when lang is not English, 'report' with the current
+        state of a queued PDF (clients poll its status URL), then 'done'.
+        """
+        # The translation reuses the summary's analysis and forecasts, and the reports it queued
+        self._reply_state.snapshot = {}
+        self._reply_state.queued_reports = {}
+        self._reply_state.stateful = False
+        try:
+            response = self.process_message(user_message, lang='en', session_id=session_id)
+            job_id = extract_report_job_id(response)
+            yield 'summary', {'response': response, 'job_id': job_id}
+
+            if lang != 'en':
+                # The product listing flow moves the session on, so it is answered once
+                if not self._reply_state.stateful:
+                    response = self.process_message(user_message, lang=lang, session_id=session_id)
+                yield 'translation', {'response': response, 'lang': lang}
+        finally:
+            self._reply_state.snapshot = None
+            self._reply_state.queued_reports = None
+
+        if job_id:
+            yield 'report', self.report_jobs.get(job_id) or {'job_id': job_id, 'status': 'unknown'}
+
+        yield 'done', {}
+
+    def process_batch(self, messages):
+        """
+        Answer a burst of messages, each a dict with 'message' and optional 'lang'
+        and 'session_id'. The inventory analysis, restock plan and demand forecast
+        are computed at most once for the whole batch, and every reply is rendered
+        in its language from the translated templates, as process_message does.
+        """
+        self._reply_state.snapshot = {}
+        try:
+            return [
+                self.process_message(item.get('message', ''), lang=item.get('lang') or 'en',
+                                     session_id=item.get('session_id'))
+                for item in messages
+            ]
+        finally:
+            self._reply_state.snapshot = None
+
+    def _snapshot_value(self, key, compute):
+        """Share compute() across a process_batch or stream_message call; otherwise compute every time"""
+        snapshot = getattr(self._reply_state, 'snapshot', None)
+        if snapshot is None:
+            return compute()
+        if key not in snapshot:
+            snapshot[key] = compute()
+        return snapshot[key]
+
+    def _get_analysis(self):
+        return self._snapshot_value('analysis', self.inventory_pdf_generator.analyzer.analyze_inventory)
+
+    def _get_restock_plan_data(self, test_month=None):
+        """Restock plan from the forecasting service, or None if its data files could not be loaded"""
+        def compute():
+            if not self.forecasting_service.load_data():
+                return None
+            return self.forecasting_service.generate_restock_plan(test_month=test_month)
+        return self._snapshot_value(('restock_plan', test_month), compute)
+
+    def _get_demand_forecast(self):
+        """Next month's demand forecast, or None if the data files could not be loaded"""
+        def compute():
+            if not self.forecasting_service.load_data():
+                return None
+            return self.forecasting_service.forecast_upcoming_demand(forecast_months=1)
+        return self._snapshot_value('demand_forecast', compute)
+
+    def _localize_response(self, response, lang):
+        """Localize numbers and translate a free-form response"""
+        # Only error paths end up here; keep them out of the response cache
+        self._reply_state.failed = True
         response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-        # Translate response if needed
         if lang != 'en':
             try:
-                response = GoogleTranslator(source='en', target=lang).translate(response)
+                response = self.translator.translate(response, lang)
             except Exception:
                 pass
         return response
     
     def _handle_intent(self, intent, user_message, lang='en'):
-        """Handle different intents"""
+        """Handle different intents. Responses come back localized for lang."""
         try:
             if intent == 'inventory_health':
                 seller_id = 'default_seller'
-                analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
-                summary = self._get_inventory_health_summary_from_analysis(analysis)
-                pdf_path = self.inventory_pdf_generator.generate_inventory_health_pdf(seller_id, analysis)
-                pdf_filename = os.path.basename(pdf_path)
-                response = f"{summary}\n\nPDF Report Generated!\nDownload: `{pdf_filename}`"
-                return response
+                analysis = self._get_analysis()
+                summary = self._get_inventory_health_summary_from_analysis(analysis, lang)
+                job_lines = self._queue_report(
+                    'inventory_health', self.inventory_pdf_generator.generate_inventory_health_pdf, seller_id, analysis, lang=lang
+                )
+                return f"{summary}\n\n{job_lines}"
             
             elif intent == 'generate_pdf':
                 # Special case: if the prompt is for weekly/monthly report, generate that PDF
                 if 'weekly' in user_message or 'monthly' in user_message:
-                    seller_id = 'default_seller'
-                    pdf_path = self.sales_pdf_generator.generate_weekly_monthly_sales_pdf(seller_id)
-                    pdf_filename = os.path.basename(pdf_path)
-                    response = f"Weekly & Monthly Sales Report PDF Generated!\nDownload: `{pdf_filename}`\n\nThe report includes:\n• Weekly sales (past year, product-wise)\n• Monthly sales (past year, product-wise)\n\nYou can download the PDF from the reports folder."
-                    return response
-                response = self._generate_pdf_report(user_message)
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
+                    return self._generate_weekly_monthly_report(lang)
+                return self._generate_pdf_report(user_message, lang)
             
             elif intent == 'sales_report':
                 seller_id = 'default_seller'
-                summary = self._get_sales_report_summary()
-                pdf_path = self.sales_pdf_generator.generate_sales_report_pdf(seller_id)
-                pdf_filename = os.path.basename(pdf_path)
-                response = f"{summary}\n\nPDF Report Generated!\nDownload: `{pdf_filename}`"
-                return response
+                summary = self._get_sales_report_summary(lang)
+                job_lines = self._queue_report(
+                    'sales_report', self.sales_pdf_generator.generate_sales_report_pdf, seller_id, lang=lang
+                )
+                return f"{summary}\n\n{job_lines}"
             
-            elif intent == 'most_sold':
-                response = self._get_most_sold_items()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
-            
-            elif intent == 'least_sold':
-                response = self._get_least_sold_items()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
-            
-            elif intent == 'dead_stock':
-                response = self._get_dead_stock()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
-            
-            elif intent == 'overstocked':
-                response = self._get_overstocked_items()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
-            
-            elif intent == 'understocked':
-                response = self._get_understocked_items()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
-            
-            elif intent == 'category_analysis':
-                response = self._get_category_analysis()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
-            
-            elif intent == 'recommendations':
-                response = self._get_recommendations()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
+            elif intent in self.cacheable_handlers:
+                return self._get_cached_reply(intent, lang)
             
             elif intent == 'restock_plan':
-                response = self._get_restock_plan(test_month=None) # Default to None for now
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
+                return self._get_restock_plan(test_month=None, lang=lang) # Default to None for now
             
             elif intent == 'boost_profit':
                 orig_response = self._get_boost_profit_suggestions(user_message)
-                print(f"DEBUG: boost_profit original response: {orig_response}")
+                logger.debug("boost_profit original response: %s", orig_response)
                 response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), orig_response)
-                print(f"DEBUG: boost_profit after number localization: {response}")
+                logger.debug("boost_profit after number localization: %s", response)
                 if lang == 'hi':
                     try:
                         lines = response.split('\n')
-                        translated_lines = []
-                        for line in lines:
-                            print(f"DEBUG: Hindi line before translation: {line}")
-                            if line.strip() and should_translate_line(line):
-                                sanitized = sanitize_for_translation(line)
-                                try:
-                                    translated_line = GoogleTranslator(source='en', target='hi').translate(sanitized)
-                                    print(f"DEBUG: Hindi line after translation: {translated_line}")
-                                    translated_lines.append(translated_line)
-                                except Exception as e:
-                                    print(f"DEBUG: Hindi line translation failed: {e}")
-                                    translated_lines.append(line)
-                            else:
-                                print(f"DEBUG: Skipping translation for line: {line}")
-                                translated_lines.append(line)
+                        # Translate every eligible line in one batched request
+                        indexes = [i for i, line in enumerate(lines) if line.strip() and should_translate_line(line)]
+                        translations = self.translator.translate_batch(
+                            [sanitize_for_translation(lines[i]) for i in indexes], 'hi'
+                        )
+                        translated_lines = list(lines)
+                        for i, translated_line in zip(indexes, translations):
+                            if translated_line:
+                                translated_lines[i] = translated_line
                         translated = '\n'.join(translated_lines)
-                        print(f"DEBUG: boost_profit after line-by-line translation: {translated}")
+                        logger.debug("boost_profit after batched translation: %s", translated)
                         if translated.strip() and not is_garbled_hindi(translated):
                             response = translated
                         else:
-                            print("DEBUG: Hindi translation garbled or empty, using English fallback.")
+                            logger.debug("Hindi translation garbled or empty, using English fallback")
                             response = orig_response + "\n\n[Hindi translation unavailable, showing English.]"
                     except Exception as e:
-                        print(f"DEBUG: Hindi translation failed: {e}, using English fallback.")
+                        logger.debug("Hindi translation failed: %s, using English fallback", e)
                         response = orig_response + "\n\n[Hindi translation unavailable, showing English.]"
                 elif lang != 'en':
                     try:
-                        translated = GoogleTranslator(source='en', target=lang).translate(response)
-                        print(f"DEBUG: boost_profit after translation: {translated}")
+                        translated = self.translator.translate(response, lang)
+                        logger.debug("boost_profit after translation: %s", translated)
                         if translated.strip():
                             response = translated
                         else:
-                            print("DEBUG: Translation returned empty string, using English fallback.")
+                            logger.debug("Translation returned empty string, using English fallback")
                             response = orig_response
                     except Exception as e:
-                        print(f"DEBUG: Translation failed: {e}, using English fallback.")
+                        logger.debug("Translation failed: %s, using English fallback", e)
                         response = orig_response
                 if not response.strip():
-                    print("DEBUG: Final response is empty, using English fallback.")
+                    logger.debug("Final response is empty, using English fallback")
                     response = orig_response
                 return response
             else:
-                response = self._get_default_response()
-                # Localize numbers in the response
-                response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-                # Translate response if needed
-                if lang != 'en':
-                    try:
-                        response = GoogleTranslator(source='en', target=lang).translate(response)
-                    except Exception:
-                        pass
-                return response
+                return self._get_default_response(lang)
                 
         except Exception as e:
             import traceback
             traceback.print_exc()
             response = f"I encountered an error while processing your request: {str(e)}"
-            # Localize numbers in the response
-            response = re.sub(r'\d+', lambda m: localize_number(m.group(), lang), response)
-            # Translate response if needed
-            if lang != 'en':
-                try:
-                    response = GoogleTranslator(source='en', target=lang).translate(response)
-                except Exception:
-                    pass
+            return self._localize_response(response, lang)
+
+    def _parse_product_query(self, user_message):
+        try:
+            return parse_product_query(user_message, get_product_store())
+        except Exception as e:
+            logger.debug("Product query parsing failed: %s", e)
+            return None
+
+    def _answer_product_query(self, query, lang='en'):
+        """Run a parsed product query against the indexed store and render the matches"""
+        try:
+            started = time.perf_counter()
+            results = query.run(get_product_store())
+            logger.debug("Product query answered %d rows in %.1fms", len(results), 1000 * (time.perf_counter() - started))
+            if not results:
+                return self.templates.render('no_query_results', lang)
+            if query.period is not None:
+                year, month = query.period
+                header = self.templates.render('query_results_month_header', lang, month=month, year=year)
+            else:
+                header = self.templates.render('query_results_header', lang)
+            lines = [header, ""]
+            for i, item in enumerate(results, 1):
+                lines.append(self.templates.render('product_line', lang, index=i, name=item['name'], category=item['category']))
+                lines.append(self.templates.render('query_result_line', lang, **item))
+                lines.append("")
+            return "\n".join(lines).strip()
+        except Exception as e:
+            return self._localize_response(f"Error answering product query: {str(e)}", lang)
+
+    def _get_cached_reply(self, intent, lang='en', analysis=None):
+        """Serve a read-only intent from the response cache, computing and storing it on a miss"""
+        version, response = self.response_cache.lookup(intent, lang)
+        if response is not None:
             return response
+        self._reply_state.failed = False
+        fallbacks = self.templates.fallback_count()
+        response = self.cacheable_handlers[intent](lang, analysis=analysis)
+        # Errors and replies with untranslated templates are recomputed next time
+        if not self._reply_state.failed and self.templates.fallback_count() == fallbacks:
+            self.response_cache.store(intent, lang, version, response)
+        return response
+
+    def warm_responses(self, langs):
+        """Precompute the replies of every cacheable intent for langs from a single analysis run"""
+        if not self._warm_lock.acquire(blocking=False):
+            return
+        try:
+            get_product_store()
+            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+            for lang in langs:
+                for intent in CACHEABLE_INTENTS:
+                    self._get_cached_reply(intent, lang, analysis=analysis)
+            print(f"✅ Precomputed chatbot replies for {', '.join(langs)} (data version {self.response_cache.current_version()})")
+        except Exception as e:
+            print(f"❌ Could not precompute chatbot replies: {e}")
+        finally:
+            self._warm_lock.release()
+
+    def _on_data_version_change(self, version):
+        logger.debug("Data version changed to %s, rebuilding cached replies", version)
+        threading.Thread(
+            target=self.warm_responses, args=(Config.RESPONSE_CACHE_PRELOAD_LANGS,), daemon=True
+        ).start()
+
+    def _queue_report(self, kind, render, *args, lang='en'):
+        """Queue a PDF render in the background and return the reply lines carrying its job ID"""
+        dedup_key = report_dedup_key(kind, *args)
+        queued = getattr(self._reply_state, 'queued_reports', None)
+        try:
+            if queued is not None and dedup_key in queued:
+                job_id = queued[dedup_key]
+            else:
+                # The same report (kind and arguments) still rendering is shared, not queued twice
+                job_id = self.report_jobs.submit(kind, render, *args, dedup_key=dedup_key)
+        except ReportQueueFull:
+            return self.templates.render('report_queue_full', lang)
+        if queued is not None:
+            queued[dedup_key] = job_id
+        return "\n".join([
+            self.templates.render('pdf_job_queued', lang),
+            self.templates.render('report_job', lang, job_id=job_id)
+        ])
+
+    def _generate_weekly_monthly_report(self, lang='en'):
+        """Queue the weekly & monthly sales PDF and describe it"""
+        seller_id = 'default_seller'
+        job_lines = self._queue_report(
+            'weekly_monthly_sales', self.sales_pdf_generator.generate_weekly_monthly_sales_pdf, seller_id, lang=lang
+        )
+        return "\n".join([
+            self.templates.render('weekly_monthly_requested', lang),
+            job_lines,
+            "",
+            self.templates.render('weekly_monthly_contents', lang)
+        ])
     
-    def _get_inventory_health_summary_from_analysis(self, analysis):
+    def _get_inventory_health_summary_from_analysis(self, analysis, lang='en'):
         """Get overall inventory health summary from a given analysis"""
         try:
             summary = analysis['summary']
             health_score = analysis['health_score']
-            response = f"""
-Inventory Health Summary
-
-Overall Health Score: {health_score}/100
-Total Products: {summary['total_products']}
-Total Stock: {summary['total_stock']}
-Total Sold: {summary['total_sold']}
-Total Value: ₹{summary['total_value']:,.0f}
-Stock-to-Sales Ratio: {summary['stock_to_sales_ratio']:.2f}
-
-Status: {'Excellent' if health_score >= 80 else 'Good' if health_score >= 60 else 'Needs Attention'}
-"""
-            return response.strip()
+            if health_score >= 80:
+                status = self.templates.render('status_excellent', lang)
+            elif health_score >= 60:
+                status = self.templates.render('status_good', lang)
+            else:
+                status = self.templates.render('status_needs_attention', lang)
+            return self.templates.render(
+                'inventory_health_summary', lang,
+                health_score=health_score,
+                total_products=summary['total_products'],
+                total_stock=summary['total_stock'],
+                total_sold=summary['total_sold'],
+                total_value=summary['total_value'],
+                stock_to_sales_ratio=summary['stock_to_sales_ratio'],
+                status=status
+            )
         except Exception as e:
-            return f"Error getting inventory health summary: {str(e)}"
+            return self._localize_response(f"Error getting inventory health summary: {str(e)}", lang)
     
-    def _generate_pdf_report(self, user_message):
+    def _generate_pdf_report(self, user_message, lang='en'):
         """Generate PDF report"""
         try:
             # Extract seller_id from message if provided
@@ -476,234 +562,197 @@ Status: {'Excellent' if health_score >= 80 else 'Good' if health_score >= 60 els
                 # Simple extraction - in real app, use more sophisticated parsing
                 seller_id = user_message.split('seller')[-1].strip()[:10]
             
-            pdf_path = self.inventory_pdf_generator.generate_inventory_health_pdf(seller_id)
-            pdf_filename = os.path.basename(pdf_path)
-            response = f"""
-PDF Report Generated Successfully!
-
-Report saved as: `{pdf_filename}`
-
-The report includes:
-• Executive Summary with Health Score
-• Top Performing Products
-• Dead Stock Alerts
-• Overstocked Items
-• Understocked Items
-• Category Analysis
-• Actionable Recommendations
-
-You can download the PDF from the reports folder.
-            """
-            return response
+            job_lines = self._queue_report(
+                'inventory_health', self.inventory_pdf_generator.generate_inventory_health_pdf, seller_id, lang=lang
+            )
+            return "\n\n".join([
+                self.templates.render('inventory_pdf_requested', lang),
+                job_lines,
+                self.templates.render('inventory_pdf_contents', lang)
+            ])
             
         except Exception as e:
-            return f"Error generating PDF report: {str(e)}"
+            return self._localize_response(f"Error generating PDF report: {str(e)}", lang)
     
-    def _get_sales_report_summary(self):
+    def _get_sales_report_summary(self, lang='en'):
         # Generate a short summary for the sales report
         try:
             analysis = self.sales_pdf_generator.analyze_sales_data()
             summary = analysis['summary']
-            response = f"""
-Sales Report Summary
-
-Total Sales Records: {summary['total_records']}
-Total Products Sold: {summary['total_products']}
-Total Quantity Sold: {summary['total_quantity']}
-Report Period: {summary['period']}
-Average Monthly Sales: {summary['avg_monthly_sales']:.0f} units
-"""
-            return response.strip()
+            return self.templates.render(
+                'sales_report_summary', lang,
+                total_records=summary['total_records'],
+                total_products=summary['total_products'],
+                total_quantity=summary['total_quantity'],
+                period=summary['period'],
+                avg_monthly_sales=summary['avg_monthly_sales']
+            )
         except Exception as e:
-            return f"Error getting sales report summary: {str(e)}"
+            return self._localize_response(f"Error getting sales report summary: {str(e)}", lang)
+
+    def _render_product_list(self, header_key, items, line_key, lang, footer_key=None):
+        """Render a numbered product list from per-line templates"""
+        lines = [self.templates.render(header_key, lang), ""]
+        for i, item in enumerate(items, 1):
+            lines.append(self.templates.render('product_line', lang, index=i, name=item['name'], category=item['category']))
+            lines.append(self.templates.render(line_key, lang, **item))
+            lines.append("")
+        if footer_key:
+            lines.append(self.templates.render(footer_key, lang))
+        return "\n".join(lines).strip()
     
-    def _get_most_sold_items(self):
+    def _get_most_sold_items(self, lang='en', analysis=None):
         """Get most sold items"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
-            most_sold = analysis['most_sold']
-            
-            response = "Top Performing Products\n\n"
-            for i, item in enumerate(most_sold, 1):
-                response += f"{i}. {item['name']} ({item['category']})\n"
-                response += f"   Stock: {item['stock_quantity']} | Sold: {item['total_sold']} | Trend: {int(item['trend_score'])}\n\n"
-            
-            return response.strip()
+            analysis = analysis or self._get_analysis()
+            most_sold = [dict(item, trend_score=int(item['trend_score'])) for item in analysis['most_sold']]
+            return self._render_product_list('most_sold_header', most_sold, 'stock_sold_trend', lang)
             
         except Exception as e:
-            return f"Error getting most sold items: {str(e)}"
+            return self._localize_response(f"Error getting most sold items: {str(e)}", lang)
     
-    def _get_least_sold_items(self):
+    def _get_least_sold_items(self, lang='en', analysis=None):
         """Get least sold items"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
-            least_sold = analysis['least_sold']
-            
-            response = "Lowest Performing Products\n\n"
-            for i, item in enumerate(least_sold, 1):
-                response += f"{i}. {item['name']} ({item['category']})\n"
-                response += f"   Stock: {item['stock_quantity']} | Sold: {item['total_sold']} | Trend: {int(item['trend_score'])}\n\n"
-            
-            return response.strip()
+            analysis = analysis or self._get_analysis()
+            least_sold = [dict(item, trend_score=int(item['trend_score'])) for item in analysis['least_sold']]
+            return self._render_product_list('least_sold_header', least_sold, 'stock_sold_trend', lang)
             
         except Exception as e:
-            return f"Error getting least sold items: {str(e)}"
+            return self._localize_response(f"Error getting least sold items: {str(e)}", lang)
     
-    def _get_dead_stock(self):
+    def _get_dead_stock(self, lang='en', analysis=None):
         """Get dead stock items"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+            analysis = analysis or self._get_analysis()
             dead_stock = analysis['dead_stock']
             
             if not dead_stock:
-                return "No Dead Stock Found!\n\nAll your products have some sales activity."
+                return self.templates.render('no_dead_stock', lang)
             
-            response = "Dead Stock Alert (Items with stock but no sales)\n\n"
-            for i, item in enumerate(dead_stock, 1):
-                response += f"{i}. {item['name']} ({item['category']})\n"
-                response += f"   Stock: {item['stock_quantity']} | Price: ₹{item['price']}\n\n"
-            
-            response += "Recommendation: Consider discounting or liquidating these items."
-            return response.strip()
+            return self._render_product_list('dead_stock_header', dead_stock, 'stock_price', lang, 'dead_stock_advice')
             
         except Exception as e:
-            return f"Error getting dead stock: {str(e)}"
+            return self._localize_response(f"Error getting dead stock: {str(e)}", lang)
     
-    def _get_overstocked_items(self):
+    def _get_overstocked_items(self, lang='en', analysis=None):
         """Get overstocked items"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+            analysis = analysis or self._get_analysis()
             overstocked = analysis['overstocked']
             
             if not overstocked:
-                return "No Overstocked Items Found!\n\nYour stock levels are well-balanced."
-            
-            response = "Overstocked Items (High stock, low sales)\n\n"
-            for i, item in enumerate(overstocked, 1):
-                response += f"{i}. {item['name']} ({item['category']})\n"
-                response += f"   Stock: {item['stock_quantity']} | Sold: {item['total_sold']} | Ratio: {item['stock_sales_ratio']:.2f}\n\n"
+                return self.templates.render('no_overstocked', lang)
             
-            response += "Recommendation: Consider reducing stock levels for these items."
-            return response.strip()
+            return self._render_product_list('overstocked_header', overstocked, 'stock_sold_ratio', lang, 'overstocked_advice')
             
         except Exception as e:
-            return f"Error getting overstocked items: {str(e)}"
+            return self._localize_response(f"Error getting overstocked items: {str(e)}", lang)
     
-    def _get_understocked_items(self):
+    def _get_understocked_items(self, lang='en', analysis=None):
         """Get understocked items"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+            analysis = analysis or self._get_analysis()
             understocked = analysis['understocked']
             
             if not understocked:
-                return "No Understocked Items Found!\n\nAll your products have adequate stock levels."
-            
-            response = "Understocked Items (Low stock, high sales potential)\n\n"
-            for i, item in enumerate(understocked, 1):
-                response += f"{i}. {item['name']} ({item['category']})\n"
-                response += f"   Stock: {item['stock_quantity']} | Threshold: {item['restock_threshold']} | Sold: {item['total_sold']}\n\n"
+                return self.templates.render('no_understocked', lang)
             
-            response += "Recommendation: Consider increasing stock levels for these items."
-            return response.strip()
+            return self._render_product_list('understocked_header', understocked, 'stock_threshold_sold', lang, 'understocked_advice')
             
         except Exception as e:
-            return f"Error getting understocked items: {str(e)}"
+            return self._localize_response(f"Error getting understocked items: {str(e)}", lang)
     
-    def _get_category_analysis(self):
+    def _get_category_analysis(self, lang='en', analysis=None):
         """Get category analysis"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+            analysis = analysis or self._get_analysis()
             category_analysis = analysis['category_analysis']
             
-            response = "Category Analysis\n\n"
+            blocks = [self.templates.render('category_analysis_header', lang)]
             for category in category_analysis:
-                response += f"{category['category']}\n"
-                response += f"   Products: {category['product_count']}\n"
-                response += f"   Total Stock: {category['total_stock']}\n"
-                response += f"   Total Sold: {category['total_sold']}\n"
-                response += f"   Avg Price: ₹{category['avg_price']:.0f}\n"
-                response += f"   Avg Trend: {category['avg_trend_score']:.0f}\n\n"
+                blocks.append(self.templates.render('category_block', lang, **category))
             
-            return response.strip()
+            return "\n\n".join(blocks)
             
         except Exception as e:
-            return f"Error getting category analysis: {str(e)}"
+            return self._localize_response(f"Error getting category analysis: {str(e)}", lang)
     
-    def _get_recommendations(self):
+    def _get_recommendations(self, lang='en', analysis=None):
         """Get recommendations based on analysis"""
         try:
-            analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+            analysis = analysis or self._get_analysis()
             
             recommendations = []
             
             # Health score recommendations
             health_score = analysis['health_score']
             if health_score >= 80:
-                recommendations.append("Excellent inventory health! Keep up the good work.")
+                recommendations.append(self.templates.render('health_excellent', lang))
             elif health_score >= 60:
-                recommendations.append("Good inventory health with room for improvement.")
+                recommendations.append(self.templates.render('health_good', lang))
             else:
-                recommendations.append("Inventory health needs attention. Consider the following actions:")
+                recommendations.append(self.templates.render('health_needs_attention', lang))
             
             # Specific recommendations
             if analysis['dead_stock']:
-                recommendations.append(f"• Consider discounting or liquidating {len(analysis['dead_stock'])} dead stock items")
+                recommendations.append(self.templates.render('rec_dead_stock', lang, count=len(analysis['dead_stock'])))
             
             if analysis['overstocked']:
-                recommendations.append(f"• Reduce stock levels for {len(analysis['overstocked'])} overstocked items")
+                recommendations.append(self.templates.render('rec_overstocked', lang, count=len(analysis['overstocked'])))
             
             if analysis['understocked']:
-                recommendations.append(f"• Increase stock levels for {len(analysis['understocked'])} understocked items")
+                recommendations.append(self.templates.render('rec_understocked', lang, count=len(analysis['understocked'])))
             
             # Stock-to-sales ratio recommendations
             ratio = analysis['summary']['stock_to_sales_ratio']
             if ratio > 2:
-                recommendations.append("• Overall stock levels are high relative to sales - consider reducing inventory")
+                recommendations.append(self.templates.render('rec_ratio_high', lang))
             elif ratio < 0.5:
-                recommendations.append("• Overall stock levels are low relative to sales - consider increasing inventory")
+                recommendations.append(self.templates.render('rec_ratio_low', lang))
             
             return "\n\n".join(recommendations)
             
         except Exception as e:
-            return f"Error getting recommendations: {str(e)}"
+            return self._localize_response(f"Error getting recommendations: {str(e)}", lang)
     
-    def _get_restock_plan(self, test_month: int = None):
+    def _get_restock_plan(self, test_month: int = None, lang='en'):
         """Generate and summarize the monthly restock plan, with optional test_month for testing."""
         try:
-            # Ensure data is loaded before generating the plan
-            if not self.forecasting_service.load_data():
-                return "Could not load data files for restock plan."
-            plan = self.forecasting_service.generate_restock_plan(test_month=test_month)
+            plan = self._get_restock_plan_data(test_month)
+            if plan is None:
+                return self.templates.render('restock_load_failed', lang)
             summary = plan.get('summary', {})
-            response_lines = ["Restock Plan Summary\n"]
-            response_lines.append(f"Forecast Period: {plan.get('forecast_period', 'N/A')}")
-            response_lines.append(f"Total Restock Quantity: {summary.get('total_restock_quantity', 0)}")
-            response_lines.append(f"Total Restock Value: Rs.{summary.get('total_restock_value', 0):,}")
-            response_lines.append(f"Products to Restock: {summary.get('products_to_restock', 0)}")
-            response_lines.append(f"Products to Reduce: {summary.get('products_to_reduce', 0)}\n")
-            response_lines.append("For detailed recommendations, download the PDF report below.")
+            response = self.templates.render(
+                'restock_plan_summary', lang,
+                forecast_period=plan.get('forecast_period', 'N/A'),
+                total_restock_quantity=summary.get('total_restock_quantity', 0),
+                total_restock_value=summary.get('total_restock_value', 0),
+                products_to_restock=summary.get('products_to_restock', 0),
+                products_to_reduce=summary.get('products_to_reduce', 0)
+            )
             # Generate PDF using previous FPDF/canvas-based implementation
             seller_id = 'default_seller'
-            pdf_path = self.forecasting_service.generate_restock_plan_pdf(seller_id, plan)
-            pdf_filename = os.path.basename(pdf_path)
-            response_lines.append(f"\nPDF Report Generated!\nDownload: `{pdf_filename}`")
-            return "\n".join(response_lines)
+            job_lines = self._queue_report(
+                'restock_plan', self.forecasting_service.generate_restock_plan_pdf, seller_id, plan, lang=lang
+            )
+            return f"{response}\n\n{job_lines}"
         except Exception as e:
-            return f"Error generating restock plan: {e}"
+            return self._localize_response(f"Error generating restock plan: {e}", lang)
     
     def _get_forecast_demand_response(self):
         """Return a chat response with product name, forecasted demand, and traffic light indicator for current month."""
         try:
-            if not self.forecasting_service.load_data():
+            forecast = self._get_demand_forecast()
+            if forecast is None:
                 return "Could not load data files for demand forecast."
-            forecast = self.forecasting_service.forecast_upcoming_demand(forecast_months=1)
             if not forecast:
                 return "No forecast data available."
             # Get the current forecast month (should be only one)
             forecast_month = list(forecast.keys())[0]
             month_data = forecast[forecast_month]
             # Prepare response
-            lines = [f"Product Demand Forecast for This Month:\n"]
+            lines = ["Product Demand Forecast for This Month:\n"]
             lines.append(f"{'Product':<30} {'Forecasted Sales':<18} Status")
             lines.append('-'*60)
             for product_id, info in month_data.items():
@@ -721,17 +770,17 @@ Average Monthly Sales: {summary['avg_monthly_sales']:.0f} units
         except Exception as e:
             return f"Error generating demand forecast: {str(e)}"
     
-    def _handle_product_listing_assistance(self, user_message):
-        """Stateless, robust product listing chat flow. Infer step from message content, echo input, and advance one step per message."""
+    def _handle_product_listing_assistance(self, user_message, session_id=None):
+        """Robust product listing chat flow. Infer step from message content, echo input, and advance one step per message.
+        The name and category given in earlier steps are kept per session in the session store."""
+        self._reply_state.stateful = True
         msg = user_message.strip()
         msg_lower = msg.lower()
         image_exts = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.tiff', '.svg')
 
-        # Static variables to store last name and category
-        if not hasattr(self, '_last_product_name'):
-            self._last_product_name = None
-        if not hasattr(self, '_last_product_category'):
-            self._last_product_category = None
+        # Name and category from earlier steps of this session's listing. Without a
+        # session ID nothing is kept, so no two clients ever share a listing
+        state = self.session_store.get(session_id) if session_id else {}
 
         # Step 1: Image upload
         if not msg or msg_lower in ['product listing assistance', 'list product', 'add product', 'new product', 'product addition']:
@@ -744,7 +793,9 @@ Average Monthly Sales: {summary['avg_monthly_sales']:.0f} units
             # Remove any leading 'name:' prefix again if present
             if name.lower().startswith('name:'):
                 name = name[5:].strip()
-            self._last_product_name = name
+            state['product_name'] = name
+            if session_id:
+                self.session_store.set(session_id, state)
             return f"Product name received: {name}\nWhat is the product category?"
         # Step 3: Category
         if msg_lower.startswith('category received:') or msg_lower.startswith('category:'):
@@ -752,13 +803,15 @@ Average Monthly Sales: {summary['avg_monthly_sales']:.0f} units
             # Remove any leading 'category:' prefix again if present
             if category.lower().startswith('category:'):
                 category = category[9:].strip()
-            self._last_product_category = category
+            state['product_category'] = category
+            if session_id:
+                self.session_store.set(session_id, state)
             return f"Category received: {category}\nWhat is the price of the product?"
         # Step 4: Price
         if msg_lower.startswith('price received:') or msg_lower.startswith('price:') or (msg and msg.replace('.', '', 1).isdigit()):
             price = msg.replace('price received:', '').replace('price:', '').replace('Price:', '').strip()
-            name = self._last_product_name or ''
-            category = self._last_product_category or ''
+            name = state.get('product_name') or ''
+            category = state.get('product_category') or ''
             # Remove 'name:' and 'category:' prefixes if present
             if name.lower().startswith('name:'):
                 name = name[5:].strip()
@@ -793,48 +846,20 @@ Average Monthly Sales: {summary['avg_monthly_sales']:.0f} units
             tags.append('trending')
             tags.append('best_price')
             tag_str = ', '.join([f"#{t}" for t in tags if t])
-            self._last_product_name = None
-            self._last_product_category = None
+            if session_id:
+                self.session_store.delete(session_id)
             return f"Price received: {price}\nThis product has been listed. Will show up in your inventory dashboard in one hour.\n\nRelevant SEO tags have also been generated for your product:\n{tag_str}"
         # Fallback
         return "Let's start by uploading an image of the product."
     
-    def _get_default_response(self):
+    def _get_default_response(self, lang='en'):
         """Get default response when intent is not recognized"""
-        return """
-SmartStock AI Assistant
-
-I can help you with inventory health management and sales analysis. Here are some things you can ask me:
-
-Inventory Analysis:
-• "Show inventory health summary"
-• "What are my most sold products?"
-• "What are my least sold products?"
-• "Show dead stock"
-• "Show overstocked items"
-• "Show understocked items"
-• "Analyze by category"
-
-Sales Analysis:
-• "Generate sales report"
-• "Show last year sales"
-• "Annual sales report"
-• "Sales performance analysis"
-
-Reports:
-• "Generate PDF report" (Inventory Health)
-• "Create inventory health report"
-• "Generate sales report" (Sales Analysis)
-
-Recommendations:
-• "Give me recommendations"
-• "What should I do?"
-""" 
+        return self.templates.render('default_help', lang)
 
     def _get_boost_profit_suggestions(self, user_message):
         """Return 2 dynamic, actionable profit-boosting suggestions, rotating on each call. Bundles relevant products together."""
         import random
-        analysis = self.inventory_pdf_generator.analyzer.analyze_inventory()
+        analysis = self._get_analysis()
         dead_stock = analysis.get('dead_stock', [])
         overstocked = analysis.get('overstocked', [])
         category_analysis = analysis.get('category_analysis', [])
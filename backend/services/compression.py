@@ -0,0 +1,47 @@
+import gzip
+from config import Config
+
+try:
+    import brotli
+except ImportError:  # optional; responses are gzipped without it
+    brotli = None
+
+# Response types worth compressing; images and PDFs are compressed already
+COMPRESSIBLE_MIMETYPES = {
+    'application/json',
+    'application/x-ndjson',
+    'text/csv',
+    'text/html',
+    'text/plain',
+}
+
+def available_encodings():
+    """Content codings this server can produce, preferred first"""
+    return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+def compress(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=Config.RESPONSE_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=Config.RESPONSE_GZIP_LEVEL)
+
+def compress_response(response, accept_encodings):
+    """
+    Compress a buffered text or JSON response with the best coding the client
+    accepts, once it is at least Config.RESPONSE_COMPRESS_MIN_BYTES long.
+    Streamed responses (exports, SSE, files) are passed through untouched.
+    """
+    if (response.status_code < 200 or response.status_code in (204, 304)
+            or response.is_streamed or response.direct_passthrough
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in COMPRESSIBLE_MIMETYPES):
+        return response
+    data = response.get_data()
+    if len(data) < Config.RESPONSE_COMPRESS_MIN_BYTES:
+        return response
+    response.vary.add('Accept-Encoding')
+    encoding = accept_encodings.best_match(available_encodings())
+    if encoding is None:
+        return response
+    response.set_data(compress(data, encoding))
+    response.headers['Content-Encoding'] = encoding
+    return response
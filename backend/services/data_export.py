@@ -0,0 +1,203 @@
+import csv
+import io
+import json
+import math
+import zipfile
+from xml.sax.saxutils import escape
+import numpy as np
+import pandas as pd
+from config import Config
+from services.product_store import STORE_COLUMNS, get_product_store
+
+# Format -> (mimetype, file extension)
+EXPORT_FORMATS = {
+    'csv': ('text/csv', 'csv'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+    'xlsx': ('application/vnd.openxmlformats-officedocument.spreadsheetml.sheet', 'xlsx'),
+}
+
+def _plain(value):
+    """JSON/CSV friendly value: NumPy scalars unwrapped, NaN as None, dates as ISO strings"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return None if pd.isna(value) else pd.Timestamp(value).isoformat()
+    return value
+
+def _batches(rows, size):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def iter_csv(columns, rows):
+    """Encoded CSV text, one batch of rows per chunk"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for batch in _batches(rows, Config.EXPORT_CHUNK_ROWS):
+        writer.writerows([['' if value is None else value for value in map(_plain, row)] for row in batch])
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+def iter_ndjson(columns, rows):
+    """One JSON object per line, one batch of rows per chunk"""
+    for batch in _batches(rows, Config.EXPORT_CHUNK_ROWS):
+        lines = [json.dumps(dict(zip(columns, map(_plain, row))), default=str) for row in batch]
+        yield ('\n'.join(lines) + '\n').encode('utf-8')
+
+class _ChunkWriter:
+    """Write-only file object whose written bytes are collected and drained by a generator"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+_XLSX_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+def _xlsx_workbook(sheet_name):
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets><sheet name="{escape(sheet_name[:31])}" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    )
+
+def _column_letters(count):
+    letters = []
+    for index in range(count):
+        name = ''
+        index += 1
+        while index:
+            index, remainder = divmod(index - 1, 26)
+            name = chr(65 + remainder) + name
+        letters.append(name)
+    return letters
+
+def _xlsx_row(number, letters, values):
+    cells = []
+    for letter, value in zip(letters, map(_plain, values)):
+        ref = f'{letter}{number}'
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            cells.append(f'<c r="{ref}" t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, (int, float)):
+            cells.append(f'<c r="{ref}"><v>{value}</v></c>')
+        else:
+            cells.append(f'<c r="{ref}" t="inlineStr"><is><t>{escape(str(value))}</t></is></c>')
+    return f'<row r="{number}">{"".join(cells)}</row>'
+
+def iter_xlsx(columns, rows, sheet_name='Export'):
+    """
+    A single-sheet XLSX workbook written straight into a zip stream. Cells use
+    inline strings, so no shared string table has to be held in memory.
+    """
+    out = _ChunkWriter()
+    letters = _column_letters(len(columns))
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        archive.writestr('xl/workbook.xml', _xlsx_workbook(sheet_name))
+        yield out.drain()
+        with archive.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write(b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                        b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>')
+            sheet.write(_xlsx_row(1, letters, columns).encode('utf-8'))
+            number = 1
+            for batch in _batches(rows, Config.EXPORT_CHUNK_ROWS):
+                xml = []
+                for row in batch:
+                    number += 1
+                    xml.append(_xlsx_row(number, letters, row))
+                sheet.write(''.join(xml).encode('utf-8'))
+                yield out.drain()
+            sheet.write(b'</sheetData></worksheet>')
+    yield out.drain()
+
+def stream_export(fmt, columns, rows, sheet_name='Export'):
+    """Byte chunks of rows exported as csv, ndjson or xlsx"""
+    if fmt == 'csv':
+        return iter_csv(columns, rows)
+    if fmt == 'ndjson':
+        return iter_ndjson(columns, rows)
+    if fmt == 'xlsx':
+        return iter_xlsx(columns, rows, sheet_name)
+    raise ValueError(f"Unsupported export format: {fmt}")
+
+def product_rows():
+    """Columns and rows of the product analysis snapshot"""
+    store = get_product_store()
+    columns = list(STORE_COLUMNS)
+    arrays = [store.columns[column] for column in columns]
+    return columns, (tuple(values[row] for values in arrays) for row in range(store.size))
+
+def sales_rows():
+    """Columns and rows of the sales file, read in chunks rather than all at once"""
+    columns = list(pd.read_csv(Config.SALES_CSV_PATH, nrows=0).columns)
+    def rows():
+        for chunk in pd.read_csv(Config.SALES_CSV_PATH, chunksize=Config.EXPORT_CHUNK_ROWS):
+            yield from chunk.itertuples(index=False, name=None)
+    return [column.lower().replace(' ', '_') for column in columns], rows()
+
+RESTOCK_COLUMNS = ['month', 'product_id', 'name', 'category', 'current_stock',
+                   'forecasted_demand', 'recommended_restock', 'reason']
+
+def restock_rows(restock_plan):
+    """Columns and one row per product recommendation of a restock plan"""
+    def rows():
+        for month, month_plan in restock_plan.get('monthly_plans', {}).items():
+            for rec in month_plan.get('product_recommendations', []):
+                yield (month, rec.get('product_id'), rec.get('name', rec.get('product_name')),
+                       rec.get('category'), rec.get('current_stock'), rec.get('forecasted_demand'),
+                       rec.get('recommended_restock'), rec.get('reason', ''))
+    return RESTOCK_COLUMNS, rows()
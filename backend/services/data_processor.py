@@ -1,8 +1,7 @@
 import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from config import Config
+from services.fast_json import frame_records
 
 class DataProcessor:
     def __init__(self):
@@ -246,9 +245,9 @@ class DataProcessor:
         # Ensure required columns exist
         self.combined_df = self._ensure_required_columns(self.combined_df)
         
-        return self.combined_df.nlargest(top_n, 'total_sold')[
+        return frame_records(self.combined_df.nlargest(top_n, 'total_sold'),
             ['name', 'category', 'total_sold', 'stock_quantity', 'trend_score']
-        ].to_dict('records')
+        )
     
     def get_least_sold_products(self, top_n=5):
         """Get least sold products"""
@@ -258,9 +257,9 @@ class DataProcessor:
         # Ensure required columns exist
         self.combined_df = self._ensure_required_columns(self.combined_df)
         
-        return self.combined_df.nsmallest(top_n, 'total_sold')[
+        return frame_records(self.combined_df.nsmallest(top_n, 'total_sold'),
             ['name', 'category', 'total_sold', 'stock_quantity', 'trend_score']
-        ].to_dict('records')
+        )
     
     def get_dead_stock(self):
         """Get dead stock products"""
@@ -271,9 +270,9 @@ class DataProcessor:
         self.combined_df = self._ensure_required_columns(self.combined_df)
         
         dead_stock = self.combined_df[self.combined_df['is_dead_stock'] == True]
-        return dead_stock[
+        return frame_records(dead_stock,
             ['name', 'category', 'stock_quantity', 'total_sold', 'price']
-        ].to_dict('records')
+        )
     
     def get_overstocked_products(self, top_n=10):
         """Get overstocked products"""
@@ -284,9 +283,9 @@ class DataProcessor:
         self.combined_df = self._ensure_required_columns(self.combined_df)
         
         overstocked = self.combined_df[self.combined_df['is_overstocked'] == True]
-        return overstocked.nlargest(top_n, 'stock_sales_ratio')[
+        return frame_records(overstocked.nlargest(top_n, 'stock_sales_ratio'),
             ['name', 'category', 'stock_quantity', 'total_sold', 'stock_sales_ratio', 'price']
-        ].to_dict('records')
+        )
     
     def get_understocked_products(self):
         """Get understocked products"""
@@ -297,9 +296,9 @@ class DataProcessor:
         self.combined_df = self._ensure_required_columns(self.combined_df)
         
         understocked = self.combined_df[self.combined_df['is_understocked'] == True]
-        return understocked[
+        return frame_records(understocked,
             ['name', 'category', 'stock_quantity', 'total_sold', 'restock_threshold', 'price', 'stock_sales_ratio']
-        ].to_dict('records')
+        )
     
     def get_last_week_sales(self, top_n=5):
         """Get last week sales data"""
@@ -309,9 +308,9 @@ class DataProcessor:
         # Ensure required columns exist
         self.combined_df = self._ensure_required_columns(self.combined_df)
         
-        return self.combined_df.nlargest(top_n, 'last_week_sales')[
+        return frame_records(self.combined_df.nlargest(top_n, 'last_week_sales'),
             ['name', 'category', 'last_week_sales', 'total_sold']
-        ].to_dict('records')
+        )
     
     def get_category_analysis(self):
         """Get category-wise analysis"""
@@ -334,7 +333,7 @@ class DataProcessor:
             'avg_price', 'avg_trend_score'
         ]
         
-        return category_analysis.to_dict('records')
+        return frame_records(category_analysis)
     
     def get_summary_stats(self):
         """Get overall summary statistics"""
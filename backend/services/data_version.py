@@ -0,0 +1,49 @@
+import hashlib
+import threading
+import time
+from config import Config
+
+_lock = threading.Lock()
+_cached_version = None
+_checked_at = 0.0
+
+def data_files():
+    """Files whose contents feed the analysis, forecasts and reports"""
+    return [
+        Config.INVENTORY_CSV_PATH,
+        Config.SALES_CSV_PATH,
+        Config.TRENDS_CSV_PATH,
+        Config.FESTIVAL_CSV_PATH,
+        Config.UPLOADED_CSV_PATH,
+    ]
+
+def compute_data_version():
+    """Fingerprint of the data files from their size and modification time"""
+    digest = hashlib.sha1()
+    for path in data_files():
+        try:
+            stat = path.stat()
+            digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+        except FileNotFoundError:
+            digest.update(f"{path.name}:missing;".encode())
+    return digest.hexdigest()[:16]
+
+def get_data_version(max_age=None):
+    """
+    Current data version. The files are stat'ed at most once per max_age seconds
+    (Config.DATA_VERSION_CHECK_INTERVAL by default) so hot paths can call this freely.
+    """
+    global _cached_version, _checked_at
+    max_age = Config.DATA_VERSION_CHECK_INTERVAL if max_age is None else max_age
+    now = time.monotonic()
+    with _lock:
+        if _cached_version is None or now - _checked_at >= max_age:
+            _cached_version = compute_data_version()
+            _checked_at = now
+        return _cached_version
+
+def invalidate_data_version():
+    """Force the next get_data_version call to re-read the files, e.g. after an upload"""
+    global _cached_version
+    with _lock:
+        _cached_version = None
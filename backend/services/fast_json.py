@@ -0,0 +1,97 @@
+import datetime
+import decimal
+import json
+import math
+import numpy as np
+import pandas as pd
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional; the standard library encoder is used without it
+    orjson = None
+
+def _default(value):
+    """Values neither encoder handles natively: NumPy types, pandas timestamps, sets and decimals"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if value is pd.NaT:
+        return None
+    if isinstance(value, (datetime.date, pd.Timestamp)):
+        return value.isoformat()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, decimal.Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _key(key):
+    """Dict key as the string orjson's OPT_NON_STR_KEYS would write"""
+    if isinstance(key, np.generic):
+        key = key.item()
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, bool):
+        return json.dumps(key)
+    if isinstance(key, (datetime.date, pd.Timestamp)):
+        return key.isoformat()
+    return str(key)
+
+def _normalize(value):
+    """Plain JSON types throughout, with non-finite floats as None like orjson writes them"""
+    if isinstance(value, dict):
+        return {_key(key): _normalize(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset, np.ndarray)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not math.isfinite(value):
+        return None
+    return value
+
+def dumps(obj, sort_keys=False, indent=False):
+    """
+    JSON encoded as UTF-8 bytes. Uses orjson when it is installed, with NumPy
+    arrays and scalars serialized natively and NaN written as null. Values orjson
+    refuses (NumPy dict keys, integers beyond 64 bits, object arrays) and
+    installs without orjson go through the standard library encoder after
+    _normalize(), which produces the same JSON.
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            pass
+    return json.dumps(_normalize(obj), default=_default, sort_keys=sort_keys, indent=2 if indent else None,
+                      separators=None if indent else (',', ':'), ensure_ascii=False,
+                      allow_nan=False).encode('utf-8')
+
+def frame_records(df, columns=None):
+    """
+    Rows of a DataFrame as a list of dicts, built column by column. Each column
+    is converted to Python values in one tolist() call instead of boxing every
+    cell the way to_dict('records') does.
+    """
+    columns = list(df.columns if columns is None else columns)
+    values = [df[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes jsonify responses with dumps() above"""
+
+    def dumps(self, obj, **kwargs):
+        return dumps(obj, sort_keys=kwargs.get('sort_keys', self.sort_keys),
+                     indent=bool(kwargs.get('indent'))).decode('utf-8')
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = self.compact is False or (self.compact is None and self._app.debug)
+        return self._app.response_class(dumps(obj, sort_keys=self.sort_keys, indent=indent),
+                                        mimetype=self.mimetype)
@@ -1,14 +1,10 @@
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List
 import sys
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import inch
-import os
+from services.restock_pdf_generator import RestockPlanPDFGenerator
+from services.fast_json import frame_records
 
 class ForecastingService:
     def __init__(self):
@@ -18,6 +14,7 @@ class ForecastingService:
         self.festival_df = None
         self.current_month = datetime.now().month
         self.current_year = datetime.now().year
+        self.pdf_generator = RestockPlanPDFGenerator()
         
     def load_data(self):
         """Load all required data files"""
@@ -37,7 +34,7 @@ class ForecastingService:
                 print(self.sales_df.tail(20))
                 # Use correct date parser for MM/DD/YYYY
                 self.sales_df['sales_date'] = pd.to_datetime(self.sales_df['sales_date'], format='%m/%d/%Y', errors='coerce')
-                print(f"✅ Parsed sales_date (MM/DD/YYYY). Rows with NaT in sales_date:")
+                print("✅ Parsed sales_date (MM/DD/YYYY). Rows with NaT in sales_date:")
                 print(self.sales_df[self.sales_df['sales_date'].isna()])
                 print(f"✅ Loaded sales data: {len(self.sales_df)} sales records (after date parse)")
             
@@ -111,7 +108,7 @@ class ForecastingService:
             'quantity_sold': ['mean', 'std', 'max', 'min']
         }).reset_index()
         avg_monthly_demand.columns = ['product_id', 'avg_demand_12m', 'demand_std_12m', 'max_demand_12m', 'min_demand_12m']
-        return avg_monthly_demand.to_dict('records')
+        return frame_records(avg_monthly_demand)
     
     def analyze_festival_seasonal_patterns(self) -> Dict:
         """Analyze festival and seasonal demand patterns"""
@@ -304,7 +301,6 @@ class ForecastingService:
         
         # Analyze overall trends
         total_restock_value = restock_plan['summary']['total_restock_value']
-        products_to_restock = restock_plan['summary']['products_to_restock']
         
         if total_restock_value > 50000:
             recommendations.append({
@@ -453,116 +449,4 @@ class ForecastingService:
 
     def generate_restock_plan_pdf(self, seller_id: str, restock_plan: dict) -> str:
         """Generate a PDF report for the restock plan and return the file path"""
-        reports_dir = os.path.join(os.path.dirname(__file__), '..', 'reports')
-        os.makedirs(reports_dir, exist_ok=True)
-        filename = f"restock_plan_report_{seller_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        file_path = os.path.join(reports_dir, filename)
-        c = canvas.Canvas(file_path, pagesize=letter)
-        width, height = letter
-        y = height - inch
-        # Add more spacing and better formatting
-        c.setFillColorRGB(0.29, 0.08, 0.55)  # Purple header
-        c.rect(0, height - 1.2*inch, width, 0.6*inch, fill=1, stroke=0)
-        c.setFillColorRGB(1, 1, 1)
-        c.setFont("Helvetica-Bold", 20)
-        c.drawString(inch, height - 0.95*inch, "Monthly Restock Plan Report")
-        c.setFillColorRGB(0, 0, 0)
-        y = height - 1.4 * inch
-        c.setFont("Helvetica", 12)
-        c.drawString(inch, y, f"Generated: {restock_plan.get('generated_date', '')}")
-        y -= 0.3 * inch
-        summary = restock_plan.get('summary', {})
-        c.setFont("Helvetica-Bold", 13)
-        c.drawString(inch, y, f"Forecast Period: {restock_plan.get('forecast_period', '')}")
-        y -= 0.22 * inch
-        c.setFont("Helvetica-Bold", 12)
-        c.drawString(inch, y, f"Total Restock Quantity: {summary.get('total_restock_quantity', 0)}")
-        y -= 0.18 * inch
-        c.drawString(inch, y, f"Total Restock Value: Rs.{summary.get('total_restock_value', 0):,}")
-        y -= 0.18 * inch
-        c.drawString(inch, y, f"Products to Restock: {summary.get('products_to_restock', 0)}")
-        y -= 0.18 * inch
-        c.drawString(inch, y, f"Products to Reduce: {summary.get('products_to_reduce', 0)}")
-        y -= 0.3 * inch
-        c.setFont("Helvetica-Bold", 13)
-        c.drawString(inch, y, "Restock Recommendations (2 Months)")
-        y -= 0.22 * inch
-        c.setFont("Helvetica-Bold", 11)
-        # Table header
-        c.setFillColorRGB(0.93, 0.91, 0.98)
-        c.rect(inch-0.1*inch, y-0.04*inch, 6.2*inch, 0.22*inch, fill=1, stroke=0)
-        c.setFillColorRGB(0.29, 0.08, 0.55)
-        c.drawString(inch+0.05*inch, y, "Month")
-        c.drawString(inch+0.8*inch, y, "Product Name")
-        c.drawString(inch+2.8*inch, y, "Category")
-        c.drawString(inch+3.8*inch, y, "Stock")
-        c.drawString(inch+4.4*inch, y, "Demand")
-        c.drawString(inch+5.2*inch, y, "Restock")
-        c.drawString(inch+6.0*inch, y, "Reason")
-        y -= 0.22 * inch
-        c.setFont("Helvetica", 10)
-        row_num = 0
-        for month, month_plan in restock_plan.get('monthly_plans', {}).items():
-            for rec in month_plan.get('product_recommendations', []):
-                if y < inch:
-                    # Footer with page number
-                    c.setFont("Helvetica-Oblique", 9)
-                    c.setFillColorRGB(0.5, 0.5, 0.5)
-                    c.drawRightString(width - inch, 0.7*inch, f"Page {int(c.getPageNumber())}")
-                    c.showPage()
-                    y = height - 1.4 * inch
-                    c.setFont("Helvetica", 10)
-                # Alternate row shading
-                if row_num % 2 == 0:
-                    c.setFillColorRGB(0.98, 0.97, 1)
-                else:
-                    c.setFillColorRGB(1, 1, 1)
-                c.rect(inch-0.1*inch, y-0.04*inch, 6.2*inch, 0.19*inch, fill=1, stroke=0)
-                c.setFillColorRGB(0, 0, 0)
-                c.drawString(inch+0.05*inch, y, str(month))
-                c.drawString(inch+0.8*inch, y, f"{rec.get('name', rec.get('product_name', ''))[:18]}")
-                c.drawString(inch+2.8*inch, y, f"{rec['category'][:10]}")
-                c.drawString(inch+3.8*inch, y, f"{rec['current_stock']}")
-                c.drawString(inch+4.4*inch, y, f"{rec['forecasted_demand']}")
-                c.drawString(inch+5.2*inch, y, f"{rec['recommended_restock']}")
-                # Reason: festival/season or high demand
-                reason = rec.get('reason', '')
-                c.setFont("Helvetica-Oblique", 9)
-                c.setFillColorRGB(0.29, 0.08, 0.55)
-                c.drawString(inch+6.0*inch, y, reason)
-                c.setFont("Helvetica", 10)
-                c.setFillColorRGB(0, 0, 0)
-                y -= 0.19 * inch
-                row_num += 1
-            y -= 0.08 * inch
-        # High-level recommendations section
-        c.setFont("Helvetica-Bold", 12)
-        if y < 1.2*inch:
-            c.setFont("Helvetica-Oblique", 9)
-            c.setFillColorRGB(0.5, 0.5, 0.5)
-            c.drawRightString(width - inch, 0.7*inch, f"Page {int(c.getPageNumber())}")
-            c.showPage()
-            y = height - 1.4 * inch
-        c.setFillColorRGB(0, 0, 0)
-        # Remove all previous summary and recommendations headings and text. Only show top 3 categories by restock quantity.
-        # At the bottom of the Summary section, add top 3 categories by restock quantity
-        category_restock = {}
-        for month_plan in restock_plan.get('monthly_plans', {}).values():
-            for rec in month_plan.get('product_recommendations', []):
-                qty = rec['recommended_restock']
-                if qty > 0:
-                    cat = rec['category']
-                    category_restock[cat] = category_restock.get(cat, 0) + qty
-        if category_restock:
-            top_cats = sorted(category_restock.items(), key=lambda x: x[1], reverse=True)[:3]
-            cat_str = ', '.join([f"{cat} ({qty})" for cat, qty in top_cats])
-            y -= 0.18 * inch
-            c.setFont("Helvetica", 10)
-            c.setFillColorRGB(0, 0, 0)
-            c.drawString(inch, y, f"Highest restock quantities required for: {cat_str}")
-        # Final footer
-        c.setFont("Helvetica-Oblique", 9)
-        c.setFillColorRGB(0.5, 0.5, 0.5)
-        c.drawRightString(width - inch, 0.7*inch, f"Page {int(c.getPageNumber())}")
-        c.save()
-        return file_path 
\ No newline at end of file
+        return str(self.pdf_generator.generate_restock_plan_pdf(seller_id, restock_plan))
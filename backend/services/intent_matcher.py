@@ -0,0 +1,167 @@
+from collections import Counter, defaultdict, deque
+
+
+class IntentMatcher:
+    """Multi-keyword matcher for chatbot intents.
+
+    Builds an Aho-Corasick automaton over every keyword once, then scans a
+    message in a single pass and reports every (possibly overlapping) keyword
+    hit. Intents are resolved by the order the keyword groups were given in,
+    so the result is deterministic no matter where in the message a keyword
+    appears or how many intents/languages are registered.
+    """
+
+    def __init__(self, keyword_groups):
+        """
+        keyword_groups is an ordered iterable of (intent, keywords) pairs.
+        Earlier groups win when a message contains keywords from several.
+        """
+        self.intents = []
+        self._priority = {}
+        # Trie stored as parallel lists indexed by node id
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for intent, keywords in keyword_groups:
+            if intent not in self._priority:
+                self._priority[intent] = len(self.intents)
+                self.intents.append(intent)
+            for keyword in keywords:
+                keyword = keyword.lower().strip()
+                if keyword:
+                    self._add_keyword(keyword, intent)
+        self._build_failure_links()
+
+    def _add_keyword(self, keyword, intent):
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((keyword, intent))
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                # Inherit matches that end at the fallback state
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find_all(self, text):
+        """Return every keyword hit in text as (end_index, keyword, intent)."""
+        hits = []
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for keyword, intent in output[node]:
+                hits.append((index, keyword, intent))
+        return hits
+
+    def match(self, text):
+        """Return the highest priority intent whose keyword occurs in text, or None."""
+        intents = {intent for _, _, intent in self.find_all(text.lower())}
+        if not intents:
+            return None
+        return min(intents, key=self._priority.__getitem__)
+
+
+def _ngrams(text, n):
+    """Character n-grams of text padded with a space on each side."""
+    padded = f" {text} "
+    return {padded[i:i + n] for i in range(len(padded) - n + 1)}
+
+
+def _edit_distance(a, b):
+    """Levenshtein distance counting an adjacent transposition as one edit."""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[len(b)]
+
+
+class FuzzyIntentMatcher:
+    """Typo-tolerant matcher for messages no keyword matched exactly.
+
+    Keywords are indexed once by their character n-grams. A message only
+    considers the few keywords sharing the most n-grams with it and finds the
+    closest message window of the same word count by n-gram overlap (Dice
+    coefficient). Edit distance is computed for that window alone, and its
+    normalized similarity is the confidence of the match.
+    """
+
+    def __init__(self, keyword_groups, n=3, threshold=None, max_candidates=8, min_overlap=0.5):
+        self.n = n
+        self.threshold = threshold
+        self.max_candidates = max_candidates
+        self.min_overlap = min_overlap
+        self._priority = {}
+        self._keywords = []
+        self._index = defaultdict(list)
+
+        for intent, keywords in keyword_groups:
+            self._priority.setdefault(intent, len(self._priority))
+            for keyword in keywords:
+                keyword = ' '.join(keyword.lower().split())
+                if not keyword:
+                    continue
+                grams = _ngrams(keyword, n)
+                keyword_id = len(self._keywords)
+                self._keywords.append((keyword, intent, len(keyword.split()), grams))
+                for gram in grams:
+                    self._index[gram].append(keyword_id)
+
+    def scores(self, text):
+        """Return (confidence, intent, keyword) for the candidate keywords, best first."""
+        words = text.lower().split()
+        shared = Counter()
+        for gram in _ngrams(' '.join(words), self.n):
+            for keyword_id in self._index.get(gram, ()):
+                shared[keyword_id] += 1
+
+        results = []
+        for keyword_id, _ in shared.most_common(self.max_candidates):
+            keyword, intent, width, grams = self._keywords[keyword_id]
+            best_overlap, best_window = 0.0, None
+            for start in range(max(1, len(words) - width + 1)):
+                window = ' '.join(words[start:start + width])
+                window_grams = _ngrams(window, self.n)
+                overlap = 2 * len(window_grams & grams) / (len(window_grams) + len(grams))
+                if overlap > best_overlap:
+                    best_overlap, best_window = overlap, window
+            if best_overlap < self.min_overlap:
+                continue
+            distance = _edit_distance(best_window, keyword)
+            results.append((1 - distance / max(len(best_window), len(keyword)), intent, keyword))
+        results.sort(key=lambda result: (-result[0], self._priority[result[1]]))
+        return results
+
+    def match(self, text):
+        """Return (intent, confidence) of the best keyword at or above the threshold, or None."""
+        results = self.scores(text)
+        if not results:
+            return None
+        confidence, intent, _ = results[0]
+        if self.threshold is not None and confidence < self.threshold:
+            return None
+        return intent, round(confidence, 3)
@@ -1,13 +1,9 @@
 import pandas as pd
 import json
-import os
-from datetime import datetime, timedelta
-import matplotlib.pyplot as plt
-import seaborn as sns
-from io import BytesIO
 import base64
-import numpy as np
+from config import Config
 from services.data_processor import DataProcessor
+from services.chart_service import CHARTS, get_chart_service
 
 class InventoryHealthAnalyzer:
     def __init__(self):
@@ -99,55 +95,9 @@ class InventoryHealthAnalyzer:
     
     def generate_analytics_charts(self):
         """Generate analytics charts as base64 encoded images"""
-        charts = {}
-        
-        # Stock vs Sales Chart
-        plt.figure(figsize=(10, 6))
-        plt.scatter(self.df['total_sold'], self.df['stock'], alpha=0.7)
-        plt.xlabel('Total Sold')
-        plt.ylabel('Current Stock')
-        plt.title('Stock vs Sales Analysis')
-        plt.grid(True, alpha=0.3)
-        
-        # Add trend line
-        z = np.polyfit(self.df['total_sold'], self.df['stock'], 1)
-        p = np.poly1d(z)
-        plt.plot(self.df['total_sold'], p(self.df['total_sold']), "r--", alpha=0.8)
-        
-        # Save chart
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        charts['stock_vs_sales'] = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        
-        # Category Analysis Chart
-        category_data = self.df.groupby('category').agg({
-            'stock': 'sum',
-            'total_sold': 'sum'
-        }).reset_index()
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Stock by category
-        ax1.bar(category_data['category'], category_data['stock'])
-        ax1.set_title('Stock by Category')
-        ax1.set_ylabel('Stock')
-        ax1.tick_params(axis='x', rotation=45)
-        
-        # Sales by category
-        ax2.bar(category_data['category'], category_data['total_sold'])
-        ax2.set_title('Sales by Category')
-        ax2.set_ylabel('Total Sold')
-        ax2.tick_params(axis='x', rotation=45)
-        
-        plt.tight_layout()
-        
-        # Save chart
-        buffer = BytesIO()
-        plt.savefig(buffer, format='png', dpi=300, bbox_inches='tight')
-        buffer.seek(0)
-        charts['category_analysis'] = base64.b64encode(buffer.getvalue()).decode()
-        plt.close()
-        
-        return charts 
\ No newline at end of file
+        # Rendered from the current data snapshot and cached until the data changes
+        chart_service = get_chart_service()
+        return {
+            chart: base64.b64encode(chart_service.render(chart, 'png', dpi=Config.CHART_DPI)).decode()
+            for chart in CHARTS
+        }
@@ -1,7 +1,79 @@
 from fpdf import FPDF
 from datetime import datetime
+from functools import lru_cache
+from operator import itemgetter
 from config import Config
-import os
+from services.report_cache import get_report_cache
+import struct
+
+def iter_table_rows(source):
+    """
+    Yield rows from a DataFrame, an iterable of DataFrame chunks (such as
+    pd.read_csv(..., chunksize=n)) or any iterable of rows, one row at a time.
+    Frame rows come out as tuples.
+    """
+    if hasattr(source, 'itertuples'):
+        source = [source]
+    for item in source:
+        if hasattr(item, 'itertuples'):
+            yield from item.itertuples(index=False, name=None)
+        else:
+            yield item
+
+def _png_size(path):
+    """(width, height) in pixels read from a PNG header"""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    return struct.unpack('>II', header[16:24])
+
+def _pdf_text(value):
+    # Core PDF fonts only cover latin-1
+    return str(value).encode('latin-1', 'replace').decode('latin-1')
+
+# Character widths of the core fonts, by font key, shared by every report
+_CHAR_WIDTHS = {}
+
+@lru_cache(maxsize=8192)
+def _fit_text(font_key, font_size, width, text):
+    """text, shortened with '...' if needed to fit width at font_size (in user units)"""
+    widths = _CHAR_WIDTHS[font_key]
+    scale = font_size / 1000
+    if sum(widths.get(char, 0) for char in text) * scale <= width:
+        return text
+    used = sum(widths.get(char, 0) for char in '...') * scale
+    for index, char in enumerate(text):
+        used += widths.get(char, 0) * scale
+        if used > width:
+            return text[:index] + '...'
+    return text
+
+class TableLayout:
+    """
+    Column labels, widths and value accessors of a table, resolved once where the
+    layout is defined. Each column is (label, width[, value[, fmt]]): value is a
+    row key, a tuple index or a callable (default: the column position) and fmt a
+    str.format pattern for the cell text.
+    """
+
+    def __init__(self, columns):
+        self.labels = []
+        self.widths = []
+        self.getters = []
+        self.formats = []
+        for position, column in enumerate(columns):
+            label, width = column[0], column[1]
+            value = column[2] if len(column) > 2 else position
+            self.labels.append(label)
+            self.widths.append(width)
+            self.getters.append(value if callable(value) else itemgetter(value))
+            self.formats.append(column[3] if len(column) > 3 else '{}')
+        self.width = sum(self.widths)
+
+    def values(self, row):
+        return [getter(row) for getter in self.getters]
+
+    def texts(self, values):
+        return ['' if value is None else fmt.format(value) for fmt, value in zip(self.formats, values)]
 
 class BasePDFReport(FPDF):
     def __init__(self, title="SmartStock AI Report"):
@@ -30,22 +102,128 @@ class BasePDFReport(FPDF):
         self.cell(0, 10, title, ln=True)
         self.ln(5)
 
+    def add_chart(self, title, image_path, width=190):
+        """Embed a chart image, starting a new page if it does not fit on this one"""
+        pixels_wide, pixels_high = _png_size(image_path)
+        height = width * pixels_high / pixels_wide
+        if self.get_y() + height + 15 > self.page_break_trigger:
+            self.add_page()
+        self.chapter_title(title)
+        self.image(str(image_path), x=(self.w - width) / 2, w=width, h=height)
+        self.ln(5)
+
+    def fit_text(self, text, width):
+        """text made latin-1 safe and shortened to fit a cell of the given width"""
+        font_key = self.font_family + self.font_style
+        if font_key not in _CHAR_WIDTHS:
+            _CHAR_WIDTHS[font_key] = self.current_font['cw']
+        return _fit_text(font_key, self.font_size, width - 2 * self.c_margin, _pdf_text(text))
+
+    def add_key_values(self, title, items):
+        """A section of 'label: value' lines"""
+        if title:
+            self.chapter_title(title)
+        self.set_font('Arial', '', 10)
+        self.set_text_color(0, 0, 0)
+        for label, value in items:
+            self.cell(0, 6, _pdf_text(f'{label}: {value}'), ln=True)
+        self.ln(5)
+
+    def _table_header(self):
+        layout, header_color, text_color, _ = self._table
+        self.set_font('Arial', 'B', 10)
+        self.set_text_color(*header_color)
+        last = len(layout.widths) - 1
+        for index, (label, width) in enumerate(zip(layout.labels, layout.widths)):
+            self.cell(width, 8, self.fit_text(label, width), border=1, ln=index == last)
+        self.set_font('Arial', '', 9)
+        self.set_text_color(*text_color)
+        self.set_fill_color(250, 247, 255)  # shading of striped rows
+
+    def _table_row(self, texts, widths, height=6, fill=False):
+        # Break pages ourselves so every page starts with the column header
+        if self.get_y() + height > self.page_break_trigger:
+            self.add_page()
+            style = self.font_style
+            self._table_header()
+            self.set_font('Arial', style, 9)
+        last = len(widths) - 1
+        for index, (text, width) in enumerate(zip(texts, widths)):
+            self.cell(width, height, self.fit_text(text, width), border=1, ln=index == last, fill=fill)
+
+    def add_table(self, title, layout, rows, max_rows=None, total_column=None,
+                  header_color=(0, 0, 0), text_color=(0, 0, 0), striped=False):
+        """
+        Write a table whose rows are consumed one at a time from rows (see
+        iter_table_rows), so no list of records is ever built. layout is a
+        TableLayout. After max_rows detail rows the rest of the table is
+        summarized: consecutive rows sharing the first column collapse into one
+        line with their count and the sum of column total_column in the last column.
+        Returns (rows written, rows summarized).
+        """
+        max_rows = Config.REPORT_TABLE_MAX_ROWS if max_rows is None else max_rows
+        if title:
+            self.chapter_title(title)
+        self._table = (layout, header_color, text_color, striped)
+        self._table_header()
+        written = summarized = 0
+        group = None  # [key, rows, total] of the summary line being accumulated
+        for row in iter_table_rows(rows):
+            values = layout.values(row)
+            if written < max_rows:
+                self._table_row(layout.texts(values), layout.widths, fill=striped and written % 2 == 0)
+                written += 1
+                continue
+            if summarized == 0:
+                self.set_font('Arial', 'I', 9)
+                note = f'Rows beyond the first {max_rows} are combined per {layout.labels[0].lower()}'
+                self._table_row([note], [layout.width])
+                self.set_font('Arial', '', 9)
+            summarized += 1
+            total = values[total_column] if total_column is not None else 0
+            if group is not None and group[0] == values[0]:
+                group[1] += 1
+                group[2] += total
+                continue
+            if group is not None:
+                self._table_summary_row(layout, group)
+            group = [values[0], 1, total]
+        if group is not None:
+            self._table_summary_row(layout, group)
+        self.set_text_color(0, 0, 0)
+        self.ln(5)
+        return written, summarized
+
+    def _table_summary_row(self, layout, group):
+        key, count, total = group
+        texts = [str(key), f'{count} rows combined'] + [''] * (len(layout.widths) - 2)
+        texts[-1] = str(total)
+        self._table_row(texts, layout.widths)
+
 class BasePDFGenerator:
     def __init__(self, report_title, pdf_class):
         self.report_title = report_title
         self.pdf_class = pdf_class
+        # Identical reports for unchanged data are served from disk instead of re-rendered
+        self.report_cache = get_report_cache()
 
-    def generate_pdf(self, seller_id, sections_callback):
+    def generate_pdf(self, seller_id, sections_callback, pdf_path=None):
         """
         sections_callback(pdf) should add all report sections to the pdf.
-        Returns the path to the generated PDF.
+        Writes to pdf_path (a path or a writable binary buffer), or a timestamped
+        file in the reports directory. Returns the path or buffer written to.
         """
         Config.create_directories()
         pdf = self.pdf_class(title=self.report_title)
         pdf.alias_nb_pages()
         pdf.add_page()
         sections_callback(pdf)
-        filename = f"{self.report_title.lower().replace(' ', '_')}_{seller_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-        pdf_path = Config.REPORTS_DIR / filename
-        pdf.output(str(pdf_path))
+        if pdf_path is None:
+            filename = f"{self.report_title.lower().replace(' ', '_')}_{seller_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            pdf_path = Config.REPORTS_DIR / filename
+        if hasattr(pdf_path, 'write'):
+            # pyfpdf returns the document as a latin-1 string
+            pdf_path.write(pdf.output(dest='S').encode('latin-1'))
+        else:
+            pdf.output(str(pdf_path))
         return pdf_path 
\ No newline at end of file
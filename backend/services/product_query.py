@@ -0,0 +1,154 @@
+import re
+import numpy as np
+from config import Config
+
+MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6, 'jul': 7, 'aug': 8,
+    'sep': 9, 'sept': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+# "by <word>" -> store column to sort on
+METRICS = {
+    'sales': 'total_sold',
+    'sold': 'total_sold',
+    'units sold': 'total_sold',
+    'stock': 'stock_quantity',
+    'price': 'price',
+    'trend': 'trend_score',
+    'trend score': 'trend_score',
+    'ratio': 'stock_sales_ratio',
+}
+
+# Phrases that restrict results to a health flag of the store
+FLAGS = [
+    ('dead stock', 'is_dead_stock'),
+    ('overstocked', 'is_overstocked'),
+    ('understocked', 'is_understocked'),
+]
+
+RANK_PATTERN = re.compile(r'\b(top|best|highest|most|bottom|worst|lowest|least|first)\s+(\d+)\b')
+COUNT_PATTERN = re.compile(r'\b(\d+)\s+(?:products|items)\b')
+ASCENDING_PATTERN = re.compile(r'\b(bottom|worst|lowest|least|cheapest)\b')
+METRIC_PATTERN = re.compile(r'\bby\s+(' + '|'.join(sorted(METRICS, key=len, reverse=True)) + r')\b')
+PRICE = r'(?:₹|rs\.?|inr)?\s*(\d+(?:\.\d+)?)'
+BETWEEN_PATTERN = re.compile(r'\bbetween\s+' + PRICE + r'\s+(?:and|to|-)\s+' + PRICE)
+ABOVE_PATTERN = re.compile(r'(?:\babove|\bover|\bmore than|\bgreater than|>)\s*' + PRICE)
+BELOW_PATTERN = re.compile(r'(?:\bbelow|\bunder|\bless than|\bcheaper than|<)\s*' + PRICE)
+MONTH_PATTERN = re.compile(r'\b(?:in|during|for)\s+(' + '|'.join(sorted(MONTHS, key=len, reverse=True)) + r')\b')
+LAST_MONTH_PATTERN = re.compile(r'\blast month\b')
+
+class ProductQuery:
+    """Filter, sort and limit operations parsed from an ad-hoc chatbot question"""
+
+    def __init__(self, metric='total_sold', descending=True, limit=None, categories=None,
+                 flag=None, min_price=None, max_price=None, period=None):
+        self.metric = metric
+        self.descending = descending
+        self.limit = limit
+        self.categories = categories or []
+        self.flag = flag
+        self.min_price = min_price
+        self.max_price = max_price
+        self.period = period
+
+    def run(self, store):
+        """Return matching product records, best first, using the store's indexes"""
+        rows = None
+        if self.categories:
+            rows = np.sort(np.concatenate([store.category_rows[category] for category in self.categories]))
+        if self.min_price is not None or self.max_price is not None:
+            price_rows = store.rows_in_price_range(self.min_price, self.max_price)
+            rows = price_rows if rows is None else np.intersect1d(rows, price_rows)
+        if rows is None:
+            rows = np.arange(store.size)
+        if self.flag:
+            rows = rows[store.columns[self.flag][rows]]
+
+        if self.period is not None and self.period not in store.monthly_sold:
+            return []
+
+        limit = min(self.limit or Config.CHATBOT_QUERY_DEFAULT_LIMIT, Config.CHATBOT_QUERY_MAX_RESULTS)
+        if not len(rows) or limit <= 0:
+            return []
+        values = store.metric_values(self.metric, self.period)[rows]
+        keys = -values if self.descending else values
+        # Partial selection keeps large catalogs cheap, then only the winners are sorted
+        if limit < len(rows):
+            picked = np.argpartition(keys, limit - 1)[:limit]
+        else:
+            picked = np.arange(len(rows))
+        picked = picked[np.argsort(keys[picked], kind='stable')]
+
+        results = []
+        for index in picked:
+            record = store.record(rows[index], self.metric, self.period)
+            if self.period is not None:
+                # Report units sold in the asked month rather than all time
+                record['total_sold'] = store.metric_values('total_sold', self.period)[rows[index]].item()
+            results.append(record)
+        return results
+
+def _category_keys(text, store):
+    keys = []
+    for key in store.categories:
+        # Accept simple plurals such as "kurtis" or "t-shirts"
+        if re.search(r'(?<![\w-])' + re.escape(key) + r'(?:s|es)?\b', text):
+            keys.append(key)
+    return keys
+
+def parse_product_query(text, store):
+    """
+    Parse questions such as "top 20 kurtis by sales last month" or "dead stock in
+    Winterwear above ₹500". Returns a ProductQuery, or None when the text has no
+    parameters (count, category, price range or month) so fixed intents apply.
+    """
+    text = text.lower()
+    limit = None
+    descending = True
+    rank = RANK_PATTERN.search(text)
+    if rank:
+        limit = int(rank.group(2))
+    else:
+        count = COUNT_PATTERN.search(text)
+        if count:
+            limit = int(count.group(1))
+    if ASCENDING_PATTERN.search(text):
+        descending = False
+
+    metric_match = METRIC_PATTERN.search(text)
+    metric = METRICS[metric_match.group(1)] if metric_match else 'total_sold'
+    if metric_match is None and 'cheapest' in text:
+        metric = 'price'
+
+    min_price = max_price = None
+    between = BETWEEN_PATTERN.search(text)
+    if between:
+        min_price, max_price = float(between.group(1)), float(between.group(2))
+    else:
+        above = ABOVE_PATTERN.search(text)
+        below = BELOW_PATTERN.search(text)
+        min_price = float(above.group(1)) if above else None
+        max_price = float(below.group(1)) if below else None
+
+    # "last month" is the latest month in the sales data; a month name is its latest occurrence
+    period = None
+    asked_month = False
+    if LAST_MONTH_PATTERN.search(text):
+        period = store.latest_period
+        asked_month = True
+    else:
+        month_match = MONTH_PATTERN.search(text)
+        if month_match:
+            month = MONTHS[month_match.group(1)]
+            # A month missing from the data keeps its period so the query matches nothing
+            period = store.latest_period_of(month) or (None, month)
+            asked_month = True
+
+    categories = _category_keys(text, store)
+    if limit is None and not categories and min_price is None and max_price is None and not asked_month:
+        return None
+
+    flag = next((column for phrase, column in FLAGS if phrase in text), None)
+    return ProductQuery(metric, descending, limit, categories, flag, min_price, max_price, period)
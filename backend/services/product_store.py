@@ -0,0 +1,110 @@
+import threading
+import numpy as np
+import pandas as pd
+from services.data_processor import DataProcessor
+from services.data_version import get_data_version
+
+# Columns kept by the store and the dtype of their arrays
+STORE_COLUMNS = {
+    'product_id': object,
+    'name': object,
+    'category': object,
+    'price': float,
+    'stock_quantity': float,
+    'restock_threshold': float,
+    'total_sold': float,
+    'trend_score': float,
+    'stock_sales_ratio': float,
+    'is_dead_stock': bool,
+    'is_overstocked': bool,
+    'is_understocked': bool,
+}
+
+class ProductStore:
+    """
+    Column arrays of the combined product data with the indexes ad-hoc chatbot
+    queries need: rows per category, rows sorted by price and units sold per
+    product and (year, month) period. Built once per data version and read-only afterwards.
+    """
+
+    def __init__(self, combined_df, sales_df=None, version=None):
+        self.version = version
+        self.size = 0 if combined_df is None else len(combined_df)
+        self.columns = {}
+        for column, dtype in STORE_COLUMNS.items():
+            values = combined_df[column] if combined_df is not None and column in combined_df else []
+            self.columns[column] = np.asarray(values, dtype=dtype)
+
+        # Category index: lowercased category -> row numbers
+        self.categories = {}
+        self.category_rows = {}
+        for row, category in enumerate(self.columns['category']):
+            key = str(category).lower()
+            self.categories.setdefault(key, str(category))
+            self.category_rows.setdefault(key, []).append(row)
+        self.category_rows = {key: np.asarray(rows, dtype=np.intp) for key, rows in self.category_rows.items()}
+
+        # Price index for range filters
+        self.price_order = np.argsort(self.columns['price'], kind='stable')
+        self.sorted_prices = self.columns['price'][self.price_order]
+
+        # Units sold per (year, month) period, aligned with the store rows
+        self.monthly_sold = {}
+        if sales_df is not None and self.size:
+            row_of_product = {product_id: row for row, product_id in enumerate(self.columns['product_id'])}
+            dates = pd.to_datetime(sales_df['sales_date'], errors='coerce')
+            monthly = sales_df.groupby([dates.dt.year, dates.dt.month, sales_df['product_id']])['quantity_sold'].sum()
+            for (year, month, product_id), quantity in monthly.items():
+                row = row_of_product.get(product_id)
+                if row is None:
+                    continue
+                period = (int(year), int(month))
+                if period not in self.monthly_sold:
+                    self.monthly_sold[period] = np.zeros(self.size)
+                self.monthly_sold[period][row] = quantity
+        self.latest_period = max(self.monthly_sold) if self.monthly_sold else None
+
+    @classmethod
+    def load(cls, version=None):
+        """Build the store from the CSV files through the DataProcessor"""
+        processor = DataProcessor()
+        if not processor.load_all_data():
+            raise Exception("Failed to load inventory data files")
+        return cls(processor.combined_df, processor.sales_df, version=version)
+
+    def rows_in_price_range(self, min_price=None, max_price=None):
+        """Row numbers with min_price < price < max_price, found by binary search"""
+        start = 0 if min_price is None else np.searchsorted(self.sorted_prices, min_price, side='right')
+        end = self.size if max_price is None else np.searchsorted(self.sorted_prices, max_price, side='left')
+        return self.price_order[start:end]
+
+    def latest_period_of(self, month):
+        """Most recent (year, month) period in the sales data for a calendar month, or None"""
+        periods = [period for period in self.monthly_sold if period[1] == month]
+        return max(periods) if periods else None
+
+    def metric_values(self, metric, period=None):
+        """Values of metric per row; 'total_sold' is restricted to a (year, month) period when given"""
+        if metric == 'total_sold' and period is not None:
+            return self.monthly_sold.get(period, np.zeros(self.size))
+        return self.columns[metric]
+
+    def record(self, row, metric=None, period=None):
+        """Plain dict for one row, with the queried metric under 'value'"""
+        record = {column: values[row].item() if hasattr(values[row], 'item') else values[row]
+                  for column, values in self.columns.items()}
+        if metric is not None:
+            record['value'] = self.metric_values(metric, period)[row].item()
+        return record
+
+_lock = threading.Lock()
+_store = None
+
+def get_product_store():
+    """Return the product store for the current data version, rebuilding it when the files change"""
+    global _store
+    version = get_data_version()
+    with _lock:
+        if _store is None or _store.version != version:
+            _store = ProductStore.load(version=version)
+        return _store
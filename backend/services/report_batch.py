@@ -0,0 +1,124 @@
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from config import Config
+from services.data_version import get_data_version
+from services.chart_service import get_chart_service
+from services.report_cache import get_report_cache
+from services.report_retention import get_retention_manager
+
+# Report kinds a batch can generate for each seller
+BATCH_REPORT_KINDS = ['inventory_health', 'sales_report', 'weekly_monthly_sales', 'restock_plan']
+
+# Generators and precomputed analyses of one worker process, built by _init_worker
+_worker = None
+
+def _init_worker(kinds):
+    """Load the data once per worker process and precompute everything sellers share"""
+    global _worker
+    from services.pdf_generator import InventoryPDFGenerator
+    from services.sales_pdf_generator import SalesPDFGenerator
+    from services.forecasting_service import ForecastingService
+
+    _worker = {'data_version': get_data_version()}
+    # Batch workers are processes already; charts are drawn once each and then cached
+    get_chart_service().workers = 0
+    # Each worker only sees part of the batch; retention runs once in the parent afterwards
+    get_report_cache().retention = None
+    if 'inventory_health' in kinds:
+        _worker['inventory'] = InventoryPDFGenerator()
+        _worker['inventory_analysis'] = _worker['inventory'].analyzer.analyze_inventory()
+    if 'sales_report' in kinds or 'weekly_monthly_sales' in kinds:
+        _worker['sales'] = SalesPDFGenerator()
+        _worker['sales_analysis'] = _worker['sales'].analyze_sales_data()
+    if 'restock_plan' in kinds:
+        _worker['forecasting'] = ForecastingService()
+        if not _worker['forecasting'].load_data():
+            _worker['restock_plan'] = {'error': "Failed to load forecasting data files"}
+        else:
+            _worker['restock_plan'] = _worker['forecasting'].generate_restock_plan()
+
+def _render(kind, seller_id):
+    if kind == 'inventory_health':
+        return _worker['inventory'].generate_inventory_health_pdf(seller_id, _worker['inventory_analysis'])
+    if kind == 'sales_report':
+        return _worker['sales'].generate_sales_report_pdf(seller_id, _worker['sales_analysis'])
+    if kind == 'weekly_monthly_sales':
+        return _worker['sales'].generate_weekly_monthly_sales_pdf(seller_id)
+    if kind == 'restock_plan':
+        if 'error' in _worker['restock_plan']:
+            raise Exception(_worker['restock_plan']['error'])
+        return _worker['forecasting'].generate_restock_plan_pdf(seller_id, _worker['restock_plan'])
+    raise ValueError(f"Unknown report type: {kind}")
+
+def _generate_seller_reports(task):
+    """Render every requested report for one seller and return a manifest entry per report"""
+    seller_id, kinds = task
+    entries = []
+    for kind in kinds:
+        started = time.perf_counter()
+        entry = {'seller_id': seller_id, 'report': kind, 'worker': os.getpid(),
+                 'data_version': _worker['data_version']}
+        try:
+            entry['path'] = str(_render(kind, seller_id))
+            entry['status'] = 'done'
+        except Exception as e:
+            traceback.print_exc()
+            entry['path'] = None
+            entry['status'] = 'failed'
+            entry['error'] = str(e)
+        entry['seconds'] = round(time.perf_counter() - started, 4)
+        entries.append(entry)
+    return entries
+
+def generate_batch_reports(seller_ids, kinds=None, workers=None, manifest_path=None):
+    """
+    Generate reports for many sellers on a process pool and write a JSON manifest
+    with the path, status and render time of every report. Each worker loads the
+    data files once and reuses the analyses for all the sellers it is given.
+    Returns the manifest dict.
+    """
+    kinds = list(kinds or Config.BATCH_REPORT_TYPES)
+    unknown = [kind for kind in kinds if kind not in BATCH_REPORT_KINDS]
+    if unknown:
+        raise ValueError(f"Unknown report types: {', '.join(unknown)}")
+    seller_ids = list(dict.fromkeys(str(seller_id) for seller_id in seller_ids))
+    workers = max(1, min(workers or Config.BATCH_REPORT_WORKERS, len(seller_ids) or 1))
+    Config.create_directories()
+
+    started_at = datetime.now()
+    started = time.perf_counter()
+    entries = []
+    if seller_ids:
+        # Hand sellers out in chunks so each round trip to a worker carries real work
+        chunksize = max(1, len(seller_ids) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(kinds,)) as executor:
+            tasks = ((seller_id, kinds) for seller_id in seller_ids)
+            for seller_entries in executor.map(_generate_seller_reports, tasks, chunksize=chunksize):
+                entries.extend(seller_entries)
+        if Config.REPORT_RETENTION_ENABLED:
+            # Every report the manifest links to survives, however large the batch
+            get_retention_manager().enforce(keep={os.path.basename(entry['path']) for entry in entries if entry['path']})
+
+    elapsed = time.perf_counter() - started
+    manifest = {
+        'started_at': started_at.isoformat(timespec='seconds'),
+        'finished_at': datetime.now().isoformat(timespec='seconds'),
+        'elapsed_seconds': round(elapsed, 3),
+        'workers': workers,
+        'report_types': kinds,
+        'sellers': len(seller_ids),
+        'done': sum(1 for entry in entries if entry['status'] == 'done'),
+        'failed': sum(1 for entry in entries if entry['status'] == 'failed'),
+        'reports_per_second': round(len(entries) / elapsed, 2) if elapsed else 0.0,
+        'reports': entries
+    }
+    if manifest_path is None:
+        manifest_path = Config.REPORTS_DIR / f"batch_manifest_{started_at.strftime('%Y%m%d_%H%M%S')}.json"
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    manifest['manifest_path'] = str(manifest_path)
+    return manifest
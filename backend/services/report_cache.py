@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
+from collections import OrderedDict
+from io import BytesIO
+from config import Config
+from services.data_version import get_data_version
+from services.report_retention import get_retention_manager
+
+class ReportCache:
+    """
+    Content-addressed cache for rendered PDF reports.
+
+    The file name embeds a digest of (report type, seller, data version, params),
+    so a cache hit is a plain existence check that survives restarts and is shared
+    by every worker. Renders go to a temporary file that is renamed into place.
+
+    With storage='memory' reports are rendered into a BytesIO and kept in a
+    byte-bounded LRU instead; persist=True also writes them to disk.
+    """
+
+    def __init__(self, reports_dir=None, enabled=None, storage=None, persist=None, max_memory_bytes=None,
+                 retention=None):
+        self.reports_dir = reports_dir if reports_dir is not None else Config.REPORTS_DIR
+        self.enabled = Config.REPORT_CACHE_ENABLED if enabled is None else enabled
+        self.storage = storage or Config.REPORT_STORAGE
+        self.persist = Config.REPORT_PERSIST_TO_DISK if persist is None else persist
+        self.max_memory_bytes = max_memory_bytes or Config.REPORT_MEMORY_MAX_BYTES
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        # Optional ReportRetentionManager told about every report written to disk
+        self.retention = retention
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, report_type, seller_id, params=None):
+        """Digest identifying one rendering of a report"""
+        payload = json.dumps(
+            [report_type, str(seller_id), get_data_version(), params],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]
+
+    def path_for(self, report_type, seller_id, params=None):
+        safe_seller = re.sub(r'[^A-Za-z0-9_-]+', '_', str(seller_id)).strip('_') or 'seller'
+        return self.reports_dir / f"{report_type}_{safe_seller}_{self.key(report_type, seller_id, params)}.pdf"
+
+    def _lock_for(self, path):
+        with self._locks_lock:
+            return self._locks.setdefault(path, threading.Lock())
+
+    def get_or_render(self, report_type, seller_id, render, params=None):
+        """
+        Return the cached report for these inputs, or call render(target) to produce
+        it. target is a file path, or a BytesIO in memory mode. params must hold
+        every input besides the data files that changes the output.
+        """
+        if not self.enabled and self.storage != 'memory':
+            path = render(None)
+            if self.retention is not None:
+                self.retention.register(path)
+            return path
+        if self.enabled:
+            path = self.path_for(report_type, seller_id, params)
+        else:
+            # Uncached in-memory renders still need a unique name to be fetched by
+            path = self.reports_dir / f"{report_type}_{uuid.uuid4().hex}.pdf"
+        # Identical concurrent requests wait for the first render instead of repeating it
+        with self._lock_for(path):
+            if self.enabled and (path.name in self._memory or path.exists()):
+                self.hits += 1
+                if self.retention is not None:
+                    self.retention.touch(path.name)
+                return path
+            self.misses += 1
+            if self.storage == 'memory':
+                buffer = BytesIO()
+                render(buffer)
+                data = buffer.getvalue()
+                self._remember(path.name, data)
+                if self.persist:
+                    self._write_file(path, lambda tmp_path: tmp_path.write_bytes(data))
+            else:
+                self._write_file(path, render)
+        if not self.enabled:
+            with self._locks_lock:
+                self._locks.pop(path, None)
+        return path
+
+    def _write_file(self, path, write):
+        Config.create_directories()
+        tmp_path = path.with_name(f".{path.stem}.{uuid.uuid4().hex}.tmp")
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+        if self.retention is not None:
+            self.retention.register(path)
+
+    def _remember(self, filename, data):
+        with self._locks_lock:
+            self._memory[filename] = data
+            self._memory_bytes += len(data)
+            # Oldest reports go first once the byte budget is exceeded
+            while self._memory_bytes > self.max_memory_bytes and len(self._memory) > 1:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    def open(self, filename):
+        """
+        Return the report as a BytesIO if it is held in memory, else its path on
+        disk, or None if it is unknown.
+        """
+        filename = os.path.basename(str(filename))
+        with self._locks_lock:
+            data = self._memory.get(filename)
+            if data is not None:
+                self._memory.move_to_end(filename)
+                return BytesIO(data)
+        path = self.reports_dir / filename
+        return path if path.exists() else None
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+            'storage': self.storage,
+            'memory_reports': len(self._memory),
+            'memory_bytes': self._memory_bytes
+        }
+
+_report_cache = None
+
+def get_report_cache():
+    """Process-wide report cache shared by the PDF generators"""
+    global _report_cache
+    if _report_cache is None:
+        _report_cache = ReportCache(
+            retention=get_retention_manager() if Config.REPORT_RETENTION_ENABLED else None
+        )
+    return _report_cache
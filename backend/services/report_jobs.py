@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from config import Config
+
+class ReportQueueFull(Exception):
+    """Raised when too many reports are already waiting for a worker"""
+
+class ReportStillRendering(Exception):
+    """Raised when a report did not finish within the wait timeout; it keeps rendering as job_id"""
+
+    def __init__(self, job_id):
+        super().__init__(f"Report is still rendering, poll /api/reports/jobs/{job_id}")
+        self.job_id = job_id
+
+def report_dedup_key(kind, *args):
+    """Dedup key covering the report kind and every render argument, including unhashable ones like dicts"""
+    digest = hashlib.sha1(json.dumps(args, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+    return (kind, digest)
+
+class ReportJobQueue:
+    """
+    Renders PDF reports on a bounded pool of background threads and tracks their
+    status by job ID. At most max_pending jobs may wait for a worker, and a job
+    submitted while an identical one is still queued or running shares its ID.
+    """
+
+    def __init__(self, max_workers=None, ttl_seconds=None, max_pending=None):
+        self.max_workers = max_workers or Config.REPORT_JOB_WORKERS
+        self.ttl_seconds = ttl_seconds or Config.REPORT_JOB_TTL
+        self.max_pending = max_pending or Config.REPORT_JOB_MAX_PENDING
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='report-job')
+        self._jobs = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind, render, *args, dedup_key=None, **kwargs):
+        """
+        Queue render(*args, **kwargs), which must return the path of the generated
+        report, and return the job ID right away. Jobs with the same dedup_key that
+        are still queued or running are reused. Raises ReportQueueFull when the
+        queue is at its depth limit.
+        """
+        self._prune()
+        with self._lock:
+            if dedup_key is not None and dedup_key in self._in_flight:
+                return self._in_flight[dedup_key]
+            pending = sum(1 for job in self._jobs.values() if job['status'] == 'queued')
+            if pending >= self.max_pending:
+                raise ReportQueueFull(f"{pending} reports are already waiting to be rendered")
+            job_id = uuid.uuid4().hex
+            job = {
+                'job_id': job_id,
+                'kind': kind,
+                'status': 'queued',
+                'pdf_filename': None,
+                'error': None,
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'finished_at': None,
+                '_pdf_path': None,
+                '_dedup_key': dedup_key,
+                '_done': threading.Event(),
+                '_finished': None
+            }
+            self._jobs[job_id] = job
+            if dedup_key is not None:
+                self._in_flight[dedup_key] = job_id
+        self._executor.submit(self._run, job, render, args, kwargs)
+        return job_id
+
+    def _run(self, job, render, args, kwargs):
+        job['status'] = 'running'
+        try:
+            pdf_path = render(*args, **kwargs)
+            job['_pdf_path'] = str(pdf_path)
+            job['pdf_filename'] = os.path.basename(str(pdf_path))
+            job['status'] = 'done'
+        except Exception as e:
+            traceback.print_exc()
+            job['error'] = str(e)
+            job['status'] = 'failed'
+        job['finished_at'] = datetime.now().isoformat(timespec='seconds')
+        job['_finished'] = time.monotonic()
+        with self._lock:
+            if self._in_flight.get(job['_dedup_key']) == job['job_id']:
+                del self._in_flight[job['_dedup_key']]
+        job['_done'].set()
+
+    def get(self, job_id):
+        """Return a public copy of the job or None if it is unknown or expired"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            return {key: value for key, value in job.items() if not key.startswith('_')}
+
+    def wait(self, job_id, timeout=None):
+        """Block until the job has finished or timeout passes, then return its public copy"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        job['_done'].wait(timeout)
+        return self.get(job_id)
+
+    def pdf_path(self, job_id):
+        """Path of the rendered report of a finished job, or None"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job['_pdf_path'] if job is not None and job['status'] == 'done' else None
+
+    def stats(self):
+        """Job counts by status"""
+        with self._lock:
+            counts = {'queued': 0, 'running': 0, 'done': 0, 'failed': 0}
+            for job in self._jobs.values():
+                counts[job['status']] += 1
+        counts.update({'workers': self.max_workers, 'max_pending': self.max_pending})
+        return counts
+
+    def _prune(self):
+        """Forget finished jobs older than the TTL"""
+        cutoff = time.monotonic() - self.ttl_seconds
+        with self._lock:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job['_finished'] is not None and job['_finished'] < cutoff]
+            for job_id in expired:
+                del self._jobs[job_id]
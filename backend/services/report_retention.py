@@ -0,0 +1,171 @@
+import os
+import re
+import threading
+import time
+from config import Config
+
+# Report file name prefixes, longest first so 'sales_report' never shadows a longer one
+REPORT_PREFIXES = sorted([
+    'inventory_health_report',
+    'sales_report',
+    'weekly_monthly_sales',
+    'restock_plan_report',
+], key=len, reverse=True)
+
+# Trailing digest (cached reports) or timestamp (uncached reports) after the seller
+REPORT_SUFFIX_PATTERN = re.compile(r'_(?:[0-9a-f]{20}|[0-9a-f]{32}|\d{8}_\d{6})$')
+
+def parse_report_filename(filename):
+    """Return (report_type, seller) encoded in a report file name"""
+    stem = filename[:-4] if filename.endswith('.pdf') else filename
+    stem = REPORT_SUFFIX_PATTERN.sub('', stem)
+    for prefix in REPORT_PREFIXES:
+        if stem == prefix:
+            return prefix, 'unknown'
+        if stem.startswith(prefix + '_'):
+            return prefix, stem[len(prefix) + 1:] or 'unknown'
+    return 'unknown', 'unknown'
+
+class ReportRetentionManager:
+    """
+    Keeps the reports directory within a total size, a maximum age and a per-seller
+    size quota. Report metadata lives in an in-memory index built from one directory
+    scan, so listings and enforcement never walk the directory again. When over a
+    limit, the reports downloaded least recently are deleted first.
+
+    Reports written or served within min_age seconds are never deleted: report
+    jobs and batch manifests may still link to them, and other processes keep
+    their own index of the same directory.
+    """
+
+    def __init__(self, reports_dir=None, max_bytes=None, max_age=None, seller_max_bytes=None, min_age=None):
+        self.reports_dir = reports_dir if reports_dir is not None else Config.REPORTS_DIR
+        self.max_bytes = max_bytes or Config.REPORT_RETENTION_MAX_BYTES
+        self.max_age = max_age or Config.REPORT_RETENTION_MAX_AGE
+        self.seller_max_bytes = seller_max_bytes or Config.REPORT_RETENTION_SELLER_MAX_BYTES
+        self.min_age = Config.REPORT_RETENTION_MIN_AGE if min_age is None else min_age
+        self._index = None
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def _load_index(self):
+        if self._index is not None:
+            return self._index
+        self._index = {}
+        if self.reports_dir.exists():
+            with os.scandir(self.reports_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith('.pdf'):
+                        stat = entry.stat()
+                        self._add(entry.name, stat.st_size, stat.st_mtime, max(stat.st_atime, stat.st_mtime))
+        return self._index
+
+    def _add(self, filename, size, created_at, accessed_at):
+        report_type, seller = parse_report_filename(filename)
+        self._index[filename] = {
+            'filename': filename,
+            'report_type': report_type,
+            'seller': seller,
+            'size': size,
+            'created_at': created_at,
+            'accessed_at': accessed_at
+        }
+
+    def register(self, path):
+        """Index a newly written report and enforce the limits, never evicting it"""
+        path = self.reports_dir / os.path.basename(str(path))
+        try:
+            size = path.stat().st_size
+        except FileNotFoundError:
+            return
+        now = time.time()
+        with self._lock:
+            self._load_index()
+            self._add(path.name, size, now, now)
+            self._enforce(keep={path.name})
+
+    def touch(self, filename):
+        """Record a download so the report counts as recently used"""
+        with self._lock:
+            entry = self._load_index().get(os.path.basename(str(filename)))
+            if entry is not None:
+                entry['accessed_at'] = time.time()
+
+    def list_reports(self, seller=None):
+        """Report metadata from the index, newest first"""
+        with self._lock:
+            entries = [dict(entry) for entry in self._load_index().values()
+                       if seller is None or entry['seller'] == seller]
+        return sorted(entries, key=lambda entry: entry['created_at'], reverse=True)
+
+    def enforce(self, keep=()):
+        """Apply the limits now, never deleting the report file names in keep"""
+        with self._lock:
+            self._load_index()
+            return self._enforce(keep=set(keep))
+
+    def _enforce(self, keep=frozenset()):
+        """Delete expired reports, then least recently used ones until every limit holds"""
+        removed = []
+        now = time.time()
+        in_use = now - self.min_age
+        keep = set(keep) | {filename for filename, entry in self._index.items() if entry['accessed_at'] >= in_use}
+        cutoff = now - self.max_age
+        for filename, entry in list(self._index.items()):
+            if entry['created_at'] < cutoff and filename not in keep:
+                removed.append(filename)
+                self._remove(filename)
+
+        by_access = sorted(self._index.values(), key=lambda entry: entry['accessed_at'])
+        seller_bytes = {}
+        for entry in by_access:
+            seller_bytes[entry['seller']] = seller_bytes.get(entry['seller'], 0) + entry['size']
+        # Per-seller quotas first, so one busy seller cannot push out everyone else's reports
+        survivors = []
+        for entry in by_access:
+            if entry['filename'] not in keep and seller_bytes[entry['seller']] > self.seller_max_bytes:
+                seller_bytes[entry['seller']] -= entry['size']
+                removed.append(entry['filename'])
+                self._remove(entry['filename'])
+            else:
+                survivors.append(entry)
+        total_bytes = sum(entry['size'] for entry in survivors)
+        for entry in survivors:
+            if total_bytes <= self.max_bytes:
+                break
+            if entry['filename'] in keep:
+                continue
+            total_bytes -= entry['size']
+            removed.append(entry['filename'])
+            self._remove(entry['filename'])
+        return removed
+
+    def _remove(self, filename):
+        self._index.pop(filename, None)
+        try:
+            (self.reports_dir / filename).unlink()
+            self.evicted += 1
+        except FileNotFoundError:
+            pass
+
+    def stats(self):
+        with self._lock:
+            index = self._load_index()
+            return {
+                'reports': len(index),
+                'total_bytes': sum(entry['size'] for entry in index.values()),
+                'max_bytes': self.max_bytes,
+                'max_age': self.max_age,
+                'seller_max_bytes': self.seller_max_bytes,
+                'min_age': self.min_age,
+                'evicted': self.evicted
+            }
+
+_retention_manager = None
+
+def get_retention_manager():
+    """Process-wide retention manager for the reports directory"""
+    global _retention_manager
+    if _retention_manager is None:
+        _retention_manager = ReportRetentionManager()
+    return _retention_manager
@@ -0,0 +1,69 @@
+import threading
+from collections import OrderedDict
+from config import Config
+from services.data_version import get_data_version
+
+class ResponseCache:
+    """
+    Finished chatbot replies keyed by (intent, language, data version).
+
+    Entries of older data versions are dropped as soon as a new version is seen,
+    and on_new_version(version) is called so replies can be precomputed again.
+    """
+
+    def __init__(self, max_entries=None, on_new_version=None):
+        self.max_entries = max_entries or Config.RESPONSE_CACHE_SIZE
+        self.on_new_version = on_new_version
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def current_version(self):
+        """Return the data version, purging entries and notifying on a change"""
+        version = get_data_version()
+        changed = False
+        with self._lock:
+            if version != self._version:
+                changed = self._version is not None
+                self._version = version
+                self._entries.clear()
+        if changed and self.on_new_version:
+            self.on_new_version(version)
+        return version
+
+    def lookup(self, intent, lang):
+        """Return (version, reply); reply is None on a miss"""
+        version = self.current_version()
+        key = (intent, lang, version)
+        with self._lock:
+            response = self._entries.get(key)
+            if response is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        return version, response
+
+    def store(self, intent, lang, version, response):
+        """Cache a reply computed for version; ignored if the data changed meanwhile"""
+        with self._lock:
+            if version != self._version:
+                return
+            self._entries[(intent, lang, version)] = response
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'data_version': self._version
+            }
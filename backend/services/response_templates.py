@@ -0,0 +1,214 @@
+import numbers
+import re
+import string
+import threading
+
+# Precomputed digit translation tables for languages with native numerals
+DIGIT_TABLES = {
+    'hi': str.maketrans('0123456789', '०१२३४५६७८९'),
+    'bn': str.maketrans('0123456789', '০১২৩৪৫৬৭৮৯'),
+}
+
+# English response templates. Slots use str.format syntax and are filled after translation.
+RESPONSE_TEMPLATES = {
+    'report_job': "Report job: `{job_id}`",
+    'pdf_job_queued': "Your PDF report is being prepared and will be ready to download shortly.",
+    'report_queue_full': "Too many reports are being prepared right now. Please ask again in a minute.",
+    'weekly_monthly_requested': "Weekly & Monthly Sales Report PDF Requested!",
+    'weekly_monthly_contents': (
+        "The report includes:\n"
+        "• Weekly sales (past year, product-wise)\n"
+        "• Monthly sales (past year, product-wise)\n\n"
+        "You can download the PDF once it is ready."
+    ),
+    'inventory_pdf_requested': "PDF Report Requested Successfully!",
+    'inventory_pdf_contents': (
+        "The report includes:\n"
+        "• Executive Summary with Health Score\n"
+        "• Top Performing Products\n"
+        "• Dead Stock Alerts\n"
+        "• Overstocked Items\n"
+        "• Understocked Items\n"
+        "• Category Analysis\n"
+        "• Actionable Recommendations\n\n"
+        "You can download the PDF once it is ready."
+    ),
+    'inventory_health_summary': (
+        "Inventory Health Summary\n\n"
+        "Overall Health Score: {health_score}/100\n"
+        "Total Products: {total_products}\n"
+        "Total Stock: {total_stock}\n"
+        "Total Sold: {total_sold}\n"
+        "Total Value: ₹{total_value:,.0f}\n"
+        "Stock-to-Sales Ratio: {stock_to_sales_ratio:.2f}\n\n"
+        "Status: {status}"
+    ),
+    'status_excellent': "Excellent",
+    'status_good': "Good",
+    'status_needs_attention': "Needs Attention",
+    'sales_report_summary': (
+        "Sales Report Summary\n\n"
+        "Total Sales Records: {total_records}\n"
+        "Total Products Sold: {total_products}\n"
+        "Total Quantity Sold: {total_quantity}\n"
+        "Report Period: {period}\n"
+        "Average Monthly Sales: {avg_monthly_sales:.0f} units"
+    ),
+    'product_line': "{index}. {name} ({category})",
+    'most_sold_header': "Top Performing Products",
+    'least_sold_header': "Lowest Performing Products",
+    'stock_sold_trend': "   Stock: {stock_quantity} | Sold: {total_sold} | Trend: {trend_score}",
+    'no_dead_stock': "No Dead Stock Found!\n\nAll your products have some sales activity.",
+    'dead_stock_header': "Dead Stock Alert (Items with stock but no sales)",
+    'stock_price': "   Stock: {stock_quantity} | Price: ₹{price}",
+    'dead_stock_advice': "Recommendation: Consider discounting or liquidating these items.",
+    'no_overstocked': "No Overstocked Items Found!\n\nYour stock levels are well-balanced.",
+    'overstocked_header': "Overstocked Items (High stock, low sales)",
+    'stock_sold_ratio': "   Stock: {stock_quantity} | Sold: {total_sold} | Ratio: {stock_sales_ratio:.2f}",
+    'overstocked_advice': "Recommendation: Consider reducing stock levels for these items.",
+    'no_understocked': "No Understocked Items Found!\n\nAll your products have adequate stock levels.",
+    'understocked_header': "Understocked Items (Low stock, high sales potential)",
+    'stock_threshold_sold': "   Stock: {stock_quantity} | Threshold: {restock_threshold} | Sold: {total_sold}",
+    'understocked_advice': "Recommendation: Consider increasing stock levels for these items.",
+    'query_results_header': "Products matching your question",
+    'query_results_month_header': "Products matching your question (sales in {month}/{year})",
+    'query_result_line': "   Sold: {total_sold:.0f} | Stock: {stock_quantity:.0f} | Price: ₹{price:.0f} | Trend: {trend_score:.0f}",
+    'no_query_results': "No products match your question.",
+    'category_analysis_header': "Category Analysis",
+    'category_block': (
+        "{category}\n"
+        "   Products: {product_count}\n"
+        "   Total Stock: {total_stock}\n"
+        "   Total Sold: {total_sold}\n"
+        "   Avg Price: ₹{avg_price:.0f}\n"
+        "   Avg Trend: {avg_trend_score:.0f}"
+    ),
+    'health_excellent': "Excellent inventory health! Keep up the good work.",
+    'health_good': "Good inventory health with room for improvement.",
+    'health_needs_attention': "Inventory health needs attention. Consider the following actions:",
+    'rec_dead_stock': "• Consider discounting or liquidating {count} dead stock items",
+    'rec_overstocked': "• Reduce stock levels for {count} overstocked items",
+    'rec_understocked': "• Increase stock levels for {count} understocked items",
+    'rec_ratio_high': "• Overall stock levels are high relative to sales - consider reducing inventory",
+    'rec_ratio_low': "• Overall stock levels are low relative to sales - consider increasing inventory",
+    'restock_plan_summary': (
+        "Restock Plan Summary\n\n"
+        "Forecast Period: {forecast_period}\n"
+        "Total Restock Quantity: {total_restock_quantity}\n"
+        "Total Restock Value: Rs.{total_restock_value:,}\n"
+        "Products to Restock: {products_to_restock}\n"
+        "Products to Reduce: {products_to_reduce}\n\n"
+        "For detailed recommendations, download the PDF report below."
+    ),
+    'restock_load_failed': "Could not load data files for restock plan.",
+    'default_help': """SmartStock AI Assistant
+
+I can help you with inventory health management and sales analysis. Here are some things you can ask me:
+
+Inventory Analysis:
+• "Show inventory health summary"
+• "What are my most sold products?"
+• "What are my least sold products?"
+• "Show dead stock"
+• "Show overstocked items"
+• "Show understocked items"
+• "Analyze by category"
+
+Sales Analysis:
+• "Generate sales report"
+• "Show last year sales"
+• "Annual sales report"
+• "Sales performance analysis"
+
+Reports:
+• "Generate PDF report" (Inventory Health)
+• "Create inventory health report"
+• "Generate sales report" (Sales Analysis)
+
+Recommendations:
+• "Give me recommendations"
+• "What should I do?\"""",
+}
+
+# Templates without translatable words; report job lines must stay parseable by the API
+UNTRANSLATED_TEMPLATES = {'report_job', 'product_line'}
+
+SLOT_PATTERN = re.compile(r'\{[^{}]*\}')
+
+def localize_digits(text, lang):
+    """Swap ASCII digits for the native numerals of lang using a precomputed table"""
+    table = DIGIT_TABLES.get(lang)
+    return text.translate(table) if table else text
+
+class _SlotFormatter(string.Formatter):
+    """Formats slots, localizing digits of numeric values only"""
+
+    def __init__(self, lang):
+        super().__init__()
+        self.lang = lang
+
+    def format_field(self, value, format_spec):
+        formatted = super().format_field(value, format_spec)
+        if isinstance(value, numbers.Number):
+            return localize_digits(formatted, self.lang)
+        return formatted
+
+class ResponseTemplateCatalog:
+    """Response templates translated once per language and rendered with localized slots"""
+
+    def __init__(self, translator, templates=None):
+        self.translator = translator
+        self.templates = templates or RESPONSE_TEMPLATES
+        self._compiled = {}
+        # Per-thread count of English fallbacks so callers can avoid caching them
+        self._local = threading.local()
+
+    def fallback_count(self):
+        """Number of templates this thread has served in English for lack of a translation"""
+        return getattr(self._local, 'fallbacks', 0)
+
+    def _translate_template(self, key, lang):
+        text = self.templates[key]
+        slots = SLOT_PATTERN.findall(text)
+        # Shield slots behind positional markers so the translator leaves them intact
+        protected = text
+        for index, slot in enumerate(slots):
+            protected = protected.replace(slot, f'{{{index}}}', 1)
+        translated = self.translator.translate(protected, lang)
+        if not translated:
+            return None
+        for index in range(len(slots)):
+            if translated.count(f'{{{index}}}') != 1:
+                return None
+        # Localize digits of the literal text, then put the original slots back
+        translated = localize_digits(translated, lang)
+        for index, slot in enumerate(slots):
+            translated = translated.replace(localize_digits(f'{{{index}}}', lang), slot)
+        return translated
+
+    def template(self, key, lang='en'):
+        """Return the template for key in lang, translating it on first use"""
+        if lang == 'en' or key in UNTRANSLATED_TEMPLATES:
+            return self.templates[key]
+        compiled = self._compiled.get((key, lang))
+        if compiled is None:
+            try:
+                compiled = self._translate_template(key, lang)
+            except Exception:
+                compiled = None
+            if compiled is None:
+                # Fall back to English for this call and retry on the next one
+                self._local.fallbacks = self.fallback_count() + 1
+                return self.templates[key]
+            self._compiled[(key, lang)] = compiled
+        return compiled
+
+    def render(self, key, lang='en', **slots):
+        """Render a template in lang, filling slots with localized values"""
+        return _SlotFormatter(lang).format(self.template(key, lang), **slots)
+
+    def warm(self, langs):
+        """Translate every template for langs ahead of the first request"""
+        for lang in langs:
+            for key in self.templates:
+                self.template(key, lang)
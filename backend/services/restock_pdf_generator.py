@@ -0,0 +1,87 @@
+from .pdf_base import BasePDFReport, BasePDFGenerator, TableLayout
+from services.chart_service import get_chart_service
+
+# Rows are (month, recommendation) pairs from the plan's monthly_plans
+RECOMMENDATIONS_LAYOUT = TableLayout([
+    ('Month', 15, lambda row: row[0]),
+    ('Product Name', 45, lambda row: row[1].get('name', row[1].get('product_name', ''))),
+    ('Category', 30, lambda row: row[1]['category']),
+    ('Stock', 18, lambda row: row[1]['current_stock']),
+    ('Demand', 20, lambda row: row[1]['forecasted_demand']),
+    ('Restock', 20, lambda row: row[1]['recommended_restock']),
+    ('Reason', 42, lambda row: row[1].get('reason', '')),
+])
+
+def _recommendation_rows(restock_plan):
+    for month, month_plan in restock_plan.get('monthly_plans', {}).items():
+        for rec in month_plan.get('product_recommendations', []):
+            yield month, rec
+
+class RestockPlanPDFReport(BasePDFReport):
+    def __init__(self, title=None):
+        super().__init__(title=title or "Monthly Restock Plan Report")
+
+    def header(self):
+        # Purple title bar across the top of every page
+        self.set_fill_color(74, 20, 140)
+        self.rect(0, 0, self.w, 18, 'F')
+        self.set_xy(self.l_margin, 4)
+        self.set_font('Arial', 'B', 16)
+        self.set_text_color(255, 255, 255)
+        self.cell(0, 10, self.title)
+        self.set_text_color(0, 0, 0)
+        self.set_y(24)
+
+    def add_plan_summary(self, restock_plan):
+        summary = restock_plan.get('summary', {})
+        self.set_font('Arial', '', 11)
+        self.cell(0, 6, f"Generated: {restock_plan.get('generated_date', '')}", ln=True)
+        self.ln(2)
+        self.set_font('Arial', 'B', 12)
+        self.cell(0, 7, f"Forecast Period: {restock_plan.get('forecast_period', '')}", ln=True)
+        self.add_key_values(None, [
+            ('Total Restock Quantity', summary.get('total_restock_quantity', 0)),
+            ('Total Restock Value', f"Rs.{summary.get('total_restock_value', 0):,}"),
+            ('Products to Restock', summary.get('products_to_restock', 0)),
+            ('Products to Reduce', summary.get('products_to_reduce', 0)),
+        ])
+
+    def add_recommendations(self, restock_plan):
+        self.add_table('Restock Recommendations (2 Months)', RECOMMENDATIONS_LAYOUT,
+                       _recommendation_rows(restock_plan), header_color=(74, 20, 140), striped=True)
+
+    def add_top_categories(self, restock_plan):
+        """Top 3 categories by restock quantity"""
+        category_restock = {}
+        for _, rec in _recommendation_rows(restock_plan):
+            if rec['recommended_restock'] > 0:
+                category_restock[rec['category']] = category_restock.get(rec['category'], 0) + rec['recommended_restock']
+        if not category_restock:
+            return
+        top_cats = sorted(category_restock.items(), key=lambda x: x[1], reverse=True)[:3]
+        cat_str = ', '.join([f"{cat} ({qty})" for cat, qty in top_cats])
+        self.set_font('Arial', '', 10)
+        self.cell(0, 6, self.fit_text(f"Highest restock quantities required for: {cat_str}", self.w - 20), ln=True)
+        self.ln(5)
+
+class RestockPlanPDFGenerator(BasePDFGenerator):
+    def __init__(self):
+        super().__init__(report_title="Restock Plan Report", pdf_class=RestockPlanPDFReport)
+
+    def render(self, seller_id, restock_plan, pdf_path=None):
+        def add_sections(pdf):
+            pdf.add_plan_summary(restock_plan)
+            pdf.add_recommendations(restock_plan)
+            pdf.add_top_categories(restock_plan)
+            pdf.add_page()
+            pdf.add_chart('Stock and Sales by Category', get_chart_service().image_path('category_analysis'))
+        return self.generate_pdf(seller_id, add_sections, pdf_path)
+
+    def generate_restock_plan_pdf(self, seller_id, restock_plan):
+        # The plan depends on the current month as well as the data, so it is part of the key
+        params = {key: value for key, value in restock_plan.items() if key != 'generated_date'}
+        return self.report_cache.get_or_render(
+            'restock_plan_report', seller_id,
+            lambda pdf_path: self.render(seller_id, restock_plan, pdf_path),
+            params=params
+        )
@@ -1,162 +1,87 @@
-from .pdf_base import BasePDFReport, BasePDFGenerator
+from .pdf_base import BasePDFReport, BasePDFGenerator, TableLayout
 from config import Config
+from services.data_version import get_data_version
 from datetime import datetime
 import pandas as pd
 
+MONTHLY_BREAKDOWN_LAYOUT = TableLayout([
+    ('Month', 40, 'month'),
+    ('Sales Records', 30, 'records'),
+    ('Products Sold', 30, 'products'),
+    ('Quantity Sold', 30, 'quantity'),
+    ('Avg per Record', 30, 'avg_per_record', '{:.1f}'),
+])
+
+TOP_PRODUCTS_LAYOUT = TableLayout([
+    ('Product', 60, 'product_name'),
+    ('Sales Records', 30, 'sales_records'),
+    ('Total Quantity', 30, 'total_quantity'),
+    ('Avg per Sale', 30, 'avg_per_sale', '{:.1f}'),
+])
+
+SEASONAL_LAYOUT = TableLayout([
+    ('Season', 40, 'season'),
+    ('Months', 30, 'months'),
+    ('Total Sales', 30, 'total_sales'),
+    ('Avg Monthly', 30, 'avg_monthly', '{:.0f}'),
+    ('Performance', 30, 'performance'),
+])
+
+# Rows of the weekly and monthly tables are (period, product_name, quantity_sold)
+WEEKLY_SALES_LAYOUT = TableLayout([('Week', 40), ('Product', 60), ('Total Sold', 30)])
+MONTHLY_SALES_LAYOUT = TableLayout([('Month', 40), ('Product', 60), ('Total Sold', 30)])
+
 class SalesPDFReport(BasePDFReport):
     def __init__(self, title=None):
         super().__init__(title=title or "SmartStock AI - Annual Sales Report")
 
     def add_executive_summary(self, summary):
-        self.chapter_title('Executive Summary')
-        self.set_font('Arial', '', 10)
-        self.cell(0, 6, f'Total Sales Records: {summary["total_records"]}', ln=True)
-        self.cell(0, 6, f'Total Products Sold: {summary["total_products"]}', ln=True)
-        self.cell(0, 6, f'Total Quantity Sold: {summary["total_quantity"]}', ln=True)
-        self.cell(0, 6, f'Report Period: {summary["period"]}', ln=True)
-        self.cell(0, 6, f'Average Monthly Sales: {summary["avg_monthly_sales"]:.0f} units', ln=True)
-        self.ln(5)
+        self.add_key_values('Executive Summary', [
+            ('Total Sales Records', summary['total_records']),
+            ('Total Products Sold', summary['total_products']),
+            ('Total Quantity Sold', summary['total_quantity']),
+            ('Report Period', summary['period']),
+            ('Average Monthly Sales', f"{summary['avg_monthly_sales']:.0f} units"),
+        ])
 
     def add_monthly_breakdown(self, monthly_data):
-        self.chapter_title('Monthly Sales Breakdown')
-        self.set_font('Arial', 'B', 10)
-        self.set_text_color(0, 0, 0)
-        
-        # Header
-        self.cell(40, 8, 'Month', border=1)
-        self.cell(30, 8, 'Sales Records', border=1)
-        self.cell(30, 8, 'Products Sold', border=1)
-        self.cell(30, 8, 'Quantity Sold', border=1)
-        self.cell(30, 8, 'Avg per Record', border=1, ln=True)
-        
-        # Data
-        self.set_font('Arial', '', 9)
-        
-        for month_data in monthly_data:
-            month_name = month_data['month']
-            records = month_data['records']
-            products = month_data['products']
-            quantity = month_data['quantity']
-            avg_per_record = month_data['avg_per_record']
-            
-            # Ensure text is properly encoded for PDF
-            safe_month = month_name.encode('latin-1', 'replace').decode('latin-1')
-            self.cell(40, 6, safe_month, border=1)
-            self.cell(30, 6, str(records), border=1)
-            self.cell(30, 6, str(products), border=1)
-            self.cell(30, 6, str(quantity), border=1)
-            self.cell(30, 6, f'{avg_per_record:.1f}', border=1, ln=True)
-        
-        self.ln(5)
-    
+        self.add_table('Monthly Sales Breakdown', MONTHLY_BREAKDOWN_LAYOUT, monthly_data)
+
     def add_top_selling_products(self, top_products):
-        self.chapter_title('Top Selling Products')
-        self.set_font('Arial', 'B', 10)
-        self.set_text_color(0, 128, 0)  # Green for top performers
-        
-        # Header
-        self.cell(60, 8, 'Product', border=1)
-        self.cell(30, 8, 'Sales Records', border=1)
-        self.cell(30, 8, 'Total Quantity', border=1)
-        self.cell(30, 8, 'Avg per Sale', border=1, ln=True)
-        
-        # Data
-        self.set_font('Arial', '', 9)
-        self.set_text_color(0, 0, 0)
-        
-        for product in top_products:
-            # Ensure text is properly encoded for PDF
-            safe_name = product['product_name'][:25].encode('latin-1', 'replace').decode('latin-1')
-            self.cell(60, 6, safe_name, border=1)
-            self.cell(30, 6, str(product['sales_records']), border=1)
-            self.cell(30, 6, str(product['total_quantity']), border=1)
-            self.cell(30, 6, f'{product["avg_per_sale"]:.1f}', border=1, ln=True)
-        
-        self.ln(5)
-    
+        # Green for top performers
+        self.add_table('Top Selling Products', TOP_PRODUCTS_LAYOUT, top_products, header_color=(0, 128, 0))
+
     def add_sales_trends(self, trends):
         self.chapter_title('Sales Trends Analysis')
-        self.set_font('Arial', '', 10)
-        
+        width = self.w - self.l_margin - self.r_margin
         for trend in trends:
             self.set_font('Arial', 'B', 10)
-            # Remove emoji and encode safely
-            safe_title = trend['title'].encode('latin-1', 'replace').decode('latin-1')
-            self.cell(0, 6, f"* {safe_title}", ln=True)
+            self.cell(0, 6, self.fit_text(f"* {trend['title']}", width), ln=True)
             self.set_font('Arial', '', 9)
-            safe_description = trend['description'].encode('latin-1', 'replace').decode('latin-1')
-            self.cell(0, 6, f"   {safe_description}", ln=True)
+            self.cell(0, 6, self.fit_text(f"   {trend['description']}", width), ln=True)
             self.ln(3)
-        
         self.ln(5)
-    
+
     def add_seasonal_analysis(self, seasonal_data):
-        self.chapter_title('Seasonal Performance Analysis')
-        self.set_font('Arial', 'B', 10)
-        self.set_text_color(0, 0, 0)
-        
-        # Header
-        self.cell(40, 8, 'Season', border=1)
-        self.cell(30, 8, 'Months', border=1)
-        self.cell(30, 8, 'Total Sales', border=1)
-        self.cell(30, 8, 'Avg Monthly', border=1)
-        self.cell(30, 8, 'Performance', border=1, ln=True)
-        
-        # Data
-        self.set_font('Arial', '', 9)
-        
-        for season in seasonal_data:
-            # Ensure text is properly encoded for PDF
-            safe_season = season['season'].encode('latin-1', 'replace').decode('latin-1')
-            safe_performance = season['performance'].encode('latin-1', 'replace').decode('latin-1')
-            
-            self.cell(40, 6, safe_season, border=1)
-            self.cell(30, 6, str(season['months']), border=1)
-            self.cell(30, 6, str(season['total_sales']), border=1)
-            self.cell(30, 6, f'{season["avg_monthly"]:.0f}', border=1)
-            self.cell(30, 6, safe_performance, border=1, ln=True)
-        
-        self.ln(5)
+        self.add_table('Seasonal Performance Analysis', SEASONAL_LAYOUT, seasonal_data)
 
-    def add_weekly_sales_table(self, weekly_data):
-        self.chapter_title('Weekly Sales (Past Year)')
-        self.set_font('Arial', 'B', 10)
-        self.set_text_color(0, 0, 0)
-        # Header
-        self.cell(40, 8, 'Week', border=1)
-        self.cell(60, 8, 'Product', border=1)
-        self.cell(30, 8, 'Total Sold', border=1, ln=True)
-        self.set_font('Arial', '', 9)
-        for row in weekly_data:
-            self.cell(40, 6, str(row['week']), border=1)
-            safe_name = row['product_name'][:25].encode('latin-1', 'replace').decode('latin-1')
-            self.cell(60, 6, safe_name, border=1)
-            self.cell(30, 6, str(row['quantity_sold']), border=1, ln=True)
-        self.ln(5)
+    def add_weekly_sales_table(self, weekly_rows):
+        """weekly_rows yields (week, product_name, quantity_sold) rows or frame chunks"""
+        return self.add_table('Weekly Sales (Past Year)', WEEKLY_SALES_LAYOUT, weekly_rows, total_column=2)
 
-    def add_monthly_sales_table(self, monthly_data):
-        self.chapter_title('Monthly Sales (Past Year)')
-        self.set_font('Arial', 'B', 10)
-        self.set_text_color(0, 0, 0)
-        # Header
-        self.cell(40, 8, 'Month', border=1)
-        self.cell(60, 8, 'Product', border=1)
-        self.cell(30, 8, 'Total Sold', border=1, ln=True)
-        self.set_font('Arial', '', 9)
-        for row in monthly_data:
-            self.cell(40, 6, str(row['month']), border=1)
-            safe_name = row['product_name'][:25].encode('latin-1', 'replace').decode('latin-1')
-            self.cell(60, 6, safe_name, border=1)
-            self.cell(30, 6, str(row['quantity_sold']), border=1, ln=True)
-        self.ln(5)
+    def add_monthly_sales_table(self, monthly_rows):
+        """monthly_rows yields (month, product_name, quantity_sold) rows or frame chunks"""
+        return self.add_table('Monthly Sales (Past Year)', MONTHLY_SALES_LAYOUT, monthly_rows, total_column=2)
 
 class SalesPDFGenerator(BasePDFGenerator):
     def __init__(self):
         super().__init__(report_title="Sales Report", pdf_class=SalesPDFReport)
         self.sales_data = None
+        self._data_version = None
         self.load_sales_data()
 
     def load_sales_data(self):
+        self._data_version = get_data_version()
         sales_file = Config.DATA_DIR / 'Seasonal_Sales_400_OrderedByMonth(1).csv'
         if not sales_file.exists():
             raise FileNotFoundError(f"Sales data file not found: {sales_file}")
@@ -242,40 +167,58 @@ class SalesPDFGenerator(BasePDFGenerator):
             'seasonal_data': seasonal_data
         }
 
-    def get_weekly_monthly_sales_data(self):
+    def iter_period_sales(self, period):
+        """
+        Yield (period, product_name, quantity_sold) per product and 'week' or
+        'month', sorted by period then product, without building a list of records.
+        """
         if self.sales_data is None:
             raise ValueError("Sales data not loaded")
-        df = self.sales_data.copy()
-        df = df[df['sales_date'].notna()]
-        df['week'] = df['sales_date'].dt.strftime('%Y-W%U')
-        df['month'] = df['sales_date'].dt.strftime('%Y-%m')
-        # Weekly sales (product-wise)
-        weekly = df.groupby(['week', 'product_name'])['quantity_sold'].sum().reset_index()
-        weekly = weekly.sort_values(['week', 'product_name'])
-        weekly_data = weekly.to_dict('records')
-        # Monthly sales (product-wise)
-        monthly = df.groupby(['month', 'product_name'])['quantity_sold'].sum().reset_index()
-        monthly = monthly.sort_values(['month', 'product_name'])
-        monthly_data = monthly.to_dict('records')
+        df = self.sales_data[self.sales_data['sales_date'].notna()]
+        fmt = '%Y-W%U' if period == 'week' else '%Y-%m'
+        keys = df['sales_date'].dt.strftime(fmt).rename(period)
+        # groupby sorts by (period, product) already
+        totals = df.groupby([keys, df['product_name']])['quantity_sold'].sum()
+        for (key, product_name), quantity in totals.items():
+            yield key, str(product_name), int(quantity)
+
+    def get_weekly_monthly_sales_data(self):
+        weekly_data = [dict(zip(('week', 'product_name', 'quantity_sold'), row))
+                       for row in self.iter_period_sales('week')]
+        monthly_data = [dict(zip(('month', 'product_name', 'quantity_sold'), row))
+                        for row in self.iter_period_sales('month')]
         return weekly_data, monthly_data
 
-    def generate_sales_report_pdf(self, seller_id):
-        analysis = self.analyze_sales_data()
-        def add_sections(pdf):
-            pdf.add_executive_summary(analysis['summary'])
-            pdf.add_monthly_breakdown(analysis['monthly_data'])
-            pdf.add_top_selling_products(analysis['top_products'])
-            pdf.add_sales_trends(analysis['trends'])
-            pdf.add_seasonal_analysis(analysis['seasonal_data'])
-        pdf_path = self.generate_pdf(seller_id, lambda pdf: add_sections(pdf))
+    def _reload_if_changed(self):
+        """Reload the sales CSV if the data files changed since it was read"""
+        if self._data_version != get_data_version():
+            self.load_sales_data()
+
+    def generate_sales_report_pdf(self, seller_id, analysis=None):
+        def render(pdf_path):
+            report_analysis = analysis
+            if report_analysis is None:
+                self._reload_if_changed()
+                report_analysis = self.analyze_sales_data()
+            def add_sections(pdf):
+                pdf.add_executive_summary(report_analysis['summary'])
+                pdf.add_monthly_breakdown(report_analysis['monthly_data'])
+                pdf.add_top_selling_products(report_analysis['top_products'])
+                pdf.add_sales_trends(report_analysis['trends'])
+                pdf.add_seasonal_analysis(report_analysis['seasonal_data'])
+            return self.generate_pdf(seller_id, lambda pdf: add_sections(pdf), pdf_path)
+        pdf_path = self.report_cache.get_or_render('sales_report', seller_id, render)
         print(f"✅ Sales PDF generated successfully: {pdf_path}")
         return pdf_path 
 
     def generate_weekly_monthly_sales_pdf(self, seller_id):
-        weekly_data, monthly_data = self.get_weekly_monthly_sales_data()
-        def add_sections(pdf):
-            pdf.add_weekly_sales_table(weekly_data)
-            pdf.add_monthly_sales_table(monthly_data)
-        pdf_path = self.generate_pdf(seller_id, lambda pdf: add_sections(pdf))
+        def render(pdf_path):
+            self._reload_if_changed()
+            def add_sections(pdf):
+                # Rows are generated while the tables are written, never held as a list
+                pdf.add_weekly_sales_table(self.iter_period_sales('week'))
+                pdf.add_monthly_sales_table(self.iter_period_sales('month'))
+            return self.generate_pdf(seller_id, lambda pdf: add_sections(pdf), pdf_path)
+        pdf_path = self.report_cache.get_or_render('weekly_monthly_sales', seller_id, render)
         print(f"✅ Weekly/Monthly Sales PDF generated successfully: {pdf_path}")
         return pdf_path 
\ No newline at end of file
@@ -0,0 +1,112 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from config import Config
+
+class SessionStore:
+    """Interface for per-session chatbot conversation state"""
+
+    def get(self, session_id):
+        """Return the state dict for session_id (empty if unknown or expired)"""
+        raise NotImplementedError
+
+    def set(self, session_id, state):
+        """Replace the state of session_id and refresh its TTL"""
+        raise NotImplementedError
+
+    def delete(self, session_id):
+        raise NotImplementedError
+
+class MemorySessionStore(SessionStore):
+    """In-process LRU with TTL eviction; state is private to one worker"""
+
+    def __init__(self, max_sessions=None, ttl_seconds=None):
+        self.max_sessions = max_sessions or Config.SESSION_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or Config.SESSION_TTL
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, session_id):
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return {}
+            expires_at, state = entry
+            if expires_at < time.monotonic():
+                del self._sessions[session_id]
+                return {}
+            self._sessions.move_to_end(session_id)
+            return dict(state)
+
+    def set(self, session_id, state):
+        with self._lock:
+            self._sessions[session_id] = (time.monotonic() + self.ttl_seconds, dict(state))
+            self._sessions.move_to_end(session_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def delete(self, session_id):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+class SQLiteSessionStore(SessionStore):
+    """SQLite-backed store shared by every worker process on the host"""
+
+    def __init__(self, db_path=None, ttl_seconds=None):
+        self.db_path = db_path if db_path is not None else Config.SESSION_DB_PATH
+        self.ttl_seconds = ttl_seconds or Config.SESSION_TTL
+        self._lock = threading.Lock()
+        self._conn = None
+        self._writes = 0
+
+    def _connection(self):
+        if self._conn is None:
+            Config.create_directories()
+            self._conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                "session_id TEXT PRIMARY KEY, state TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def get(self, session_id):
+        with self._lock:
+            row = self._connection().execute(
+                "SELECT state FROM sessions WHERE session_id = ? AND expires_at >= ?",
+                (session_id, time.time())
+            ).fetchone()
+        return json.loads(row[0]) if row else {}
+
+    def set(self, session_id, state):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (session_id, state, expires_at) VALUES (?, ?, ?)",
+                (session_id, json.dumps(state), time.time() + self.ttl_seconds)
+            )
+            self._writes += 1
+            # Sweep expired sessions every so often instead of on every write
+            if self._writes % 100 == 0:
+                conn.execute("DELETE FROM sessions WHERE expires_at < ?", (time.time(),))
+            conn.commit()
+
+    def delete(self, session_id):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            conn.commit()
+
+SESSION_STORES = {
+    'memory': MemorySessionStore,
+    'sqlite': SQLiteSessionStore,
+}
+
+def get_session_store(name=None):
+    """Create the store configured by name (defaults to Config.SESSION_STORE)"""
+    name = name or Config.SESSION_STORE
+    if name not in SESSION_STORES:
+        raise ValueError(f"Unknown session store: {name}")
+    return SESSION_STORES[name]()
@@ -0,0 +1,329 @@
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from pathlib import Path
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+class TranslationUnavailable(Exception):
+    """Raised when the translator backend is timing out or the circuit is open"""
+
+class TranslationCache:
+    """Two-tier translation cache keyed by (text, source, target).
+
+    Lookups hit a bounded in-memory LRU first and fall back to a SQLite file
+    that survives restarts and is shared by every worker process.
+    """
+
+    def __init__(self, max_entries=None, db_path=None):
+        self.max_entries = max_entries or Config.TRANSLATION_CACHE_SIZE
+        self.db_path = db_path if db_path is not None else Config.TRANSLATION_CACHE_PATH
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _connection(self):
+        if self._conn is None and self.db_path:
+            Config.create_directories()
+            conn = sqlite3.connect(str(self.db_path), timeout=5, check_same_thread=False)
+            # Worker processes share the file; WAL lets them read while another one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                "text TEXT NOT NULL, source TEXT NOT NULL, target TEXT NOT NULL, "
+                "translated TEXT NOT NULL, PRIMARY KEY (text, source, target))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _remember(self, key, translated):
+        self._memory[key] = translated
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, text, source, target):
+        """Return the cached translation or None"""
+        key = (text, source, target)
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key]
+            row = None
+            try:
+                conn = self._connection()
+                if conn is not None:
+                    row = conn.execute(
+                        "SELECT translated FROM translations WHERE text = ? AND source = ? AND target = ?",
+                        key
+                    ).fetchone()
+            except sqlite3.Error as e:
+                # A locked or unreadable cache file only costs a miss
+                logger.debug("Translation cache read failed: %s", e)
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._remember(key, row[0])
+            return row[0]
+
+    def set(self, text, source, target, translated):
+        """Store a translation in both tiers; a failed disk write is ignored"""
+        key = (text, source, target)
+        with self._lock:
+            self._remember(key, translated)
+            try:
+                conn = self._connection()
+                if conn is not None:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO translations (text, source, target, translated) VALUES (?, ?, ?, ?)",
+                        (text, source, target, translated)
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                # The memory tier still has it; the disk copy is best effort
+                logger.debug("Translation cache write failed: %s", e)
+
+    def stats(self):
+        """Hit/miss counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'max_entries': self.max_entries
+            }
+
+class TranslatorBackend:
+    """Interface for translation backends"""
+    name = 'base'
+    # Remote backends get timeouts and the circuit breaker; their results are cached
+    remote = False
+
+    def translate(self, text, target, source='en'):
+        raise NotImplementedError
+
+class GoogleTranslatorBackend(TranslatorBackend):
+    """Google Translate through deep_translator"""
+    name = 'google'
+    remote = True
+
+    def translate(self, text, target, source='en'):
+        from deep_translator import GoogleTranslator
+        return GoogleTranslator(source=source, target=target).translate(text)
+
+class PhraseTableBackend(TranslatorBackend):
+    """
+    Offline backend that looks up each line in a phrase table of the form
+    {"hi": {"English line": "translated line"}}. Unknown lines pass through.
+    """
+    name = 'local'
+
+    def __init__(self, phrases=None, path=None):
+        if phrases is None:
+            path = Path(path if path is not None else Config.TRANSLATION_PHRASE_TABLE)
+            phrases = {}
+            if path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    phrases = json.load(f)
+            else:
+                print(f"❌ Phrase table {path} not found, the local translator will return English")
+        self.phrases = phrases
+
+    def translate(self, text, target, source='en'):
+        table = self.phrases.get(target, {})
+        return '\n'.join(table.get(line.strip(), line) for line in text.split('\n'))
+
+class NoopTranslatorBackend(TranslatorBackend):
+    """Returns text unchanged; isolates the rest of the pipeline in benchmarks"""
+    name = 'noop'
+
+    def translate(self, text, target, source='en'):
+        return text
+
+TRANSLATOR_BACKENDS = {
+    'google': GoogleTranslatorBackend,
+    'local': PhraseTableBackend,
+    'noop': NoopTranslatorBackend,
+}
+
+def get_translator_backend(name=None):
+    """Create the backend configured by name (defaults to Config.TRANSLATOR_BACKEND)"""
+    name = name or Config.TRANSLATOR_BACKEND
+    if name not in TRANSLATOR_BACKENDS:
+        raise ValueError(f"Unknown translator backend: {name}")
+    return TRANSLATOR_BACKENDS[name]()
+
+class CircuitBreaker:
+    """Opens after consecutive failures and lets a single trial call through after reset_timeout"""
+
+    def __init__(self, failure_threshold=None, reset_timeout=None):
+        self.failure_threshold = failure_threshold or Config.TRANSLATION_BREAKER_THRESHOLD
+        self.reset_timeout = reset_timeout or Config.TRANSLATION_BREAKER_RESET
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half_open'
+        return 'open'
+
+    def allow(self):
+        with self._lock:
+            state = self.state
+            if state == 'half_open':
+                # Push the window forward so only this caller probes the backend
+                self.opened_at = time.monotonic()
+                return True
+            return state == 'closed'
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+# Separator line for batched requests; the translator leaves it untouched
+BATCH_DELIMITER = '\n§§\n'
+BATCH_SPLIT_PATTERN = re.compile(r'\s*§§\s*')
+
+class Translator:
+    """Cached front for the translation backend used by the chatbot"""
+
+    def __init__(self, cache=None, max_workers=None, backend=None, timeout=None, breaker=None):
+        self.cache = cache if cache is not None else TranslationCache()
+        self.max_workers = max_workers or Config.TRANSLATION_MAX_WORKERS
+        self.backend = backend if backend is not None else get_translator_backend()
+        self.timeout = timeout or Config.TRANSLATION_TIMEOUT
+        self.breaker = breaker if breaker is not None else CircuitBreaker()
+        # Threads are only started when a batch has to fan out
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='translate')
+        # Separate pool for timed remote calls so fan-out workers never wait on themselves
+        self._call_executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='translate-call')
+        self.remote_calls = 0
+        self.remote_seconds = 0.0
+        self.timeouts = 0
+
+    def _remote_translate(self, text, target, source):
+        if not self.backend.remote:
+            return self.backend.translate(text, target, source)
+        if not self.breaker.allow():
+            raise TranslationUnavailable(f"Translator '{self.backend.name}' circuit is open")
+        started = time.monotonic()
+        future = self._call_executor.submit(self.backend.translate, text, target, source)
+        try:
+            translated = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            self.timeouts += 1
+            self.breaker.record_failure()
+            raise TranslationUnavailable(f"Translator '{self.backend.name}' timed out after {self.timeout}s")
+        except Exception:
+            self.breaker.record_failure()
+            raise
+        finally:
+            self.remote_calls += 1
+            self.remote_seconds += time.monotonic() - started
+        self.breaker.record_success()
+        return translated
+
+    def _store(self, text, source, target, translated):
+        if translated and self.backend.remote:
+            self.cache.set(text, source, target, translated)
+
+    def stats(self):
+        """Cache counters plus backend latency and breaker state"""
+        stats = self.cache.stats()
+        stats.update({
+            'backend': self.backend.name,
+            'remote_calls': self.remote_calls,
+            'remote_avg_ms': round(1000 * self.remote_seconds / self.remote_calls, 2) if self.remote_calls else 0.0,
+            'timeouts': self.timeouts,
+            'circuit': self.breaker.state
+        })
+        return stats
+
+    def translate(self, text, target, source='en'):
+        """Translate text, serving repeats from the cache. Errors propagate to the caller."""
+        if target == source or not text or not text.strip():
+            return text
+        cached = self.cache.get(text, source, target)
+        if cached is not None:
+            return cached
+        translated = self._remote_translate(text, target, source)
+        self._store(text, source, target, translated)
+        return translated
+
+    def _translate_or_none(self, text, target, source):
+        try:
+            return self.translate(text, target, source)
+        except Exception as e:
+            logger.debug("Line translation failed: %s", e)
+            return None
+
+    def translate_batch(self, texts, target, source='en'):
+        """
+        Translate several texts in one round-trip. Cached texts are served locally,
+        the rest are joined with a delimiter into a single request. If the reply
+        cannot be split back, the misses fan out over a bounded thread pool.
+        Returns translations in input order, with None for texts that failed.
+        """
+        results = list(texts)
+        pending = {}
+        for index, text in enumerate(texts):
+            if target == source or not text or not text.strip():
+                continue
+            cached = self.cache.get(text, source, target)
+            if cached is not None:
+                results[index] = cached
+            else:
+                pending.setdefault(text, []).append(index)
+        if not pending:
+            return results
+
+        unique_texts = list(pending)
+        translations = None
+        if len(unique_texts) == 1:
+            translations = [self._translate_or_none(unique_texts[0], target, source)]
+        else:
+            try:
+                joined = self._remote_translate(BATCH_DELIMITER.join(unique_texts), target, source)
+                parts = BATCH_SPLIT_PATTERN.split(joined.strip()) if joined else []
+                if len(parts) == len(unique_texts) and all(parts):
+                    translations = parts
+                    for text, translated in zip(unique_texts, parts):
+                        self._store(text, source, target, translated)
+            except Exception as e:
+                logger.debug("Batch translation failed: %s", e)
+            if translations is None:
+                translations = list(self._executor.map(
+                    lambda text: self._translate_or_none(text, target, source), unique_texts
+                ))
+
+        for text, translated in zip(unique_texts, translations):
+            for index in pending[text]:
+                results[index] = translated
+        return results
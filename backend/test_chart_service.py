@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Test script for cached chart rendering
+"""
+
+import base64
+import os
+import signal
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from config import Config
+from services.chart_service import ChartService, _scatter_sample
+from services.inventory_health import InventoryHealthAnalyzer
+
+def test_charts_cached_per_size_and_format():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = ChartService(cache_dir=Path(tmp_dir), workers=0)
+        png = service.render('stock_vs_sales', 'png', width=4, height=3, dpi=50)
+        assert png.startswith(b'\x89PNG')
+        assert service.render('stock_vs_sales', 'png', width=4, height=3, dpi=50) is png
+        assert service.stats()['hits'] == 1 and service.stats()['misses'] == 1
+
+        svg = service.render('category_analysis', 'svg', width=6, height=3)
+        assert b'<svg' in svg
+        assert service.render('stock_vs_sales', 'png', width=5, height=3, dpi=50) != png
+
+        path = service.image_path('category_analysis', width=6, height=3, dpi=50)
+        assert path.exists() and path.read_bytes().startswith(b'\x89PNG')
+        assert service.image_path('category_analysis', width=6, height=3, dpi=50) == path
+
+        # Older versions stay while a report may still be reading them, then go
+        fresh = Path(tmp_dir) / path.name.replace(path.stem.rsplit('_', 1)[1], 'fresh')
+        stale = Path(tmp_dir) / path.name.replace(path.stem.rsplit('_', 1)[1], 'stale')
+        fresh.write_bytes(b'old'), stale.write_bytes(b'old')
+        os.utime(stale, (time.time() - 2 * Config.CHART_IMAGE_MIN_AGE,) * 2)
+        path.unlink()
+        assert service.image_path('category_analysis', width=6, height=3, dpi=50) == path
+        assert fresh.exists() and not stale.exists()
+
+        try:
+            service.render('pie_of_everything')
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("unknown chart was rendered")
+    print("✅ Chart cache test passed")
+
+def test_chart_variants_and_etags():
+    """Sizes, dpi and formats are validated and each variant has its own ETag"""
+    service = ChartService(cache_dir=Path(tempfile.gettempdir()), workers=0)
+    key = service.resolve('stock_vs_sales', 'webp', 4, 3, 72)
+    assert service.etag(key) == service.etag(service.resolve('stock_vs_sales', 'webp', 4.0, 3.0, 72))
+    assert service.etag(key) != service.etag(service.resolve('stock_vs_sales', 'png', 4, 3, 72))
+    assert service.render('stock_vs_sales', key=key)[8:12] == b'WEBP'
+    for bad in [dict(dpi=5000), dict(width=-1), dict(height=500)]:
+        try:
+            service.resolve('stock_vs_sales', 'png', **bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad}")
+
+    rows = _scatter_sample(100000, 2000)
+    assert len(rows) == 2000 and rows[0] == 0 and rows[-1] == 99999
+    assert len(_scatter_sample(12, 2000)) == 12
+    print("✅ Chart variants and ETag test passed")
+
+def test_concurrent_renders_in_worker_processes():
+    """Parallel requests are drawn by the process pool without mixing up figures"""
+    service = ChartService(workers=2)
+    try:
+        service.warm()
+        sizes = [(4, 3), (5, 3), (6, 3), (7, 3)]
+        images = {}
+        def render(size):
+            images[size] = service.render('category_analysis', 'png', size[0], size[1], 60)
+        threads = [threading.Thread(target=render, args=(size,)) for size in sizes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert all(images[size].startswith(b'\x89PNG') for size in sizes)
+        # Each image has the pixel width its own figure size asks for
+        widths = [int.from_bytes(images[size][16:20], 'big') for size in sizes]
+        assert widths == sorted(widths) and len(set(widths)) == len(sizes)
+        assert service.stats()['misses'] == len(sizes)
+    finally:
+        service.shutdown()
+    print("✅ Chart worker pool test passed")
+
+def test_analytics_charts_from_snapshot():
+    """The analytics charts no longer depend on a DataFrame loaded by hand"""
+    charts = InventoryHealthAnalyzer().generate_analytics_charts()
+    assert set(charts) == {'stock_vs_sales', 'category_analysis'}
+    for image in charts.values():
+        assert base64.b64decode(image).startswith(b'\x89PNG')
+    print("✅ Analytics charts test passed")
+
+def _descendants(pid):
+    """PIDs of every process below pid, read from /proc"""
+    children = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+            children.setdefault(ppid, []).append(int(entry))
+    found, stack = [], [pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            found.append(child)
+            stack.append(child)
+    return found
+
+def test_app_main_starts_bounded_chart_workers():
+    """Running app.py as __main__ must not have chart workers re-run its startup and spawn more workers"""
+    if not os.path.isdir('/proc'):
+        print("⚠️ Skipped: /proc not available")
+        return
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    env = dict(os.environ, API_PORT=str(port), CHART_RENDER_WORKERS='2', TRANSLATOR_BACKEND='noop',
+               REPORT_RETENTION_ENABLED='0', REPORT_CACHE_ENABLED='0')
+    log = tempfile.TemporaryFile()
+    server = subprocess.Popen([sys.executable, 'app.py'], cwd=Path(__file__).parent, env=env,
+                              stdout=log, stderr=subprocess.STDOUT, start_new_session=True)
+    try:
+        base_url = f'http://127.0.0.1:{port}'
+        for _ in range(120):
+            try:
+                urllib.request.urlopen(f'{base_url}/api/health', timeout=2).read()
+                break
+            except OSError:
+                time.sleep(0.5)
+        else:
+            raise AssertionError("app.py did not start")
+        image = urllib.request.urlopen(f'{base_url}/api/inventory/charts/stock_vs_sales?dpi=50', timeout=120).read()
+        assert image.startswith(b'\x89PNG')
+
+        # Reloader child serving requests, fork server, resource tracker and the two chart workers
+        counts = []
+        for _ in range(6):
+            time.sleep(1)
+            counts.append(len(_descendants(server.pid)))
+        assert max(counts) <= 5, counts
+        assert counts[-1] == counts[-2], counts
+    finally:
+        os.killpg(server.pid, signal.SIGTERM)
+        server.wait(timeout=30)
+    log.seek(0)
+    output = log.read().decode('utf-8', 'replace')
+    log.close()
+    assert 'bootstrapping phase' not in output and 'Chart workers failed' not in output, output[-2000:]
+    print("✅ Chart worker process count test passed")
+
+if __name__ == "__main__":
+    test_charts_cached_per_size_and_format()
+    test_chart_variants_and_etags()
+    test_concurrent_renders_in_worker_processes()
+    test_analytics_charts_from_snapshot()
+    test_app_main_starts_bounded_chart_workers()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Test script for batched chatbot queries
+"""
+
+from services.chatbot import ChatbotService
+
+def test_batch_shares_analysis_and_renders_templates():
+    """One analysis run for the whole batch; each reply matches process_message in its language"""
+    chatbot = ChatbotService()
+    analysis_runs = []
+    translation_calls = []
+    analysis = {
+        'health_score': 85, 'understocked': [], 'overstocked': [],
+        'dead_stock': [{'name': 'Kurta 2024', 'category': 'Ethnicwear', 'stock_quantity': 12, 'price': 799}],
+        'summary': {'stock_to_sales_ratio': 1.0}
+    }
+
+    def analyze_inventory():
+        analysis_runs.append(1)
+        return analysis
+
+    def translate(text, target, source='en'):
+        translation_calls.append(target)
+        return f"[{target}] {text}"
+
+    chatbot.inventory_pdf_generator.analyzer.analyze_inventory = analyze_inventory
+    chatbot.translator.translate = translate
+    responses = chatbot.process_batch([
+        {'message': 'show dead stock', 'lang': 'hi'},
+        {'message': 'give me recommendations', 'lang': 'hi'},
+        {'message': 'show dead stock'},
+    ])
+    assert len(analysis_runs) == 1
+    assert set(translation_calls) == {'hi'}
+    assert responses[0].startswith('[hi] Dead Stock Alert')
+    # Numeric slots are localized; digits inside product names are not
+    assert '१. Kurta 2024 (Ethnicwear)' in responses[0] and '७९९' in responses[0]
+    assert responses[0] == chatbot.process_message('show dead stock', lang='hi')
+    assert responses[1].startswith('[hi] Excellent inventory health!')
+    assert responses[2].startswith('Dead Stock Alert')
+    assert '1. Kurta 2024 (Ethnicwear)' in responses[2]
+    print("✅ Chatbot batch test passed")
+
+if __name__ == "__main__":
+    test_batch_shares_analysis_and_renders_templates()
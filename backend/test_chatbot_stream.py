@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for streamed chatbot replies
+"""
+
+import threading
+import time
+from services.chatbot import ChatbotService, extract_report_job_id
+from services.report_jobs import ReportJobQueue
+
+def fake_translate(text, target, source='en'):
+    return f"[{target}] {text}"
+
+def test_stream_does_not_wait_for_report():
+    """The report event carries the queued job right away; the job is queued once for both languages"""
+    chatbot = ChatbotService(report_jobs=ReportJobQueue(max_workers=1))
+    chatbot.translator.translate = fake_translate
+    release = threading.Event()
+
+    def render(seller_id):
+        release.wait(30)
+        return 'weekly.pdf'
+
+    submitted = []
+    submit = chatbot.report_jobs.submit
+
+    def counting_submit(*args, **kwargs):
+        submitted.append(args[0])
+        return submit(*args, **kwargs)
+
+    chatbot.sales_pdf_generator.generate_weekly_monthly_sales_pdf = render
+    chatbot.report_jobs.submit = counting_submit
+    try:
+        started = time.perf_counter()
+        events = list(chatbot.stream_message('generate weekly report', lang='hi'))
+        assert time.perf_counter() - started < 5
+        names = [event for event, _ in events]
+        assert names == ['summary', 'translation', 'report', 'done']
+        payloads = dict(events)
+        job_id = payloads['summary']['job_id']
+        assert job_id and extract_report_job_id(payloads['translation']['response']) == job_id
+        assert payloads['translation']['response'].startswith('[hi]')
+        assert payloads['report']['job_id'] == job_id
+        assert payloads['report']['status'] in ('queued', 'running')
+        assert submitted == ['weekly_monthly_sales']
+    finally:
+        release.set()
+    print("✅ Chatbot stream report test passed")
+
+def test_stream_translation_uses_templates():
+    """Translated replies come from the template catalog; digits in product names are left alone"""
+    chatbot = ChatbotService()
+    chatbot.translator.translate = fake_translate
+    chatbot.inventory_pdf_generator.analyzer.analyze_inventory = lambda: {
+        'dead_stock': [{'name': 'Kurta 2024', 'category': 'Ethnicwear', 'stock_quantity': 12, 'price': 799}]
+    }
+    events = dict(chatbot.stream_message('show dead stock', lang='hi'))
+    english = events['summary']['response']
+    translated = events['translation']['response']
+    assert '1. Kurta 2024 (Ethnicwear)' in english
+    assert '१. Kurta 2024 (Ethnicwear)' in translated
+    assert '१२' in translated and '७९९' in translated
+    assert translated.startswith('[hi]')
+    print("✅ Chatbot stream translation test passed")
+
+def test_stream_translation_reuses_analysis():
+    """The translated reply is rendered from the analysis the summary already computed"""
+    chatbot = ChatbotService()
+    chatbot.translator.translate = fake_translate
+    analysis_runs = []
+
+    def analyze_inventory():
+        analysis_runs.append(1)
+        return {
+            'health_score': 85, 'dead_stock': [], 'overstocked': [], 'understocked': [],
+            'summary': {'total_products': 3, 'total_stock': 30, 'total_sold': 12, 'total_value': 2400,
+                        'stock_to_sales_ratio': 2.5}
+        }
+
+    chatbot.inventory_pdf_generator.analyzer.analyze_inventory = analyze_inventory
+    chatbot.report_jobs.submit = lambda *args, **kwargs: 'job-1'
+    events = dict(chatbot.stream_message('inventory health', lang='hi'))
+    assert events['translation']['response'].startswith('[hi]')
+    assert len(analysis_runs) == 1
+    print("✅ Chatbot stream snapshot test passed")
+
+if __name__ == "__main__":
+    test_stream_does_not_wait_for_report()
+    test_stream_translation_uses_templates()
+    test_stream_translation_reuses_analysis()
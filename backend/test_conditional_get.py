@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test script for ETag revalidation of the read-only GET endpoints
+"""
+
+import datetime as dt
+import app as backend
+
+class NextDay(dt.datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return dt.datetime.now(tz) + dt.timedelta(days=1)
+
+def test_etag_follows_data_version_and_calendar_day():
+    """A matching If-None-Match gets 304 without running the view; new data or a new day changes the tag"""
+    # No warmers, chart worker processes or report retention for this client
+    backend.background_started = True
+    backend.chart_service.workers = 0
+    client = backend.app.test_client()
+    view_runs = []
+
+    def analyze_inventory():
+        view_runs.append(1)
+        return {'festival_recommendations': [{'festival': 'Diwali', 'products': ['Silk Saree']}]}
+
+    analyzer = backend.inventory_analyzer
+    original = (analyzer.analyze_inventory, backend.get_data_version, backend.datetime)
+    analyzer.analyze_inventory = analyze_inventory
+    backend.get_data_version = lambda: 'version-1'
+    try:
+        url = '/api/inventory/festival-recommendations'
+        response = client.get(url)
+        etag = response.headers['ETag']
+        assert response.status_code == 200 and etag.startswith('W/')
+        assert response.headers['Cache-Control'] == 'no-cache'
+        assert response.get_json()['recommendations'][0]['festival'] == 'Diwali'
+
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 304 and response.headers['ETag'] == etag
+        assert len(view_runs) == 1
+
+        # Other query strings are tagged separately
+        assert client.get(url + '?lang=hi').headers['ETag'] != etag
+
+        backend.get_data_version = lambda: 'version-2'
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200 and response.headers['ETag'] != etag
+        etag = response.headers['ETag']
+
+        backend.datetime = NextDay
+        response = client.get(url, headers={'If-None-Match': etag})
+        assert response.status_code == 200 and response.headers['ETag'] != etag
+    finally:
+        analyzer.analyze_inventory, backend.get_data_version, backend.datetime = original
+    print("✅ Conditional GET test passed")
+
+if __name__ == "__main__":
+    test_etag_follows_data_version_and_calendar_day()
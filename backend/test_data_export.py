@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming CSV / NDJSON / XLSX exports
+"""
+
+import io
+import json
+import zipfile
+import xml.etree.ElementTree as ET
+import numpy as np
+import pandas as pd
+from config import Config
+from services.data_export import stream_export, product_rows, sales_rows
+
+COLUMNS = ['product', 'sold', 'price', 'flag']
+
+def sample_rows(count):
+    for index in range(count):
+        yield (f'Item <{index}> & co', np.int64(index), np.float64('nan') if index % 7 == 0 else index * 1.5, index % 2 == 0)
+
+def test_formats_stream_in_chunks():
+    original = Config.EXPORT_CHUNK_ROWS
+    Config.EXPORT_CHUNK_ROWS = 100
+    try:
+        chunks = list(stream_export('csv', COLUMNS, sample_rows(1000)))
+        assert len(chunks) == 10
+        frame = pd.read_csv(io.BytesIO(b''.join(chunks)))
+        assert list(frame.columns) == COLUMNS and len(frame) == 1000
+        assert frame['price'].isna().sum() == len(range(0, 1000, 7))
+
+        lines = b''.join(stream_export('ndjson', COLUMNS, sample_rows(250))).splitlines()
+        assert len(lines) == 250
+        assert json.loads(lines[3]) == {'product': 'Item <3> & co', 'sold': 3, 'price': 4.5, 'flag': False}
+        assert json.loads(lines[0])['price'] is None
+
+        chunks = list(stream_export('xlsx', COLUMNS, sample_rows(250), sheet_name='items'))
+        assert len(chunks) > 3
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(chunks)))
+        assert archive.testzip() is None
+        ns = {'m': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+        sheet = ET.fromstring(archive.read('xl/worksheets/sheet1.xml'))
+        rows = sheet.findall('m:sheetData/m:row', ns)
+        assert len(rows) == 251
+        assert rows[4].find('m:c/m:is/m:t', ns).text == 'Item <3> & co'
+        assert b'name="items"' in archive.read('xl/workbook.xml')
+    finally:
+        Config.EXPORT_CHUNK_ROWS = original
+    print("✅ Export formats test passed")
+
+def test_dataset_sources():
+    columns, rows = product_rows()
+    assert 'product_id' in columns and len(list(rows)) > 0
+    columns, rows = sales_rows()
+    assert columns[:2] == ['product_id', 'product_name']
+    assert sum(1 for _ in rows) == len(pd.read_csv(Config.SALES_CSV_PATH))
+    print("✅ Export dataset sources test passed")
+
+if __name__ == "__main__":
+    test_formats_stream_in_chunks()
+    test_dataset_sources()
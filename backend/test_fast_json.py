@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test script for fast JSON serialization and response compression
+"""
+
+import gzip
+import json
+import numpy as np
+import pandas as pd
+from flask import Flask, Response
+from werkzeug.datastructures import Accept
+from config import Config
+from services import fast_json
+from services.fast_json import dumps, frame_records, FastJSONProvider
+from services.compression import compress_response
+
+def test_numpy_values_serialize():
+    payload = {
+        'count': np.int64(3),
+        'ratio': np.float32(0.5),
+        'flag': np.bool_(True),
+        'missing': float('nan'),
+        'values': np.arange(3),
+        'when': pd.Timestamp('2025-01-02'),
+        10: 'month key',
+    }
+    data = json.loads(dumps(payload, sort_keys=True))
+    assert data['count'] == 3 and data['ratio'] == 0.5 and data['flag'] is True
+    assert data['values'] == [0, 1, 2]
+    assert data['when'].startswith('2025-01-02')
+    assert data['10'] == 'month key'
+    assert data['missing'] is None
+    print("✅ NumPy JSON serialization test passed")
+
+def _strict_loads(data):
+    def reject(token):
+        raise ValueError(f"Invalid JSON constant {token}")
+    return json.loads(data, parse_constant=reject)
+
+def test_fallback_encoder_matches_orjson():
+    """Payloads orjson refuses, and installs without orjson, still produce the same valid JSON"""
+    payloads = [
+        {'nan': float('nan'), 'inf': np.float64('inf'), 'big': 2 ** 70},
+        {np.int64(3): 'numpy key', 'names': np.array(['Kurta', 'Saree']), 'pair': (1, float('nan'))},
+        {'name': 'कुर्ता', 'values': np.array([1.5, np.nan]), True: None},
+    ]
+    encoded = [dumps(payload, sort_keys=True) for payload in payloads]
+    original = fast_json.orjson
+    fast_json.orjson = None
+    try:
+        fallback = [dumps(payload, sort_keys=True) for payload in payloads]
+    finally:
+        fast_json.orjson = original
+    for data, fallback_data in zip(encoded, fallback):
+        assert _strict_loads(data) == _strict_loads(fallback_data)
+    assert _strict_loads(encoded[0]) == {'big': 2 ** 70, 'inf': None, 'nan': None}
+    assert _strict_loads(encoded[1]) == {'3': 'numpy key', 'names': ['Kurta', 'Saree'], 'pair': [1, None]}
+    assert _strict_loads(encoded[2]) == {'name': 'कुर्ता', 'true': None, 'values': [1.5, None]}
+    print("✅ Fallback JSON encoder test passed")
+
+def test_frame_records_match_to_dict():
+    df = pd.DataFrame({
+        'name': ['Kurta', 'Saree', 'Dupatta'],
+        'total_sold': np.array([5, 0, 12], dtype=np.int64),
+        'price': [799.0, 1499.5, 299.0],
+        'is_dead_stock': [False, True, False],
+    })
+    records = frame_records(df, ['name', 'total_sold', 'price'])
+    assert records == df[['name', 'total_sold', 'price']].to_dict('records')
+    assert type(records[0]['total_sold']) is int
+    assert frame_records(df.iloc[0:0]) == []
+
+    app = Flask(__name__)
+    app.json = FastJSONProvider(app)
+    with app.app_context():
+        response = app.json.response(records=records)
+    assert json.loads(response.get_data())['records'][2]['total_sold'] == 12
+    print("✅ DataFrame records test passed")
+
+def test_response_compression():
+    body = json.dumps({'rows': [{'product': f'Item {i}', 'sold': i} for i in range(200)]})
+    assert len(body) > Config.RESPONSE_COMPRESS_MIN_BYTES
+
+    response = compress_response(Response(body, mimetype='application/json'), Accept([('gzip', 1)]))
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.headers['Vary']
+    assert gzip.decompress(response.get_data()).decode('utf-8') == body
+    assert int(response.headers['Content-Length']) == len(response.get_data())
+
+    # Client without gzip, small bodies, binary and streamed responses stay as they are
+    response = compress_response(Response(body, mimetype='application/json'), Accept([('identity', 1)]))
+    assert 'Content-Encoding' not in response.headers
+    response = compress_response(Response('{}', mimetype='application/json'), Accept([('gzip', 1)]))
+    assert 'Content-Encoding' not in response.headers
+    response = compress_response(Response(body, mimetype='application/pdf'), Accept([('gzip', 1)]))
+    assert 'Content-Encoding' not in response.headers
+    response = compress_response(Response(iter([body]), mimetype='text/csv'), Accept([('gzip', 1)]))
+    assert 'Content-Encoding' not in response.headers
+    print("✅ Response compression test passed")
+
+if __name__ == "__main__":
+    test_numpy_values_serialize()
+    test_fallback_encoder_matches_orjson()
+    test_frame_records_match_to_dict()
+    test_response_compression()
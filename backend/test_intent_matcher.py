@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Test script for the chatbot intent matcher
+"""
+
+from services.intent_matcher import IntentMatcher, FuzzyIntentMatcher
+
+def test_priority_and_overlaps():
+    """Earlier keyword groups win, overlapping keywords are all seen"""
+    matcher = IntentMatcher([
+        ('weekly', ['weekly sales']),
+        ('sales_report', ['sales report']),
+        ('most_sold', ['top products']),
+    ])
+    assert matcher.match("Show me the weekly sales report") == 'weekly'
+    assert matcher.match("sales report please") == 'sales_report'
+    assert matcher.match("TOP PRODUCTS and sales report") == 'sales_report'
+    assert matcher.match("hello there") is None
+
+    keywords = [keyword for _, keyword, _ in matcher.find_all("weekly sales report")]
+    assert keywords == ['weekly sales', 'sales report']
+    print("✅ Intent matcher priority test passed")
+
+def test_keywords_are_case_insensitive():
+    """Keywords with capitals still match lowercased messages"""
+    matcher = IntentMatcher([('recommendations', ['what should I do'])])
+    assert matcher.match("What should I do?") == 'recommendations'
+    print("✅ Intent matcher case test passed")
+
+def test_fuzzy_matching_tolerates_typos():
+    """Misspelled keywords match with a confidence, unrelated text does not"""
+    matcher = FuzzyIntentMatcher([
+        ('dead_stock', ['dead stock', 'unsold items']),
+        ('understocked', ['low stock']),
+        ('restock_plan', ['restock plan', 'monthly restock plan']),
+    ], threshold=0.82)
+    intent, confidence = matcher.match("show the restok plan")
+    assert intent == 'restock_plan' and 0.82 <= confidence < 1
+    assert matcher.match("dead stok")[0] == 'dead_stock'
+    assert matcher.match("show stock") is None
+    assert matcher.match("hello there") is None
+    print("✅ Fuzzy intent matcher test passed")
+
+if __name__ == "__main__":
+    test_priority_and_overlaps()
+    test_keywords_are_case_insensitive()
+    test_fuzzy_matching_tolerates_typos()
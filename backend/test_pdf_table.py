@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test script for streaming PDF tables
+"""
+
+from io import BytesIO
+import pandas as pd
+
+from services.pdf_base import TableLayout, iter_table_rows
+from services.sales_pdf_generator import SalesPDFReport, SalesPDFGenerator
+from services.restock_pdf_generator import RestockPlanPDFGenerator
+
+def test_streaming_table_summarizes_past_threshold():
+    """Rows past max_rows collapse into one line per period"""
+    def rows():
+        for week in range(50):
+            for product in range(100):
+                yield f'2024-W{week:02d}', f'Product {product}', 2
+
+    pdf = SalesPDFReport()
+    pdf.alias_nb_pages()
+    pdf.add_page()
+    written, summarized = pdf.add_table(
+        'Weekly Sales', TableLayout([('Week', 40), ('Product', 60), ('Total Sold', 30)]), rows(),
+        max_rows=250, total_column=2
+    )
+    assert written == 250
+    assert summarized == 50 * 100 - 250
+    # 250 detail rows need several pages; the 48 summary lines only a couple more
+    assert 5 <= pdf.page_no() <= 10, pdf.page_no()
+    print("✅ Streaming table summarization test passed")
+
+def test_chunked_frames_and_weekly_report():
+    """DataFrame chunks stream row by row and the weekly/monthly report renders"""
+    frame = pd.DataFrame({'week': ['2024-W01'] * 5, 'product_name': list('abcde'), 'quantity_sold': range(5)})
+    chunks = [frame.iloc[:2], frame.iloc[2:]]
+    assert list(iter_table_rows(chunks)) == list(frame.itertuples(index=False, name=None))
+    assert list(iter_table_rows(frame)) == list(iter_table_rows(chunks))
+
+    generator = SalesPDFGenerator()
+    rows = list(generator.iter_period_sales('month'))
+    assert rows == sorted(rows, key=lambda row: (row[0], row[1]))
+    assert sum(row[2] for row in rows) == int(generator.sales_data['quantity_sold'].sum())
+
+    buffer = BytesIO()
+    generator.generate_pdf('test_seller', lambda pdf: pdf.add_monthly_sales_table(iter(rows)), buffer)
+    assert buffer.getvalue().startswith(b'%PDF')
+    print("✅ Chunked rows and weekly report test passed")
+
+def test_layouts_and_text_fitting():
+    """Layouts read dict rows by key and long cell text is cut to the column width"""
+    layout = TableLayout([('Product', 30, 'name'), ('Price', 20, 'price', 'Rs.{:.0f}')])
+    assert layout.width == 50
+    assert layout.texts(layout.values({'name': 'Kurti', 'price': 499.6})) == ['Kurti', 'Rs.500']
+
+    pdf = SalesPDFReport()
+    pdf.add_page()
+    pdf.set_font('Arial', '', 9)
+    long_name = 'Handloom Cotton Saree With Zari Border ' * 3
+    fitted = pdf.fit_text(long_name, 30)
+    assert fitted.endswith('...') and pdf.get_string_width(fitted) <= 30
+    assert pdf.fit_text('Kurti', 30) == 'Kurti'
+    print("✅ Table layout and text fitting test passed")
+
+def test_restock_plan_on_shared_engine():
+    """The restock plan renders through the FPDF report engine"""
+    plan = {
+        'generated_date': '2024-06-01', 'forecast_period': 'June - July 2024',
+        'summary': {'total_restock_quantity': 30, 'total_restock_value': 15000,
+                    'products_to_restock': 1, 'products_to_reduce': 0},
+        'monthly_plans': {'June': {'product_recommendations': [{
+            'name': 'Cotton Kurti', 'category': 'Kurtis', 'current_stock': 5,
+            'forecasted_demand': 35, 'recommended_restock': 30, 'reason': 'Festival demand'
+        }]}}
+    }
+    buffer = BytesIO()
+    RestockPlanPDFGenerator().render('test_seller', plan, buffer)
+    assert buffer.getvalue().startswith(b'%PDF')
+    print("✅ Restock plan engine test passed")
+
+if __name__ == "__main__":
+    test_streaming_table_summarizes_past_threshold()
+    test_chunked_frames_and_weekly_report()
+    test_layouts_and_text_fitting()
+    test_restock_plan_on_shared_engine()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for parameterized chatbot product queries
+"""
+
+import pandas as pd
+from services.product_store import ProductStore
+from services.product_query import parse_product_query
+
+def make_store():
+    combined = pd.DataFrame({
+        'product_id': [1, 2, 3, 4],
+        'name': ['Cotton Kurti', 'Silk Kurti', 'Woolen Pullover', 'Rain Jacket'],
+        'category': ['Kurti', 'Kurti', 'Winterwear', 'Rainwear'],
+        'price': [499, 899, 999, 650],
+        'stock_quantity': [10, 5, 30, 8],
+        'restock_threshold': [5, 5, 5, 5],
+        'total_sold': [40, 60, 0, 12],
+        'trend_score': [100, 150, 40, 80],
+        'stock_sales_ratio': [0.25, 0.08, 30.0, 0.67],
+        'is_dead_stock': [False, False, True, False],
+        'is_overstocked': [False, False, True, False],
+        'is_understocked': [False, False, False, False],
+    })
+    sales = pd.DataFrame({
+        'product_id': [1, 2, 1, 4, 2, 2],
+        'sales_month': [11, 11, 12, 12, 1, 11],
+        'sales_date': ['11/3/2024', '11/9/2024', '12/5/2024', '12/20/2024', '1/4/2025', '11/12/2023'],
+        'quantity_sold': [5, 9, 7, 3, 2, 50],
+    })
+    return ProductStore(combined, sales, version='test')
+
+def test_parse_and_run():
+    store = make_store()
+    assert parse_product_query("show dead stock", store) is None
+
+    # "last month" is the latest month in the data, even across a year boundary
+    query = parse_product_query("top 1 kurtis by sales last month", store)
+    assert (query.limit, query.categories, query.period) == (1, ['kurti'], (2025, 1))
+    assert [item['name'] for item in query.run(store)] == ['Silk Kurti']
+
+    # A month name is its latest occurrence; sales from the same month a year earlier are not added
+    query = parse_product_query("top 1 kurtis by sales in november", store)
+    assert query.period == (2024, 11)
+    assert [(item['name'], item['total_sold']) for item in query.run(store)] == [('Silk Kurti', 9)]
+    query = parse_product_query("top 1 kurtis by sales in december", store)
+    assert [item['name'] for item in query.run(store)] == ['Cotton Kurti']
+    assert parse_product_query("top 2 kurtis in june", store).run(store) == []
+
+    query = parse_product_query("dead stock in Winterwear above ₹500", store)
+    assert query.flag == 'is_dead_stock' and query.min_price == 500
+    assert [item['name'] for item in query.run(store)] == ['Woolen Pullover']
+
+    query = parse_product_query("cheapest 2 products between rs 600 and 1000", store)
+    assert [item['name'] for item in query.run(store)] == ['Rain Jacket', 'Silk Kurti']
+    print("✅ Product query test passed")
+
+if __name__ == "__main__":
+    test_parse_and_run()
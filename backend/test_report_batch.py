@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test script for batch report generation across sellers
+"""
+
+import json
+import os
+import tempfile
+from config import Config
+from services.report_batch import generate_batch_reports
+
+def test_batch_writes_manifest():
+    """Each seller gets its reports and the manifest records every one"""
+    # Retention would run over the real reports directory, which holds the sample reports
+    retention_enabled = Config.REPORT_RETENTION_ENABLED
+    Config.REPORT_RETENTION_ENABLED = False
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        manifest_path = os.path.join(tmp_dir, 'manifest.json')
+        try:
+            manifest = generate_batch_reports(['batch_a', 'batch_b', 'batch_a'], ['sales_report'],
+                                              workers=2, manifest_path=manifest_path)
+        finally:
+            Config.REPORT_RETENTION_ENABLED = retention_enabled
+        try:
+            assert manifest['sellers'] == 2
+            assert manifest['done'] == 2 and manifest['failed'] == 0
+            assert sorted(entry['seller_id'] for entry in manifest['reports']) == ['batch_a', 'batch_b']
+            for entry in manifest['reports']:
+                assert os.path.exists(entry['path'])
+                assert entry['seconds'] >= 0
+            with open(manifest_path) as f:
+                assert json.load(f)['done'] == 2
+        finally:
+            for entry in manifest['reports']:
+                if entry['path'] and os.path.exists(entry['path']):
+                    os.remove(entry['path'])
+    print("✅ Batch manifest test passed")
+
+def test_batch_rejects_unknown_report_types():
+    try:
+        generate_batch_reports(['batch_a'], ['payroll'])
+    except ValueError as e:
+        assert 'payroll' in str(e)
+    else:
+        raise AssertionError("unknown report type was accepted")
+    print("✅ Unknown report type test passed")
+
+if __name__ == "__main__":
+    test_batch_writes_manifest()
+    test_batch_rejects_unknown_report_types()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed PDF report cache
+"""
+
+import tempfile
+from pathlib import Path
+from services.report_cache import ReportCache
+
+def test_identical_reports_render_once():
+    """Same inputs reuse the file, different params render a new one"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = ReportCache(reports_dir=Path(tmp_dir), enabled=True)
+        renders = []
+
+        def render(pdf_path):
+            renders.append(pdf_path)
+            pdf_path.write_bytes(b'%PDF-1.4 test')
+            return pdf_path
+
+        first = cache.get_or_render('sales_report', 'seller 1', render)
+        second = cache.get_or_render('sales_report', 'seller 1', render)
+        third = cache.get_or_render('sales_report', 'seller 1', render, params={'month': 5})
+        assert first == second and first != third
+        assert first.name.startswith('sales_report_seller_1_') and first.read_bytes() == b'%PDF-1.4 test'
+        assert len(renders) == 2
+        # Only finished reports are left behind
+        assert sorted(path.suffix for path in Path(tmp_dir).iterdir()) == ['.pdf', '.pdf']
+        assert cache.stats()['hits'] == 1
+        print("✅ Report cache test passed")
+
+def test_memory_storage_skips_disk():
+    """In-memory reports are served from a buffer and never touch the reports directory"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = ReportCache(reports_dir=Path(tmp_dir), enabled=True, storage='memory', persist=False,
+                            max_memory_bytes=20)
+
+        def render(buffer):
+            buffer.write(b'%PDF-1.4 in memory')
+            return buffer
+
+        path = cache.get_or_render('sales_report', 'seller_1', render)
+        assert cache.open(path).read() == b'%PDF-1.4 in memory'
+        assert list(Path(tmp_dir).iterdir()) == []
+        # The byte budget evicts the oldest report
+        cache.get_or_render('sales_report', 'seller_2', render)
+        assert cache.open(path) is None
+        print("✅ In-memory report storage test passed")
+
+if __name__ == "__main__":
+    test_identical_reports_render_once()
+    test_memory_storage_skips_disk()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test script for background report jobs
+"""
+
+import threading
+import time
+from services.report_jobs import ReportJobQueue, ReportQueueFull, report_dedup_key
+
+def wait_for(queue, job_id, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = queue.get(job_id)
+        if job['status'] in ('done', 'failed'):
+            return job
+        time.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+def test_job_lifecycle():
+    """Jobs return immediately and expose the rendered file when done"""
+    queue = ReportJobQueue(max_workers=1)
+
+    def render(seller_id):
+        time.sleep(0.05)
+        return f"/tmp/reports/sales_report_{seller_id}.pdf"
+
+    job_id = queue.submit('sales_report', render, 'seller_1')
+    assert queue.get(job_id)['status'] in ('queued', 'running')
+    job = wait_for(queue, job_id)
+    assert job['status'] == 'done'
+    assert job['pdf_filename'] == 'sales_report_seller_1.pdf'
+    assert queue.get('missing') is None
+    print("✅ Report job lifecycle test passed")
+
+def test_failed_job_reports_error():
+    queue = ReportJobQueue(max_workers=1)
+
+    def render():
+        raise ValueError("no sales data")
+
+    job = wait_for(queue, queue.submit('sales_report', render))
+    assert job['status'] == 'failed' and job['error'] == 'no sales data'
+    print("✅ Failed report job test passed")
+
+def test_dedup_and_queue_limit():
+    """Identical in-flight jobs share an ID and the queue refuses work past its depth"""
+    queue = ReportJobQueue(max_workers=1, max_pending=1)
+    release = threading.Event()
+
+    def render(seller_id):
+        release.wait(5)
+        return f"/tmp/reports/report_{seller_id}.pdf"
+
+    first = queue.submit('sales_report', render, 'seller_1', dedup_key=('sales_report', 'seller_1'))
+    assert queue.submit('sales_report', render, 'seller_1', dedup_key=('sales_report', 'seller_1')) == first
+    while queue.get(first)['status'] != 'running':
+        time.sleep(0.01)
+    second = queue.submit('sales_report', render, 'seller_2')
+    try:
+        queue.submit('sales_report', render, 'seller_3')
+        raise AssertionError("Queue accepted a job past its depth limit")
+    except ReportQueueFull:
+        pass
+    release.set()
+    assert queue.wait(second, timeout=5)['status'] == 'done'
+    assert queue.pdf_path(first) == '/tmp/reports/report_seller_1.pdf'
+    # Once finished, the same report can be queued again
+    assert queue.submit('sales_report', render, 'seller_1', dedup_key=('sales_report', 'seller_1')) != first
+    print("✅ Report job dedup and queue limit test passed")
+
+def test_dedup_key_covers_all_arguments():
+    """Reports that differ in any argument, including dict arguments, are not shared"""
+    plan = {'restock_plan': [{'product': 'Kurta', 'quantity': 12}], 'month': 11}
+    key = report_dedup_key('restock_plan', 'seller_1', plan)
+    assert key == report_dedup_key('restock_plan', 'seller_1', {'month': 11, 'restock_plan': plan['restock_plan']})
+    assert key != report_dedup_key('restock_plan', 'seller_1', {**plan, 'month': 12})
+    assert key != report_dedup_key('restock_plan', 'seller_2', plan)
+    assert key != report_dedup_key('sales_report', 'seller_1', plan)
+    hash(key)
+    print("✅ Report job dedup key test passed")
+
+if __name__ == "__main__":
+    test_job_lifecycle()
+    test_failed_job_reports_error()
+    test_dedup_and_queue_limit()
+    test_dedup_key_covers_all_arguments()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test script for the reports directory retention manager
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from services.report_retention import ReportRetentionManager, parse_report_filename
+
+def write_report(directory, filename, size, age=0):
+    path = Path(directory) / filename
+    path.write_bytes(b'x' * size)
+    timestamp = time.time() - age
+    os.utime(path, (timestamp, timestamp))
+    return path
+
+def test_parse_report_filename():
+    assert parse_report_filename('restock_plan_report_default_seller_20250720_144138.pdf') == \
+        ('restock_plan_report', 'default_seller')
+    assert parse_report_filename('sales_report_seller_1_cf1eea36b37362d650ef.pdf') == ('sales_report', 'seller_1')
+    assert parse_report_filename('notes.pdf') == ('unknown', 'unknown')
+    print("✅ Report filename parsing test passed")
+
+def test_limits_evict_least_recently_downloaded():
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write_report(tmp_dir, 'sales_report_old_20240101_000000.pdf', 10, age=3600)
+        write_report(tmp_dir, 'sales_report_a_20250101_000000.pdf', 40, age=60)
+        write_report(tmp_dir, 'sales_report_b_20250101_000000.pdf', 40, age=50)
+        manager = ReportRetentionManager(reports_dir=Path(tmp_dir), max_bytes=100, max_age=600,
+                                         seller_max_bytes=60, min_age=0)
+        assert manager.enforce() == ['sales_report_old_20240101_000000.pdf']
+
+        # Seller a's report was downloaded recently, so b's goes when the total overflows
+        manager.touch('sales_report_a_20250101_000000.pdf')
+        write_report(tmp_dir, 'sales_report_c_20250101_000000.pdf', 40)
+        manager.register(Path(tmp_dir) / 'sales_report_c_20250101_000000.pdf')
+        assert [report['seller'] for report in manager.list_reports()] == ['c', 'a']
+
+        # A seller over its quota loses its least recently used report first
+        write_report(tmp_dir, 'sales_report_c_20250102_000000.pdf', 30)
+        manager.register(Path(tmp_dir) / 'sales_report_c_20250102_000000.pdf')
+        assert sorted(os.listdir(tmp_dir)) == ['sales_report_a_20250101_000000.pdf', 'sales_report_c_20250102_000000.pdf']
+        print("✅ Report retention test passed")
+
+def test_reports_in_use_are_kept():
+    """Reports written or served within min_age survive the limits; so do the names passed as keep"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        write_report(tmp_dir, 'sales_report_a_20240101_000000.pdf', 40, age=7200)
+        write_report(tmp_dir, 'sales_report_b_20240101_000000.pdf', 40, age=7200)
+        write_report(tmp_dir, 'sales_report_c_20240101_000000.pdf', 40, age=7200)
+        manager = ReportRetentionManager(reports_dir=Path(tmp_dir), max_bytes=50, max_age=3600,
+                                         seller_max_bytes=50, min_age=600)
+        # A report job handed out b from the cache a moment ago
+        manager.touch('sales_report_b_20240101_000000.pdf')
+        removed = manager.enforce(keep=['sales_report_c_20240101_000000.pdf'])
+        assert removed == ['sales_report_a_20240101_000000.pdf']
+
+        write_report(tmp_dir, 'sales_report_d_20250101_000000.pdf', 40)
+        manager.register(Path(tmp_dir) / 'sales_report_d_20250101_000000.pdf')
+        assert sorted(os.listdir(tmp_dir)) == ['sales_report_b_20240101_000000.pdf',
+                                               'sales_report_d_20250101_000000.pdf']
+        print("✅ Report retention in-use test passed")
+
+if __name__ == "__main__":
+    test_parse_report_filename()
+    test_limits_evict_least_recently_downloaded()
+    test_reports_in_use_are_kept()
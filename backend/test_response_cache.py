@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test script for the chatbot response cache
+"""
+
+import services.response_cache as response_cache
+from services.response_cache import ResponseCache
+from services.chatbot import ChatbotService
+
+def test_entries_follow_data_version():
+    """A new data version purges old replies and triggers a rebuild"""
+    versions = ['v1']
+    rebuilt = []
+    original = response_cache.get_data_version
+    response_cache.get_data_version = lambda: versions[-1]
+    try:
+        cache = ResponseCache(max_entries=2, on_new_version=rebuilt.append)
+        version, response = cache.lookup('most_sold', 'en')
+        assert response is None
+        cache.store('most_sold', 'en', version, 'Top Performing Products')
+        assert cache.lookup('most_sold', 'en') == ('v1', 'Top Performing Products')
+
+        versions.append('v2')
+        assert cache.lookup('most_sold', 'en') == ('v2', None)
+        assert rebuilt == ['v2']
+        # Replies computed from the old data are not stored under the new version
+        cache.store('most_sold', 'en', 'v1', 'stale')
+        assert cache.stats()['entries'] == 0
+    finally:
+        response_cache.get_data_version = original
+    print("✅ Response cache versioning test passed")
+
+def test_chatbot_serves_repeats_from_cache():
+    """Repeated read-only questions skip the analysis, errors are not cached"""
+    chatbot = ChatbotService()
+    calls = []
+
+    def analyze_inventory():
+        calls.append(1)
+        if len(calls) == 1:
+            raise Exception("data not ready")
+        return {'dead_stock': []}
+
+    chatbot.inventory_pdf_generator.analyzer.analyze_inventory = analyze_inventory
+    assert 'data not ready' in chatbot.process_message('show dead stock')
+    first = chatbot.process_message('show dead stock')
+    second = chatbot.process_message('any unsold items?')
+    assert first == second and 'No Dead Stock' in first
+    assert len(calls) == 2
+    print("✅ Chatbot response cache test passed")
+
+if __name__ == "__main__":
+    test_entries_follow_data_version()
+    test_chatbot_serves_repeats_from_cache()
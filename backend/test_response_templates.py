@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Test script for the chatbot response template catalog
+"""
+
+from services.response_templates import ResponseTemplateCatalog, localize_digits
+
+class EchoTranslator:
+    """Offline stand-in that tags text and counts calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def translate(self, text, target, source='en'):
+        self.calls += 1
+        return f"[{target}] {text}"
+
+def test_templates_translated_once_with_localized_slots():
+    """Each template is translated once per language; numbers stay out of the translated text"""
+    translator = EchoTranslator()
+    catalog = ResponseTemplateCatalog(translator, templates={
+        'score': "Score: {score}/100 for {name} ({ratio:.2f})",
+    })
+    first = catalog.render('score', 'hi', score=85, name='Kurti 2', ratio=0.5)
+    second = catalog.render('score', 'hi', score=42, name='Saree', ratio=1.25)
+    assert first == "[hi] Score: ८५/१०० for Kurti 2 (०.५०)"
+    assert second == "[hi] Score: ४२/१०० for Saree (१.२५)"
+    assert translator.calls == 1
+    assert catalog.render('score', 'en', score=7, name='X', ratio=1) == "Score: 7/100 for X (1.00)"
+    print("✅ Response template test passed")
+
+def test_localize_digits():
+    assert localize_digits('Rs.1,250', 'bn') == 'Rs.১,২৫০'
+    assert localize_digits('42', 'ta') == '42'
+    print("✅ Digit localization test passed")
+
+if __name__ == "__main__":
+    test_templates_translated_once_with_localized_slots()
+    test_localize_digits()
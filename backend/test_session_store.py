@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for chatbot session state stores
+"""
+
+import os
+import tempfile
+import time
+from services.session_store import MemorySessionStore, SQLiteSessionStore
+from services.chatbot import ChatbotService
+
+def test_memory_store_lru_and_ttl():
+    store = MemorySessionStore(max_sessions=2, ttl_seconds=0.05)
+    store.set('a', {'product_name': 'Kurti'})
+    store.set('b', {'product_name': 'Saree'})
+    store.set('c', {'product_name': 'Hoodie'})
+    assert store.get('a') == {}
+    assert store.get('c') == {'product_name': 'Hoodie'}
+    time.sleep(0.06)
+    assert store.get('c') == {}
+    print("✅ Memory session store test passed")
+
+def test_sqlite_store_is_shared():
+    """Two store instances (as in two workers) see the same sessions"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'sessions.sqlite3')
+        worker_1 = SQLiteSessionStore(db_path=db_path, ttl_seconds=60)
+        worker_2 = SQLiteSessionStore(db_path=db_path, ttl_seconds=60)
+        worker_1.set('seller-1', {'product_category': 'Ethnicwear'})
+        assert worker_2.get('seller-1') == {'product_category': 'Ethnicwear'}
+        worker_2.delete('seller-1')
+        assert worker_1.get('seller-1') == {}
+        print("✅ SQLite session store test passed")
+
+def test_listing_flow_is_per_session():
+    """Concurrent listings no longer overwrite each other's product name"""
+    chatbot = ChatbotService(session_store=MemorySessionStore())
+    chatbot.process_message('Name: Silk Saree', session_id='seller-1')
+    chatbot.process_message('Name: Denim Jacket', session_id='seller-2')
+    chatbot.process_message('Category: Saree', session_id='seller-1')
+    reply = chatbot.process_message('Price: 999', session_id='seller-1')
+    assert '#silk_saree' in reply and '#denim_jacket' not in reply
+
+    # Clients without a session ID never share a listing
+    store = MemorySessionStore()
+    chatbot = ChatbotService(session_store=store)
+    chatbot.process_message('Name: Silk Saree')
+    reply = chatbot.process_message('Price: 999')
+    assert '#silk_saree' not in reply
+    assert store.get(None) == {} and not store._sessions
+    print("✅ Per-session listing flow test passed")
+
+if __name__ == "__main__":
+    test_memory_store_lru_and_ttl()
+    test_sqlite_store_is_shared()
+    test_listing_flow_is_per_session()
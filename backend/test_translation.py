@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Test script for the chatbot translation cache
+"""
+
+import json
+import os
+import tempfile
+import time
+from services.translation import (
+    CircuitBreaker, PhraseTableBackend, TranslationCache, TranslationUnavailable,
+    Translator, TranslatorBackend
+)
+
+def test_memory_lru_and_disk_tier():
+    """Entries evicted from memory are still served from disk, also after a restart"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'translations.sqlite3')
+        cache = TranslationCache(max_entries=2, db_path=db_path)
+        assert cache.get('Dead Stock', 'en', 'hi') is None
+        cache.set('Dead Stock', 'en', 'hi', 'डेड स्टॉक')
+        cache.set('Low stock', 'en', 'hi', 'कम स्टॉक')
+        cache.set('Advice', 'en', 'hi', 'सलाह')
+        assert len(cache._memory) == 2
+        assert cache.get('Dead Stock', 'en', 'hi') == 'डेड स्टॉक'
+        stats = cache.stats()
+        assert stats['hits'] == 1 and stats['disk_hits'] == 1 and stats['misses'] == 1
+
+        restarted = TranslationCache(max_entries=2, db_path=db_path)
+        assert restarted.get('Advice', 'en', 'hi') == 'सलाह'
+        assert restarted.get('Advice', 'en', 'bn') is None
+        print("✅ Translation cache test passed")
+
+def test_disk_errors_are_cache_misses():
+    """An unreadable cache file costs a miss instead of failing the translation"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, 'translations.sqlite3')
+        with open(db_path, 'wb') as f:
+            f.write(b'not a database' * 100)
+        cache = TranslationCache(max_entries=2, db_path=db_path)
+        assert cache.get('Dead Stock', 'en', 'hi') is None
+        cache.set('Dead Stock', 'en', 'hi', 'डेड स्टॉक')
+        assert cache.get('Dead Stock', 'en', 'hi') == 'डेड स्टॉक'
+        assert TranslationCache(db_path=tmp_dir).get('Dead Stock', 'en', 'hi') is None
+    print("✅ Translation cache disk error test passed")
+
+class CountingTranslator(Translator):
+    """Offline translator that records every remote request"""
+
+    def __init__(self, keep_delimiter=True):
+        super().__init__(cache=TranslationCache(db_path=''))
+        self.keep_delimiter = keep_delimiter
+        self.requests = []
+
+    def _remote_translate(self, text, target, source):
+        self.requests.append(text)
+        translated = text.upper()
+        return translated if self.keep_delimiter else translated.replace('§§', '')
+
+def test_batch_translation_single_round_trip():
+    """All lines go out in one request and come back in order"""
+    translator = CountingTranslator()
+    lines = ['Bundle shirts', 'Discount kurtis', '', 'Bundle shirts']
+    assert translator.translate_batch(lines, 'hi') == ['BUNDLE SHIRTS', 'DISCOUNT KURTIS', '', 'BUNDLE SHIRTS']
+    assert len(translator.requests) == 1
+    assert translator.translate_batch(lines[:2], 'hi') == ['BUNDLE SHIRTS', 'DISCOUNT KURTIS']
+    assert len(translator.requests) == 1
+    print("✅ Batch translation test passed")
+
+def test_batch_translation_falls_back_to_per_line():
+    """A reply that cannot be split is retried line by line"""
+    translator = CountingTranslator(keep_delimiter=False)
+    assert translator.translate_batch(['one', 'two'], 'hi') == ['ONE', 'TWO']
+    assert len(translator.requests) == 3
+    print("✅ Batch translation fallback test passed")
+
+class SlowBackend(TranslatorBackend):
+    name = 'slow'
+    remote = True
+
+    def translate(self, text, target, source='en'):
+        time.sleep(0.2)
+        return text
+
+def test_timeout_opens_circuit():
+    """Slow calls time out and the breaker then fails fast"""
+    translator = Translator(
+        cache=TranslationCache(db_path=''), backend=SlowBackend(), timeout=0.01,
+        breaker=CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    )
+    for text in ('one', 'two'):
+        try:
+            translator.translate(text, 'hi')
+            assert False, "expected a timeout"
+        except TranslationUnavailable:
+            pass
+    assert translator.stats()['circuit'] == 'open'
+    started = time.monotonic()
+    try:
+        translator.translate('three', 'hi')
+        assert False, "expected an open circuit"
+    except TranslationUnavailable:
+        pass
+    assert time.monotonic() - started < 0.05
+    assert translator.stats()['timeouts'] == 2
+    print("✅ Translator circuit breaker test passed")
+
+def test_phrase_table_backend():
+    """The offline backend translates known lines and passes others through"""
+    translator = Translator(
+        cache=TranslationCache(db_path=''),
+        backend=PhraseTableBackend(phrases={'hi': {'Dead Stock': 'डेड स्टॉक'}})
+    )
+    assert translator.translate('Dead Stock\nKurti', 'hi') == 'डेड स्टॉक\nKurti'
+    assert translator.stats()['remote_calls'] == 0
+
+    # String paths are accepted, and a missing table leaves lines untranslated
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, 'phrases.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'bn': {'Dead Stock': 'ডেড স্টক'}}, f, ensure_ascii=False)
+        assert PhraseTableBackend(path=path).translate('Dead Stock', 'bn') == 'ডেড স্টক'
+        assert PhraseTableBackend(path=os.path.join(tmp_dir, 'missing.json')).translate('Dead Stock', 'bn') == 'Dead Stock'
+    print("✅ Phrase table backend test passed")
+
+if __name__ == "__main__":
+    test_memory_lru_and_disk_tier()
+    test_disk_errors_are_cache_misses()
+    test_batch_translation_single_round_trip()
+    test_batch_translation_falls_back_to_per_line()
+    test_timeout_opens_circuit()
+    test_phrase_table_backend()
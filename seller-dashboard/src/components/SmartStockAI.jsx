@@ -6,7 +6,7 @@ import Link from 'next/link';
 import { motion, AnimatePresence } from 'framer-motion';
 import { Home, Package, Undo2, Megaphone, CreditCard, Boxes, Upload, Percent, Image, Bot, ArrowLeft, UserCircle, X } from 'lucide-react';
 import { useTranslation } from 'react-i18next';
-import { apiPost } from '../api';
+import { apiGet, apiPost } from '../api';
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:5000/api';
 const BACKEND_BASE = process.env.NEXT_PUBLIC_API_URL ? process.env.NEXT_PUBLIC_API_URL.replace(/\/api$/, '') : 'http://localhost:5000';
@@ -87,6 +87,13 @@ const SmartStockAI = ({ open, onClose }) => {
   const [inputValue, setInputValue] = useState('');
   const [fileValue, setFileValue] = useState(null);
   const fileInputRef = useRef(null);
+  // Keeps multi-step flows (product listing) separate per chat window
+  const sessionIdRef = useRef(null);
+  if (sessionIdRef.current === null) {
+    sessionIdRef.current = typeof crypto !== 'undefined' && crypto.randomUUID
+      ? crypto.randomUUID()
+      : `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+  }
   const [listingDone, setListingDone] = useState(false);
 
   // Helper to determine the current product listing step based on the last non-empty response
@@ -131,20 +138,43 @@ const SmartStockAI = ({ open, onClose }) => {
 
   if (!open) return null;
 
+  // Reports are rendered in the background; poll the job until the PDF is ready
+  const waitForReport = async (jobId) => {
+    for (let attempt = 0; attempt < 80; attempt++) {
+      const job = await apiGet(`/api/chatbot/jobs/${jobId}`);
+      if (job.status === 'done') return job.pdf_url;
+      if (job.status === 'failed') return null;
+      await new Promise((resolve) => setTimeout(resolve, 1500));
+    }
+    return null;
+  };
+
+  const attachReportWhenReady = (jobId) => {
+    if (!jobId) return;
+    waitForReport(jobId)
+      .then((pdfUrl) => {
+        if (!pdfUrl) return;
+        setChat((prev) => prev.map((entry) => (entry.jobId === jobId ? { ...entry, pdfUrl } : entry)));
+      })
+      .catch(() => {});
+  };
+
   const handlePromptClick = async (promptObj) => {
     setLoading(true);
     setChat((prev) => [...prev, { prompt: promptObj.label, response: null, pdfUrl: null }]);
     try {
-      const data = await apiPost('/api/chatbot/query', { message: promptObj.value, lang: i18n.language });
+      const data = await apiPost('/api/chatbot/query', { message: promptObj.value, lang: i18n.language, session_id: sessionIdRef.current });
       setChat((prev) => {
         const updated = [...prev];
         updated[updated.length - 1] = {
           prompt: promptObj.label,
           response: data.response || 'No response',
           pdfUrl: data.pdf_url || null,
+          jobId: data.job_id || null,
         };
         return updated;
       });
+      attachReportWhenReady(data.job_id);
     } catch (err) {
       setChat((prev) => {
         const updated = [...prev];
@@ -183,16 +213,18 @@ const SmartStockAI = ({ open, onClose }) => {
     setLoading(true);
     setChat((prev) => [...prev, { prompt: '', response: null, pdfUrl: null }]);
     try {
-      const data = await apiPost('/api/chatbot/query', { message, lang: i18n.language });
+      const data = await apiPost('/api/chatbot/query', { message, lang: i18n.language, session_id: sessionIdRef.current });
       setChat((prev) => {
         const updated = [...prev];
         updated[updated.length - 1] = {
           prompt: '',
           response: data.response || 'No response',
           pdfUrl: data.pdf_url || null,
+          jobId: data.job_id || null,
         };
         return updated;
       });
+      attachReportWhenReady(data.job_id);
     } catch (err) {
       setChat((prev) => {
         const updated = [...prev];